@@ -1,24 +1,29 @@
 """Main module for the application."""
 
 from contextlib import suppress
+from pathlib import Path
 
 with suppress(ImportError):
     import readline  # noqa: F401 `readline` imported but unused
 
+from .command.clean_progress import clean_progress
 from .command.configure import configure
+from .command.export_progress import export_answers, export_progress
 from .command.practice import practice
 from .command.self import Self
 from .command.show_progress import show_progress
 from .metadata import BUILT_IN_CONCEPT_JSON_FILES, latest_version
 from .model.filter import filter_concepts
 from .model.language import LanguagePair
+from .model.language.concept import Concept
 from .model.quiz.progress import Progress
-from .model.quiz.quiz_factory import create_quizzes
-from .model.quiz.quiz_type import QUIZ_TYPES
+from .model.quiz.quiz import Quizzes
+from .model.quiz.quiz_type import QUIZ_TYPES, QuizType
 from .persistence.concept_loader import ConceptLoader
 from .persistence.config import default_config, read_config
-from .persistence.progress import load_progress
-from .persistence.spelling_alternatives import load_spelling_alternatives
+from .persistence.progress import load_progress, load_sorted_keys
+from .persistence.quiz_catalogue import load_quiz_keys, load_quiz_keys_and_source, load_quiz_source
+from .persistence.spelling_alternatives import load_generated_spelling_alternatives, load_spelling_alternatives
 from .ui.cli import create_argument_parser, parse_arguments
 from .ui.text import show_welcome
 
@@ -37,13 +42,39 @@ class CLI:
     @property
     def progress(self) -> Progress:
         """Return the current progress."""
-        load_spelling_alternatives(self.language_pair)
         target_language = self.args.target_language
+        if self.args.command == "progress" and (self.args.orphans or self.args.export):
+            # Cleaning and exporting progress need all progress, but no quizzes:
+            return load_progress(target_language, Quizzes(), self.argument_parser, self.config)
+        quiz_types, concepts, concept_files = self.quiz_selection
+        if self.args.command != "progress":  # Practicing needs quizzes of the concepts the user practices next only
+            quiz_source = load_quiz_source(self.language_pair, quiz_types, concepts, *concept_files)
+            return load_progress(target_language, quiz_source, self.argument_parser, self.config)
+        # Showing progress needs the progress of the selected quizzes only. The quizzes are rebuilt when shown:
+        keys, quiz_source = load_quiz_keys_and_source(self.language_pair, quiz_types, concepts, *concept_files)
+        return load_progress(target_language, quiz_source, self.argument_parser, self.config, keys)
+
+    @property
+    def quiz_keys(self) -> set[str]:
+        """Return the keys of the quizzes, without rebuilding the quizzes if the quiz catalogue is cached."""
+        quiz_types, concepts, concept_files = self.quiz_selection
+        return load_quiz_keys(self.language_pair, quiz_types, concepts, *concept_files)
+
+    @property
+    def quiz_selection(self) -> tuple[tuple[QuizType, ...], set[Concept], tuple[Path, ...]]:
+        """Return the quiz types and the concepts selected by the user, and the concept files.
+
+        Also load the spelling alternatives, as these are needed to create the quizzes.
+        """
+        load_spelling_alternatives(self.language_pair)
         concepts = self.build_in_concepts | self.loader.load_concepts(*self.args.extra)
-        filtered_concepts = filter_concepts(concepts, self.args.concepts, target_language, self.argument_parser)
+        concept_files = (*BUILT_IN_CONCEPT_JSON_FILES, *self.args.extra)
+        load_generated_spelling_alternatives(self.language_pair, *concept_files)
+        filtered_concepts = filter_concepts(
+            concepts, self.args.concepts, self.args.target_language, self.argument_parser
+        )
         quiz_types = tuple(quiz_type for quiz_type in QUIZ_TYPES if quiz_type.action in self.args.quiz_type)
-        quizzes = create_quizzes(self.language_pair, quiz_types, *filtered_concepts)
-        return load_progress(target_language, quizzes, self.argument_parser, self.config)
+        return quiz_types, filtered_concepts, concept_files
 
     @property
     def language_pair(self) -> LanguagePair:
@@ -57,8 +88,16 @@ def main() -> None:
     match cli.args.command:
         case "configure":
             configure(cli.argument_parser, cli.config, cli.args)
+        case "progress" if cli.args.export == "answers":  # Exporting answers does not need the progress
+            export_answers(cli.args.target_language, cli.config, cli.args)
         case "progress":
-            show_progress(cli.progress, cli.args)
+            progress = cli.progress  # Load the progress first, this imports the progress file into a new database
+            if cli.args.orphans:
+                clean_progress(progress, cli.language_pair, cli.quiz_keys, cli.config, cli.args)
+            elif cli.args.export:
+                export_progress(progress, cli.args)
+            else:
+                show_progress(progress, cli.args, load_sorted_keys(progress, cli.config, cli.args.sort))
         case "self":
             self = Self(cli.argument_parser)
             match cli.args.self:
@@ -0,0 +1,42 @@
+"""Command to clean progress information."""
+
+from argparse import Namespace
+from collections.abc import Collection
+from configparser import ConfigParser
+
+from rich.table import Table
+
+from toisto.model.language import LanguagePair
+from toisto.model.language.iana_language_subtag_registry import ALL_LANGUAGES
+from toisto.model.quiz.progress import Progress
+from toisto.model.quiz.retention import Retention
+from toisto.persistence.progress import archive_progress, remove_progress
+from toisto.ui.format import format_duration
+from toisto.ui.text import console
+
+
+def clean_progress(
+    progress: Progress, language_pair: LanguagePair, quiz_keys: Collection[str], config: ConfigParser, args: Namespace
+) -> None:
+    """Show, remove, or archive the progress on quizzes that Toisto does not generate anymore.
+
+    The quiz keys are the keys of the quizzes that Toisto does generate.
+    """
+    orphans = progress.orphans(language_pair, quiz_keys)
+    if not orphans:
+        console.print(f"No orphaned progress {ALL_LANGUAGES[language_pair.target]}.")
+        return
+    table = Table(title=f"Orphaned progress {ALL_LANGUAGES[language_pair.target]}")
+    table.add_column("Quiz")
+    table.add_column("Attempts", justify="right")
+    table.add_column("Retention")
+    for key, retention_dict in orphans.items():
+        retention = Retention.from_dict(retention_dict)
+        table.add_row(key, str(retention.count), format_duration(retention.length) if retention.length else "")
+    console.print(table)
+    if args.orphans == "archive":
+        archive_filepath = archive_progress(orphans, language_pair.target, config)
+        console.print(f"Archived the progress on {len(orphans)} orphaned quizzes in {archive_filepath}.")
+    if args.orphans in ("remove", "archive"):
+        remove_progress(progress, orphans.keys(), config)
+        console.print(f"Removed the progress on {len(orphans)} orphaned quizzes.")
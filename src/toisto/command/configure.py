@@ -2,6 +2,7 @@
 
 from argparse import ArgumentParser, Namespace
 from configparser import ConfigParser
+from typing import Final
 
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -10,6 +11,16 @@ from toisto.persistence.config import CONFIG_FILENAME, write_config
 from toisto.tools import first
 from toisto.ui.text import console
 
+# The arguments that are saved as option in the config file, and the section and name of the option:
+OPTIONS: Final = {
+    "progress_folder": ("progress", "folder"),
+    "progress_backend": ("progress", "backend"),
+    "answer_log": ("progress", "answer_log"),
+    "progress_update": ("practice", "progress_update"),
+    "show_quiz_retention": ("practice", "show_quiz_retention"),
+    "mp3player": ("commands", "mp3player"),
+}
+
 
 def configure(argument_parser: ArgumentParser, config: ConfigParser, args: Namespace) -> None:
     """Configure the options."""
@@ -17,18 +28,10 @@ def configure(argument_parser: ArgumentParser, config: ConfigParser, args: Names
         if language in args and getattr(args, language):
             ensure_section(config, "languages")
             config.set("languages", first(language.split("_")), getattr(args, language))
-    if "progress_folder" in args:
-        ensure_section(config, "progress")
-        config.set("progress", "folder", str(args.progress_folder))
-    if "progress_update" in args:
-        ensure_section(config, "practice")
-        config.set("practice", "progress_update", str(args.progress_update))
-    if "show_quiz_retention" in args:
-        ensure_section(config, "practice")
-        config.set("practice", "show_quiz_retention", args.show_quiz_retention)
-    if "mp3player" in args:
-        ensure_section(config, "commands")
-        config.set("commands", "mp3player", args.mp3player)
+    for argument, (section, option) in OPTIONS.items():
+        if argument in args:
+            ensure_section(config, section)
+            config.set(section, option, str(getattr(args, argument)))
     if "extra" in args and args.extra:
         ensure_section(config, "files")
         for path in args.extra:
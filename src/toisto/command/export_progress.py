@@ -0,0 +1,38 @@
+"""Command to export progress information."""
+
+import csv
+import json
+import sys
+from argparse import Namespace
+from collections.abc import Iterable, Mapping, Sequence
+from configparser import ConfigParser
+from typing import Final
+
+from toisto.model.language import Language
+from toisto.model.quiz.progress import Progress
+from toisto.persistence.progress import load_answers
+
+ANSWER_COLUMNS: Final = ("quiz", "evaluation", "attempt", "latency", "timestamp")
+PROGRESS_COLUMNS: Final = ("quiz", "count", "start", "end", "skip_until")
+
+
+def export_answers(target_language: Language, config: ConfigParser, args: Namespace) -> None:
+    """Export the answers in the answer log, reading and writing one answer at a time."""
+    write_rows(load_answers(target_language, config), ANSWER_COLUMNS, args.format)
+
+
+def export_progress(progress: Progress, args: Namespace) -> None:
+    """Export the progress of all quizzes."""
+    rows = ({"quiz": key, **retention_dict} for key, retention_dict in progress.as_dict().items())
+    write_rows(rows, PROGRESS_COLUMNS, args.format)
+
+
+def write_rows(rows: Iterable[Mapping[str, object]], columns: Sequence[str], export_format: str) -> None:
+    """Write the rows to standard output one at a time, either as CSV with a header or as JSON lines."""
+    if export_format == "csv":
+        writer = csv.DictWriter(sys.stdout, columns, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        for row in rows:
+            sys.stdout.write(json.dumps(row) + "\n")
@@ -3,6 +3,8 @@
 from argparse import Namespace
 from configparser import ConfigParser
 from dataclasses import dataclass
+from threading import Thread
+from time import perf_counter
 from typing import Final
 
 import dramatic
@@ -15,7 +17,8 @@ from toisto.model.quiz.evaluation import Evaluation
 from toisto.model.quiz.progress import Progress
 from toisto.model.quiz.quiz import Quiz
 from toisto.model.quiz.quiz_type import ListenOnlyQuizType
-from toisto.persistence.progress import save_progress
+from toisto.persistence.answer_log import AnswerLog
+from toisto.persistence.progress import ProgressWriter, create_answer_log
 from toisto.ui.dictionary import linkified
 from toisto.ui.speech import Speech
 from toisto.ui.text import CONTINUE, DONE, Feedback, ProgressUpdate, console, instruction
@@ -24,6 +27,8 @@ from toisto.ui.text import CONTINUE, DONE, Feedback, ProgressUpdate, console, in
 # line, 1 = start of line to cursor, 2 = whole line).
 ERASE_ENTIRE_LINE: Final = 2
 
+MAX_ATTEMPTS: Final = 2  # Number of attempts the user gets to answer a quiz
+
 
 @dataclass(frozen=True)
 class QuizMaster:
@@ -33,6 +38,7 @@ class QuizMaster:
     progress: Progress
     speech: Speech
     show_quiz_retention: bool
+    answer_log: AnswerLog | None = None
 
     def do_quiz(self, quiz: Quiz) -> None:
         """Do one quiz and update the progress."""
@@ -40,10 +46,17 @@ class QuizMaster:
         console.print(instruction(quiz))
         if not quiz.has_quiz_type(ListenOnlyQuizType):
             console.print(linkified(str(quiz.question)))
-        for attempt in range(1, 3):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            start = perf_counter()
             guess = self.do_quiz_attempt(quiz, attempt)
+            latency = perf_counter() - start
             evaluation = quiz.evaluate(guess, self.language_pair.source, attempt)
             retention = self.progress.mark_evaluation(quiz, evaluation)
+            if self.answer_log:
+                self.answer_log.log(quiz.key, evaluation, attempt, latency)
+            if evaluation in (Evaluation.CORRECT, Evaluation.SKIPPED) or attempt == MAX_ATTEMPTS:
+                # This was the last attempt, so determine the next quiz while the user reads the feedback:
+                Thread(target=self.progress.look_ahead, daemon=True).start()
             console.print(feedback.text(evaluation, guess, retention if self.show_quiz_retention else None))
             if evaluation in (Evaluation.SKIPPED, Evaluation.INCORRECT):
                 self.say_answer(quiz, feedback.shown_answers(guess))
@@ -80,14 +93,18 @@ def practice(language_pair: LanguagePair, progress: Progress, config: ConfigPars
     """Practice a language."""
     progress_update = ProgressUpdate(progress, args.progress_update)
     speech = Speech(config)
-    quiz_master = QuizMaster(language_pair, progress, speech, args.show_quiz_retention == "yes")
+    answer_log = create_answer_log(language_pair.target, config)
+    quiz_master = QuizMaster(language_pair, progress, speech, args.show_quiz_retention == "yes", answer_log)
+    progress_writer = ProgressWriter(progress, config, answer_log)
     try:
         while quiz := progress.next_quiz():
             quiz_master.do_quiz(quiz)
-            save_progress(progress, config)
+            progress_writer.save()
             with dramatic.output.at_speed(120):
                 # Turn off highlighting to work around https://github.com/treyhunner/dramatic/issues/8:
                 console.print(progress_update(), end="", highlight=False)
         console.print(DONE)
     except (KeyboardInterrupt, EOFError):
         console.print()  # Make sure the shell prompt is displayed on a new line
+    finally:
+        progress_writer.close()
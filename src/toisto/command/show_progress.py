@@ -1,6 +1,7 @@
 """Command to show progress information."""
 
 from argparse import Namespace
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Literal
@@ -30,13 +31,22 @@ class QuizSorter:
         return retention.count if self.sort == "attempts" else retention.length
 
 
-def show_progress(progress: Progress, args: Namespace) -> None:
-    """Show progress."""
+def show_progress(progress: Progress, args: Namespace, sorted_keys: Sequence[str] | None = None) -> None:
+    """Show progress.
+
+    If the keys of the quizzes in progress are passed, sorted by the database, show the quizzes in that order, followed
+    by the quizzes without progress.
+    """
     table = Table(title=f"Progress {ALL_LANGUAGES[progress.target_language]}")
     justify: dict[str, JustifyMethod] = {"Attempts": "right"}
     for column in ("Quiz type", "Question", "From", "To", "Answer(s)", "Attempts", "Retention", "Not quizzed until"):
         table.add_column(column, justify=justify.get(column, "left"))
-    sorted_quizzes = sorted(progress.quizzes, key=QuizSorter(progress, args.sort).get_sort_key, reverse=True)
+    if sorted_keys is None:
+        sorted_quizzes = sorted(progress.quizzes, key=QuizSorter(progress, args.sort).get_sort_key, reverse=True)
+    else:
+        quizzes_by_key = {quiz.key: quiz for quiz in progress.quizzes}
+        sorted_quizzes = [quizzes_by_key.pop(key) for key in sorted_keys if key in quizzes_by_key]
+        sorted_quizzes.extend(quizzes_by_key.values())
     for quiz in sorted_quizzes:
         retention = progress.get_retention(quiz)
         skip = retention.skip_until
@@ -1,6 +1,8 @@
 """Text matching."""
 
+import re
 import string
+from functools import cache
 
 # Translation table to remove punctuation from strings, except apostrophes and hyphens.
 WITHOUT_PUNCTUATION = str.maketrans("", "", string.punctuation)
@@ -16,3 +18,14 @@ def match(text1: str, *texts: str, case_sensitive: bool = True) -> bool:
     return any(
         text1.strip().translate(WITHOUT_PUNCTUATION) == text2.strip().translate(WITHOUT_PUNCTUATION) for text2 in texts
     )
+
+
+@cache
+def whole_word_pattern(words: str) -> re.Pattern[str]:
+    """Return the compiled pattern that matches the words as whole words, ignoring case."""
+    return re.compile(rf"\b{re.escape(words)}\b", re.IGNORECASE)
+
+
+def contains_whole_words(text: str, words: str) -> bool:
+    """Return whether the text contains the words as whole words, ignoring case."""
+    return bool(whole_word_pattern(words).search(text))
@@ -105,6 +105,11 @@ class Concept:
         self.cache[relation] = related_concepts = Concepts(related_concepts_list)
         return related_concepts
 
+    @property
+    def all_labels(self) -> Labels:
+        """Return all labels of the concept, in all languages, including the meaning-only labels."""
+        return self._labels
+
     def labels(self, language: Language) -> Labels:
         """Return the labels of the concept for the specified language."""
         return self._labels.with_language(language).not_meaning_only
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Literal, cast
+from collections.abc import Iterable
+from functools import cache
+from typing import Literal, cast, get_args
+
+from toisto.tools import Identities
 
 GrammaticalAspect = Literal["imperfective", "perfective"]
 GrammaticalCase = Literal["nominative", "partitive"]
@@ -44,3 +48,27 @@ DEFAULT_CATEGORIES: frozenset[GrammaticalCategory] = cast(
 SEMANTIC_NON_DEFAULT_CATEGORIES: frozenset[GrammaticalCategory] = cast(
     "frozenset[GrammaticalCategory]", frozenset({"partitive"})
 )
+
+# Registry of the grammatical categories and their bits in grammatical category bitmasks. The registry assigns a new
+# bit to categories that are not in the GrammaticalCategory type, if any.
+GRAMMATICAL_CATEGORY_BITS = Identities[GrammaticalCategory]()
+for _category in get_args(GrammaticalCategory):
+    GRAMMATICAL_CATEGORY_BITS.identity(_category)
+
+
+def grammatical_categories_mask(grammatical_categories: Iterable[GrammaticalCategory]) -> int:
+    """Return the grammatical categories encoded as bitmask."""
+    mask = 0
+    for grammatical_category in grammatical_categories:
+        mask |= 1 << GRAMMATICAL_CATEGORY_BITS.identity(grammatical_category)
+    return mask
+
+
+@cache
+def grammatical_categories_from_mask(mask: int) -> frozenset[GrammaticalCategory]:
+    """Return the grammatical categories encoded in the bitmask."""
+    return frozenset(GRAMMATICAL_CATEGORY_BITS.key(bit) for bit in range(mask.bit_length()) if mask & (1 << bit))
+
+
+DEFAULT_CATEGORIES_MASK = grammatical_categories_mask(DEFAULT_CATEGORIES)
+SEMANTIC_NON_DEFAULT_CATEGORIES_MASK = grammatical_categories_mask(SEMANTIC_NON_DEFAULT_CATEGORIES)
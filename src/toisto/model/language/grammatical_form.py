@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from .grammatical_category import GrammaticalCategory
+from .grammatical_category import GrammaticalCategory, grammatical_categories_from_mask, grammatical_categories_mask
 
 if TYPE_CHECKING:
     from .label import Label
@@ -16,6 +16,7 @@ class GrammaticalForm:  # noqa: PLW1641
     def __init__(self, grammatical_base: str = "", /, *grammatical_categories: GrammaticalCategory) -> None:
         self.grammatical_base = grammatical_base  # Base form of a label, for example "table" is the base of "tables"
         self.grammatical_categories: frozenset[GrammaticalCategory] = frozenset(grammatical_categories)
+        self.grammatical_categories_mask = grammatical_categories_mask(self.grammatical_categories)
         self.other_grammatical_categories: dict[GrammaticalCategory, Label] = {}
 
     def __eq__(self, other: object) -> bool:
@@ -23,10 +24,14 @@ class GrammaticalForm:  # noqa: PLW1641
         if isinstance(other, GrammaticalForm):
             return (
                 self.grammatical_base == other.grammatical_base
-                and self.grammatical_categories == other.grammatical_categories
+                and self.grammatical_categories_mask == other.grammatical_categories_mask
             )
         return False
 
     def grammatical_differences(self, other: GrammaticalForm) -> frozenset[GrammaticalCategory]:
         """Return the grammatical differences between this grammatical form and the other form."""
-        return other.grammatical_categories.difference(self.grammatical_categories)
+        return grammatical_categories_from_mask(self.grammatical_differences_mask(other))
+
+    def grammatical_differences_mask(self, other: GrammaticalForm) -> int:
+        """Return the grammatical differences between this grammatical form and the other form as bitmask."""
+        return other.grammatical_categories_mask & ~self.grammatical_categories_mask
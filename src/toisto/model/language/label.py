@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import re
 from collections.abc import Iterable, Iterator
 from difflib import SequenceMatcher
@@ -10,14 +11,20 @@ from itertools import chain
 from random import shuffle
 from typing import ClassVar
 
-from toisto.match import match
+from toisto.match import contains_whole_words, match
 from toisto.tools import first, first_upper, unique
 
 from . import Language
-from .grammatical_category import DEFAULT_CATEGORIES, SEMANTIC_NON_DEFAULT_CATEGORIES, GrammaticalCategory
+from .grammatical_category import (
+    DEFAULT_CATEGORIES_MASK,
+    SEMANTIC_NON_DEFAULT_CATEGORIES_MASK,
+    GrammaticalCategory,
+    grammatical_categories_from_mask,
+)
 from .grammatical_form import GrammaticalForm
 
 SpellingAlternatives = dict[Language, dict[re.Pattern[str], str]]
+GeneratedSpellingAlternatives = dict[Language, dict[str, list[str]]]
 HomonymMapping = dict[tuple[Language, str], list["Label"]]
 
 
@@ -32,6 +39,7 @@ class Label:
 
     END_OF_SENTENCE_PUNCTUATION = "?!."
     ALTERNATIVES_TO_GENERATE: ClassVar[SpellingAlternatives] = {}  # These are loaded upon start of the application
+    GENERATED_ALTERNATIVES: ClassVar[GeneratedSpellingAlternatives] = {}  # Cached results of ALTERNATIVES_TO_GENERATE
 
     homograph_mapping: ClassVar[HomonymMapping] = {}
     capitonym_mapping: ClassVar[HomonymMapping] = {}
@@ -120,16 +128,25 @@ class Label:
     @cached_property
     def generated_spelling_alternatives(self) -> Labels:
         """Generate additional spelling alternatives."""
-        generated_alternatives = set()
+        generated_alternatives: set[Label] = set()
         for alternative in self.non_generated_spelling_alternatives:
-            for pattern, replacement in self.ALTERNATIVES_TO_GENERATE.get(self.language, {}).items():
-                if re.search(pattern, str(alternative)):
-                    value = re.sub(pattern, replacement, str(alternative))
-                    if alternative.starts_with_upper_case:
-                        value = first_upper(value)
-                    generated_alternatives.add(self.copy(value))
+            values = self.generate_spelling_alternatives(self.language, str(alternative))
+            generated_alternatives.update(self.copy(value) for value in values)
         return Labels(generated_alternatives)
 
+    @classmethod
+    def generate_spelling_alternatives(cls, language: Language, value: str) -> list[str]:
+        """Generate additional spelling alternatives for the value, unless they have been generated before."""
+        generated_alternatives = cls.GENERATED_ALTERNATIVES.get(language, {})
+        if value in generated_alternatives:
+            return generated_alternatives[value]
+        values = []
+        for pattern, replacement in cls.ALTERNATIVES_TO_GENERATE.get(language, {}).items():
+            if re.search(pattern, value):
+                generated_value = re.sub(pattern, replacement, value)
+                values.append(first_upper(generated_value) if value[0].isupper() else generated_value)
+        return values
+
     @property
     def spelling_alternatives(self) -> Labels:
         """Extract the spelling alternatives from the label and generate additional spelling alternatives."""
@@ -205,8 +222,8 @@ class Label:
 
     def has_same_grammatical_form(self, other: Label) -> bool:
         """Return whether this label has the same grammatical form as the other label."""
-        self_grammatical_categories = self.grammatical_form.grammatical_categories - DEFAULT_CATEGORIES
-        other_grammatical_categories = other.grammatical_form.grammatical_categories - DEFAULT_CATEGORIES
+        self_grammatical_categories = self.grammatical_form.grammatical_categories_mask & ~DEFAULT_CATEGORIES_MASK
+        other_grammatical_categories = other.grammatical_form.grammatical_categories_mask & ~DEFAULT_CATEGORIES_MASK
         return (
             self_grammatical_categories == other_grammatical_categories
             or (not self_grammatical_categories and other.is_grammatical_base)
@@ -224,22 +241,19 @@ class Label:
         that the unmarked form in another language does not carry. If one label has such a category and the
         other lacks it, they are not compatible.
         """
-        my_categories = self.grammatical_form.grammatical_categories
-        other_categories = other.grammatical_form.grammatical_categories
-        if (my_categories ^ other_categories) & SEMANTIC_NON_DEFAULT_CATEGORIES:
+        my_categories = self.grammatical_form.grammatical_categories_mask
+        other_categories = other.grammatical_form.grammatical_categories_mask
+        if (my_categories ^ other_categories) & SEMANTIC_NON_DEFAULT_CATEGORIES_MASK:
             return False
-        return my_categories <= other_categories or my_categories >= other_categories
-
-    def has_same_grammatical_base(self, other: Label) -> bool:
-        """Return whether this label has the same grammatical base as the other label."""
-        return self.grammatical_form.grammatical_base == other.grammatical_form.grammatical_base
+        common_categories = my_categories & other_categories
+        return common_categories in (my_categories, other_categories)
 
     def grammatical_differences(self, *labels: Label) -> frozenset[GrammaticalCategory]:
         """Return the grammatical differences between this label and the other labels."""
-        differences: set[GrammaticalCategory] = set()
+        differences = 0
         for label in labels:
-            differences |= label.grammatical_form.grammatical_differences(self.grammatical_form)
-        return frozenset(differences)
+            differences |= label.grammatical_form.grammatical_differences_mask(self.grammatical_form)
+        return grammatical_categories_from_mask(differences)
 
     def is_homograph(self, other: Label) -> bool:
         """Return whether this label and the other label are homographs."""
@@ -247,8 +261,7 @@ class Label:
 
     def contains(self, other: Label) -> bool:
         """Return whether this label's text mentions the other label as a whole word."""
-        pattern = re.compile(rf"\b{re.escape(str(other))}\b", re.IGNORECASE)
-        return bool(pattern.search(str(self)))
+        return contains_whole_words(str(self), str(other))
 
     @property
     def homographs(self) -> Labels:
@@ -273,12 +286,46 @@ class Label:
         """Return the grammatical categories that distinguish this label from sibling forms of the same base."""
         return self.grammatical_form.other_grammatical_categories
 
-    def register_other_grammatical_categories(self, labels: Labels) -> None:
-        """Register the other grammatical forms of this label."""
-        for label in labels.with_language(self.language).with_same_grammatical_base(self):
-            grammatical_differences = label.grammatical_differences(self)
-            if len(grammatical_differences) == 1:
-                self.grammatical_form.other_grammatical_categories[first(grammatical_differences)] = label
+    def register_other_grammatical_categories(self, siblings: Iterable[Label]) -> None:
+        """Register the other grammatical forms of this label, given the siblings that differ in one category."""
+        for sibling in siblings:
+            self.grammatical_form.other_grammatical_categories[first(sibling.grammatical_differences(self))] = sibling
+
+
+class GrammaticalSiblings:
+    """Index of labels by language and grammatical base, and then by grammatical categories bitmask.
+
+    Labels with the same language and grammatical base are siblings. The index allows for enumerating the siblings of
+    a label, and the siblings that differ in one grammatical category, without comparing all pairs of labels.
+    """
+
+    def __init__(self, labels: Iterable[Label]) -> None:
+        # Labels are stored with their position so siblings can be returned in the order of the labels
+        self.__index: dict[tuple[Language, str], dict[int, list[tuple[int, Label]]]] = {}
+        for position, label in enumerate(labels):
+            siblings = self.__index.setdefault((label.language, label.grammatical_form.grammatical_base), {})
+            siblings.setdefault(label.grammatical_form.grammatical_categories_mask, []).append((position, label))
+
+    def siblings(self, label: Label) -> Iterator[Label]:
+        """Return the labels with the same language and grammatical base as the label, including the label itself."""
+        return self.__merge(self.__siblings_by_mask(label).values())
+
+    def one_category_apart(self, label: Label) -> Iterator[Label]:
+        """Return the siblings that have exactly one grammatical category that the label does not have."""
+        mask = label.grammatical_form.grammatical_categories_mask
+        siblings_by_mask = self.__siblings_by_mask(label)
+        return self.__merge(
+            siblings for sibling_mask, siblings in siblings_by_mask.items() if (sibling_mask & ~mask).bit_count() == 1
+        )
+
+    def __siblings_by_mask(self, label: Label) -> dict[int, list[tuple[int, Label]]]:
+        """Return the siblings of the label by grammatical categories bitmask."""
+        return self.__index.get((label.language, label.grammatical_form.grammatical_base), {})
+
+    @staticmethod
+    def __merge(siblings: Iterable[list[tuple[int, Label]]]) -> Iterator[Label]:
+        """Merge the lists of siblings into one iterator of labels, in the order of the labels."""
+        return (label for _, label in heapq.merge(*siblings))
 
 
 class Labels:  # noqa: PLW1641
@@ -329,10 +376,6 @@ class Labels:  # noqa: PLW1641
         """Return the labels whose grammatical categories are compatible with the other label's."""
         return Labels(label for label in self if label.has_compatible_grammatical_categories(other))
 
-    def with_same_grammatical_base(self, other: Label) -> Labels:
-        """Return the labels with the specified grammatical categories."""
-        return Labels(label for label in self if label.has_same_grammatical_base(other))
-
     def most_similar_label(self, text: str, min_similarity: float = 0.6) -> Label | None:
         """Return the label most similar to the text that has at least the minimum simularity."""
         if similar_labels := [label for label in self if label.similarity(text) >= min_similarity]:
@@ -357,8 +400,9 @@ class Labels:  # noqa: PLW1641
 
     def register_other_grammatical_categories(self) -> None:
         """For each label, register other grammatical forms of that label."""
+        grammatical_siblings = GrammaticalSiblings(self)
         for label in self:
-            label.register_other_grammatical_categories(self)
+            label.register_other_grammatical_categories(grammatical_siblings.one_category_apart(label))
 
     @property
     def non_colloquial(self) -> Labels:
@@ -40,6 +40,12 @@ class LabelFactory:
 
     def create_labels(self, json_labels: list[LabelJSON], *grammatical_categories: GrammaticalCategory) -> Labels:
         """Create labels from the list of JSON labels."""
+        labels = Labels(self._create_labels(json_labels, *grammatical_categories))
+        labels.register_other_grammatical_categories()
+        return labels
+
+    def _create_labels(self, json_labels: list[LabelJSON], *grammatical_categories: GrammaticalCategory) -> list[Label]:
+        """Create labels from the list of JSON labels, recursively for labels with grammatical categories."""
         label_list: list[Label] = []
         for json_label in json_labels:
             if isinstance(json_label["label"], (str, list)):
@@ -50,10 +56,8 @@ class LabelFactory:
                 for grammatical_category in json_label["label"]:
                     json_label_slice = self._slice_json_label(json_label, grammatical_category)
                     slice_grammatical_categories = (*grammatical_categories, grammatical_category)
-                    label_list.extend(factory.create_labels([json_label_slice], *slice_grammatical_categories))
-        labels = Labels(label_list)
-        labels.register_other_grammatical_categories()
-        return labels
+                    label_list.extend(factory._create_labels([json_label_slice], *slice_grammatical_categories))
+        return label_list
 
     def _slice_json_label(self, json_label: LabelJSON, grammatical_category: GrammaticalCategory) -> LabelJSON:
         """Return the slice of the JSON label by grammatical category."""
@@ -1,15 +1,34 @@
 """Progress model class."""
 
-from collections import deque
+from collections import Counter, deque
+from collections.abc import Callable, Collection, Iterable
+from enum import IntEnum
+from threading import Lock
+from typing import Final
 
-from toisto.model.language import Language
+from toisto.model.language import Language, LanguagePair
 from toisto.model.language.concept import Concept
 from toisto.persistence.progress_format import ProgressDict
+from toisto.persistence.progress_snapshot import ProgressSnapshot
 
 from .evaluation import Evaluation
 from .quiz import Quiz, Quizzes
-from .quiz_type import QUIZ_TYPES
-from .retention import Retention
+from .quiz_factory import FACTORY_QUIZ_TYPES
+from .quiz_queue import QuizQueue, SilencedQuizzes
+from .quiz_source import QuizSource
+from .quiz_type import QUIZ_TYPES, QuizType
+from .retention import SKIP_INTERVAL_WHEN_RELATED_QUIZ_IS_ANSWERED_CORRECTLY, Retention, now
+from .retention_store import RetentionStore
+
+QUIZ_ACTIONS: Final = frozenset(quiz_type.action for quiz_type in QUIZ_TYPES)
+
+
+class Tier(IntEnum):
+    """Tiers of quizzes. The next quiz is taken from the first tier that has an unblocked eligible quiz."""
+
+    QUIZ_IN_PROGRESS = 1
+    CONCEPT_IN_PROGRESS = 2
+    OTHER = 3
 
 
 class Progress:
@@ -18,22 +37,51 @@ class Progress:
     def __init__(
         self,
         target_language: Language,
-        quizzes: Quizzes,
+        quizzes: Quizzes | QuizSource,
         progress_dict: ProgressDict,
         skip_concepts: int = 5,
+        snapshot: ProgressSnapshot | None = None,
     ) -> None:
-        self.__progress_dict = {
-            key: Retention.from_dict(value) for key, value in progress_dict.items() if self.valid(key)
-        }
+        self.__retentions = RetentionStore()
+        if snapshot:  # Load the snapshot first, so the retentions in the progress dict replace those in the snapshot
+            rows = {Quiz.identities.identity(key): row for row, key in enumerate(snapshot.keys) if self.valid(key)}
+            self.__retentions.load_snapshot(snapshot, rows)
+        for key, value in progress_dict.items():
+            if self.valid(key):
+                self.__retentions.load(Quiz.identities.identity(key), value)
         self.target_language = target_language
-        self.quizzes = quizzes
+        self.__quiz_source = quizzes if isinstance(quizzes, QuizSource) else QuizSource(quizzes)
+        # Generate the quizzes of practiced concepts up front, the scheduler prefers those:
+        self.__quiz_source.generate_concepts_with_keys(*(Quiz.identities.key(quiz_id) for quiz_id in self.__retentions))
         self.__recent_concepts: deque[Concept] = deque(maxlen=skip_concepts)
+        self.__concepts_in_progress: set[Concept] = set()
+        # The queues per tier and quiz type, the tier of each queued quiz, and the number of generated quizzes queued:
+        self.__queues: dict[tuple[Tier, QuizType], QuizQueue] = {}
+        self.__tiers: dict[int, Tier] = {}
+        self.__nr_queued_quizzes = 0
+        self.__silenced_quizzes = SilencedQuizzes()  # Queued quizzes are kept here instead of in a queue while silenced
+        # The blocking graph: the quizzes blocked by each quiz via root labels, the number of eligible quizzes that
+        # block each quiz via root labels, and the quiz types that block each quiz type:
+        self.__dependents: dict[int, list[int]] = {}
+        self.__nr_eligible_blockers: dict[int, int] = {}
+        self.__blocking_quiz_types: dict[QuizType, frozenset[QuizType]] = {}
+        # The queued quizzes that are eligible, and their number per quiz type:
+        self.__eligible_quiz_ids: set[int] = set()
+        self.__nr_eligible_quizzes: Counter[QuizType] = Counter()
+        # The next quiz as determined in advance by look_ahead(), if any, and the lock that serializes scheduling:
+        self.__lookahead: tuple[Quiz | None] | None = None
+        self.__lock = Lock()
         self.answers = dict.fromkeys(Evaluation, 0)
 
+    @property
+    def quizzes(self) -> Quizzes:
+        """Return all quizzes."""
+        return self.__quiz_source.all_quizzes()
+
     def valid(self, key: str) -> bool:
         """Return whether the key is valid."""
         action = key.rsplit(":", maxsplit=1)[-1]
-        return action in [quiz_type.action for quiz_type in QUIZ_TYPES]
+        return action in QUIZ_ACTIONS
 
     def mark_evaluation(self, quiz: Quiz, evaluation: Evaluation) -> Retention:
         """Mark the evaluation and return the current quiz retention.
@@ -41,36 +89,189 @@ class Progress:
         If the answer was correct, increase the retention of the quiz, and pause related quizzes for a little while.
         If the answer was incorrect or skipped, reset the retention of the quiz.
         """
-        self.answers[evaluation] += 1
-        retention = self.__progress_dict.setdefault(quiz.key, Retention())
-        match evaluation:
-            case Evaluation.CORRECT:
-                retention.increase()
-                self.__pause_related_quizzes(quiz)
-            case Evaluation.INCORRECT | Evaluation.SKIPPED:
-                retention.reset()
-        return retention
+        with self.__lock:
+            self.__lookahead = None
+            self.answers[evaluation] += 1
+            match evaluation:
+                case Evaluation.CORRECT:
+                    retention = self.__update_retention(quiz, Retention.increase)
+                    self.__pause_related_quizzes(quiz)
+                case Evaluation.INCORRECT | Evaluation.SKIPPED:
+                    retention = self.__update_retention(quiz, Retention.reset)
+                case _:  # Evaluation.TRY_AGAIN: the quiz is in progress, but its retention does not change
+                    retention = self.__update_retention(quiz)
+            return retention
 
     def __pause_related_quizzes(self, quiz: Quiz) -> None:
-        """Pause related quizzes for a little while."""
-        for related_quiz in self.quizzes.related_quizzes(quiz):
-            if related_quiz == quiz:
-                continue
-            self.__progress_dict.setdefault(related_quiz.key, Retention()).pause()
+        """Pause related quizzes for a little while, all until the same datetime."""
+        related_quizzes = [
+            related_quiz for related_quiz in self.__quiz_source.related_quizzes(quiz) if related_quiz != quiz
+        ]
+        until = (now() + SKIP_INTERVAL_WHEN_RELATED_QUIZ_IS_ANSWERED_CORRECTLY).timestamp()
+        self.__retentions.pause([related_quiz.quiz_id for related_quiz in related_quizzes], until)
+        for related_quiz in related_quizzes:
+            self.__retention_changed(related_quiz)
+
+    def __update_retention(self, quiz: Quiz, update: Callable[[Retention], None] | None = None) -> Retention:
+        """Update and return the retention of the quiz, adding the quiz to the quizzes in progress if necessary."""
+        retention = self.__retentions.get(quiz.quiz_id)
+        if update:
+            update(retention)
+        self.__retentions.put(quiz.quiz_id, retention)
+        self.__retention_changed(quiz)
+        return retention
+
+    def __retention_changed(self, quiz: Quiz) -> None:
+        """Requeue the quiz after its retention changed, adding its concept to the concepts in progress if needed."""
+        self.__requeue(quiz)
+        if quiz.concept not in self.__concepts_in_progress:
+            self.__concepts_in_progress.add(quiz.concept)
+            for quiz_for_same_concept in self.__quiz_source.by_concept(quiz.concept):
+                self.__requeue(quiz_for_same_concept)
+
+    def look_ahead(self) -> None:
+        """Determine the next quiz in advance, so next_quiz() can return it without delay.
+
+        This method can be run in a background thread. The next quiz is determined anew by next_quiz() if an
+        evaluation was marked or the silence of a quiz ended in the mean time.
+        """
+        with self.__lock:
+            self.__lookahead = (self.__determine_next_quiz(),)
 
     def next_quiz(self) -> Quiz | None:
         """Return the next quiz."""
-        eligible_quizzes = self.eligible_quizzes()
-        quizzes_for_concepts_in_progress = Quizzes(
-            quiz for quiz in eligible_quizzes if self.__has_concept_in_progress(quiz)
-        )
-        quizzes_in_progress = Quizzes(quiz for quiz in quizzes_for_concepts_in_progress if self.__in_progress(quiz))
-        for potential_quizzes in [quizzes_in_progress, quizzes_for_concepts_in_progress, eligible_quizzes]:
-            if unblocked_quizzes := self.__unblocked_quizzes(potential_quizzes, eligible_quizzes):
-                quiz = min(unblocked_quizzes, key=self.__priority)
-                self.__recent_concepts.append(quiz.concept)
+        with self.__lock:
+            if self.__lookahead is None or self.__silenced_quizzes.silence_ended(now().timestamp()):
+                quiz = self.__determine_next_quiz()
+            else:
+                quiz = self.__lookahead[0]
+            self.__lookahead = None
+            return self.__select(quiz) if quiz else None
+
+    def __determine_next_quiz(self) -> Quiz | None:
+        """Determine the next quiz.
+
+        Quizzes in progress come first, then quizzes of concepts in progress, and then all other quizzes. Each tier
+        has a priority queue per quiz type, so quiz types that are blocked can be skipped as a whole. Silenced quizzes
+        are moved to the queues when their silence ends.
+        """
+        for released_quiz in self.__silenced_quizzes.release(now().timestamp()):
+            self.__queue(released_quiz)
+        self.__queue_generated_quizzes()
+        for tier in (Tier.QUIZ_IN_PROGRESS, Tier.CONCEPT_IN_PROGRESS):
+            if quiz := self.__first_unblocked_quiz_in_tier(tier):
                 return quiz
-        return None
+        return self.__first_unblocked_quiz()
+
+    def __select(self, quiz: Quiz) -> Quiz:
+        """Select the quiz as next quiz."""
+        recent_concepts = set(self.__recent_concepts)
+        self.__recent_concepts.append(quiz.concept)
+        for concept in recent_concepts.symmetric_difference(self.__recent_concepts):
+            for quiz_of_concept in self.__quiz_source.by_concept(concept):
+                self.__update_eligibility(quiz_of_concept)
+        return quiz
+
+    def __first_unblocked_quiz_in_tier(self, tier: Tier) -> Quiz | None:
+        """Return the unblocked eligible quiz with the highest priority in the tier."""
+        candidates = [
+            quiz
+            for (queue_tier, quiz_type), queue in list(self.__queues.items())  # Checks may add queues
+            if queue_tier == tier
+            and (quiz := queue.first(self.__is_eligible_and_not_blocked_by_roots))
+            and not self.__is_blocked_by_quiz_types(quiz_type)
+        ]
+        return min(candidates, key=self.__priority, default=None)
+
+    def __first_unblocked_quiz(self) -> Quiz | None:
+        """Return the unblocked eligible quiz with the highest priority.
+
+        Quizzes of concepts not generated so far have no progress, so they are compared by key only. Generate the
+        quizzes of these concepts in the order of the lower bound of their quiz keys, until no concept can have a
+        quiz that beats the best quiz found so far.
+        """
+        self.__queue_generated_quizzes()  # Checking roots may have generated quizzes
+        nr_evaluated_quizzes = len(self.__quiz_source.generated_quizzes)
+        best_quiz = self.__first_unblocked_quiz_in_tier(Tier.OTHER)
+        while True:
+            generated_quizzes = self.__quiz_source.generated_quizzes
+            if nr_evaluated_quizzes < len(generated_quizzes):
+                new_quizzes = generated_quizzes[nr_evaluated_quizzes:]
+                nr_evaluated_quizzes = len(generated_quizzes)
+                self.__queue_generated_quizzes()
+                candidates = [quiz for quiz in new_quizzes if self.__is_eligible(quiz) and not self.__is_blocked(quiz)]
+                best_quiz = min([*candidates, *([best_quiz] if best_quiz else [])], key=self.__priority, default=None)
+            elif not self.__quiz_source.generate_next_concept(best_quiz.key if best_quiz else None):
+                break
+        return best_quiz
+
+    def __queue_generated_quizzes(self) -> None:
+        """Add the quizzes generated since the previous call to the queues."""
+        generated_quizzes = self.__quiz_source.generated_quizzes
+        while self.__nr_queued_quizzes < len(generated_quizzes):  # Registering blockers may generate quizzes
+            new_quizzes = generated_quizzes[self.__nr_queued_quizzes :]
+            self.__nr_queued_quizzes = len(generated_quizzes)
+            # Register the concepts in progress first, so the tier of quizzes of the same concept is correct:
+            self.__concepts_in_progress.update(quiz.concept for quiz in new_quizzes if self.__in_progress(quiz))
+            for quiz in new_quizzes:
+                self.__register_blockers(quiz)
+                self.__queue(quiz)
+
+    def __register_blockers(self, quiz: Quiz) -> None:
+        """Add the quizzes for the root labels of the quiz to the blocking graph as blockers of the quiz."""
+        blockers = {
+            other_quiz
+            for label in {quiz.question, *quiz.answers}
+            for root in label.roots
+            for other_quiz in self.__quiz_source.by_label(root)
+            if other_quiz != quiz
+        }
+        for blocker in blockers:
+            self.__dependents.setdefault(blocker.quiz_id, []).append(quiz.quiz_id)
+        self.__nr_eligible_blockers[quiz.quiz_id] = len(
+            [blocker for blocker in blockers if blocker.quiz_id in self.__eligible_quiz_ids]
+        )
+
+    def __queue(self, quiz: Quiz) -> None:
+        """Add the quiz to the queue of its tier and quiz type, or to the silenced quizzes if it is silenced."""
+        tier = self.__tier(quiz)
+        self.__tiers[quiz.quiz_id] = tier
+        if (skip_until := self.__retentions.skip_until(quiz.quiz_id)) > now().timestamp():  # False if NaN
+            self.__silenced_quizzes.add(quiz, skip_until)
+        else:
+            self.__queues.setdefault((tier, quiz.quiz_type), QuizQueue()).push(quiz, self.__priority(quiz))
+        self.__update_eligibility(quiz)
+
+    def __update_eligibility(self, quiz: Quiz) -> None:
+        """Update the eligibility of the queued quiz, and the number of eligible blockers of the quizzes it blocks."""
+        eligible = quiz not in self.__silenced_quizzes and quiz.concept not in self.__recent_concepts
+        if eligible == (quiz.quiz_id in self.__eligible_quiz_ids):
+            return
+        if eligible:
+            self.__eligible_quiz_ids.add(quiz.quiz_id)
+        else:
+            self.__eligible_quiz_ids.remove(quiz.quiz_id)
+        delta = 1 if eligible else -1
+        self.__nr_eligible_quizzes[quiz.quiz_type] += delta
+        for dependent_id in self.__dependents.get(quiz.quiz_id, []):
+            self.__nr_eligible_blockers[dependent_id] += delta
+
+    def __requeue(self, quiz: Quiz) -> None:
+        """Move the quiz to the queue of its current tier and update its priority, if the quiz is queued."""
+        if (tier := self.__tiers.get(quiz.quiz_id)) is not None:
+            if quiz in self.__silenced_quizzes:
+                self.__silenced_quizzes.remove(quiz)
+            else:
+                self.__queues[(tier, quiz.quiz_type)].remove(quiz)
+            self.__queue(quiz)
+
+    def __tier(self, quiz: Quiz) -> Tier:
+        """Return the tier of the quiz."""
+        if self.__in_progress(quiz):
+            return Tier.QUIZ_IN_PROGRESS
+        if quiz.concept in self.__concepts_in_progress:
+            return Tier.CONCEPT_IN_PROGRESS
+        return Tier.OTHER
 
     def __priority(self, quiz: Quiz) -> tuple[int, str]:
         """Return the sort key for picking the next quiz within a tier.
@@ -78,46 +279,105 @@ class Progress:
         Most-practiced first (count descending), with the quiz key as a stable tiebreaker. Using a deterministic
         priority rather than relying on frozenset iteration order keeps quiz selection consistent across restarts.
         """
-        return (-self.get_retention(quiz).count, quiz.key)
+        return (-self.__retentions.count(quiz.quiz_id), quiz.key)
 
     def get_retention(self, quiz: Quiz) -> Retention:
         """Return the quiz retention."""
-        return self.__progress_dict.get(quiz.key, Retention())
-
-    def eligible_quizzes(self) -> Quizzes:
-        """Return the eligible quizzes."""
-        return Quizzes(quiz for quiz in self.quizzes if self.__is_eligible(quiz))
+        return self.__retentions.get(quiz.quiz_id)
 
     def __is_eligible(self, quiz: Quiz) -> bool:
-        """Return whether the quiz is not silenced and not the current quiz."""
-        return quiz.concept not in self.__recent_concepts and not self.get_retention(quiz).is_silenced()
+        """Return whether the queued quiz is not silenced and not of a recent concept."""
+        return quiz.quiz_id in self.__eligible_quiz_ids
 
-    def __has_concept_in_progress(self, quiz: Quiz) -> bool:
-        """Return whether the quiz's concept has been presented to the user before."""
-        quizzes_for_same_concept = self.quizzes.by_concept(quiz.concept)
-        return any(self.__in_progress(quiz_for_same_concept) for quiz_for_same_concept in quizzes_for_same_concept)
+    def __is_eligible_and_not_blocked_by_roots(self, quiz: Quiz) -> bool:
+        """Return whether the quiz is eligible and not blocked by quizzes for its root labels."""
+        return self.__is_eligible(quiz) and not self.__root_labels_have_quizzes(quiz)
 
     def __in_progress(self, quiz: Quiz) -> bool:
         """Return whether the quiz has been presented to the user before."""
-        return quiz.key in self.__progress_dict
+        return quiz.quiz_id in self.__retentions
 
-    def __unblocked_quizzes(self, potential_quizzes: Quizzes, eligible_quizzes: Quizzes) -> Quizzes:
-        """Return the quizzes that are not blocked by other quizzes."""
-        return Quizzes(
-            quiz
-            for quiz in potential_quizzes
-            if not self.__root_labels_have_quizzes(quiz, eligible_quizzes) and not quiz.is_blocked_by(eligible_quizzes)
-        )
+    def __is_blocked(self, quiz: Quiz) -> bool:
+        """Return whether the quiz is blocked by other quizzes."""
+        return self.__root_labels_have_quizzes(quiz) or self.__is_blocked_by_quiz_types(quiz.quiz_type)
+
+    def __root_labels_have_quizzes(self, quiz: Quiz) -> bool:
+        """Return whether the quiz's labels have root labels that have eligible quizzes."""
+        return self.__nr_eligible_blockers[quiz.quiz_id] > 0
+
+    def __is_blocked_by_quiz_types(self, quiz_type: QuizType) -> bool:
+        """Return whether quizzes of the quiz type are blocked by the quiz types of the eligible quizzes."""
+        if not (blocking_quiz_types := self.__quiz_types_blocking(quiz_type)):
+            return False
+        self.__queue_generated_quizzes()
+        if any(self.__nr_eligible_quizzes[blocking_quiz_type] for blocking_quiz_type in blocking_quiz_types):
+            return True
+        if self.__quiz_source.complete:
+            return False
+        self.__quiz_source.generate_all()  # Blocking quiz types can only be ruled out by looking at all quizzes
+        self.__queue_generated_quizzes()
+        return any(self.__nr_eligible_quizzes[blocking_quiz_type] for blocking_quiz_type in blocking_quiz_types)
 
-    def __root_labels_have_quizzes(self, quiz: Quiz, eligible_quizzes: Quizzes) -> bool:
-        """Return whether the quiz's labels have root labels that have quizzes."""
-        for label in {quiz.question, *quiz.answers}:
-            for root in label.roots:
-                for other_quiz in self.quizzes.by_label(root):
-                    if other_quiz != quiz and other_quiz in eligible_quizzes:
-                        return True
-        return False
+    def __quiz_types_blocking(self, quiz_type: QuizType) -> frozenset[QuizType]:
+        """Return the quiz types that block the quiz type."""
+        if quiz_type not in self.__blocking_quiz_types:
+            self.__blocking_quiz_types[quiz_type] = frozenset(
+                other_quiz_type for other_quiz_type in FACTORY_QUIZ_TYPES if quiz_type.blocked_by(other_quiz_type)
+            )
+        return self.__blocking_quiz_types[quiz_type]
 
     def as_dict(self) -> ProgressDict:
         """Return the progress as dict."""
-        return {key: value.as_dict() for key, value in self.__progress_dict.items()}
+        with self.__lock:
+            return {Quiz.identities.key(quiz_id): value for quiz_id, value in self.__retentions.as_dict().items()}
+
+    def orphans(self, language_pair: LanguagePair, keys: Collection[str]) -> ProgressDict:
+        """Return the progress on quizzes of the language pair whose keys are not among the quiz keys (anymore).
+
+        This happens when a concept is removed or renamed, or when its labels change. Progress on quizzes of other
+        language pairs is not considered orphaned, as the quizzes are quizzes for one language pair only.
+        """
+        languages = {language_pair.target, language_pair.source}
+        return {
+            key: value
+            for key, value in self.as_dict().items()
+            if key not in keys and set(key.split(":", maxsplit=2)[:2]) <= languages
+        }
+
+    def remove(self, keys: Iterable[str]) -> None:
+        """Remove the progress on the quizzes with the keys. The quizzes are not requeued, so use for orphans only."""
+        with self.__lock:
+            for key in keys:
+                self.__retentions.remove(Quiz.identities.identity(key))
+
+    def pop_changes(self, merge: Callable[[list[str]], ProgressDict] | None = None) -> ProgressDict:
+        """Return the progress changed since the previous call as dict.
+
+        If a merge function is given, first merge the progress saved by other sessions since the previous call. The
+        merge function is passed the keys of the changed quizzes and returns the progress saved by other sessions.
+        """
+        with self.__lock:
+            if merge:
+                self.__merge(merge([Quiz.identities.key(quiz_id) for quiz_id in self.__retentions.changed()]))
+            return {Quiz.identities.key(quiz_id): value for quiz_id, value in self.__retentions.pop_changes().items()}
+
+    def __merge(self, progress_dict: ProgressDict) -> None:
+        """Merge the progress saved by other sessions and requeue the quizzes whose retention changed."""
+        retention_dicts = {
+            Quiz.identities.identity(key): value for key, value in progress_dict.items() if self.valid(key)
+        }
+        if not retention_dicts:
+            return
+        for quiz_id, retention_dict in retention_dicts.items():
+            self.__retentions.merge(quiz_id, retention_dict)
+        self.__lookahead = None
+        # Generate the quizzes of concepts with progress, as the scheduler assumes other concepts have no progress:
+        self.__quiz_source.generate_concepts_with_keys(*progress_dict)
+        for quiz in self.__quiz_source.generated_quizzes:
+            if quiz.quiz_id in retention_dicts:
+                self.__retention_changed(quiz)
+
+    def snapshot(self) -> ProgressSnapshot:
+        """Return a snapshot of the progress."""
+        with self.__lock:
+            return self.__retentions.snapshot(Quiz.identities.key)
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from functools import cached_property
+from itertools import chain
+from typing import ClassVar
 
-from toisto.tools import first
+from toisto.tools import Identities, first
 
 from ..language import Language, LanguagePair
 from ..language.concept import Concept
@@ -26,6 +28,7 @@ class Quiz:
     _answers: Labels
     quiz_type: QuizType
     action: QuizAction
+    identities: ClassVar[Identities[str]] = Identities[str]()  # Quiz keys and their integer identities
 
     def __repr__(self) -> str:
         """Return a representation of the quiz for test purposes."""
@@ -33,21 +36,32 @@ class Quiz:
 
     def __hash__(self) -> int:
         """Return a hash using the same attributes as used for testing equality."""
-        return hash(self.key)
+        return self.quiz_id
 
     def __eq__(self, other: object) -> bool:
         """Return whether this quiz is equal to the other."""
-        return self.key == other.key if isinstance(other, self.__class__) else False
+        return self.quiz_id == other.quiz_id if isinstance(other, self.__class__) else False
 
     def __ne__(self, other: object) -> bool:
         """Return whether this quiz is not equal to the other."""
-        return self.key != other.key if isinstance(other, self.__class__) else True
+        return self.quiz_id != other.quiz_id if isinstance(other, self.__class__) else True
 
     @cached_property
+    def quiz_id(self) -> int:
+        """Return the integer identity of the quiz. Quizzes with the same key have the same identity."""
+        question = self._question.first_spelling_alternative
+        key = f"{self.question.language}:{self.answer.language}:{question}:{self.answer}:{self.action}"
+        return self.identities.identity(key)
+
+    @property
     def key(self) -> str:
         """Return a string version of the quiz that can be used as key in the progress dict."""
-        question = self._question.first_spelling_alternative
-        return f"{self.question.language}:{self.answer.language}:{question}:{self.answer}:{self.action}"
+        return self.identities.key(self.quiz_id)
+
+    @property
+    def question_and_answers(self) -> tuple[Label, Labels]:
+        """Return the question and answers the quiz was created with, i.e. before applying spelling alternatives."""
+        return self._question, self._answers
 
     def has_quiz_type(self, quiz_type: QuizType | type[QuizType]) -> bool:
         """Return whether this quiz has the specified quiz type."""
@@ -122,7 +136,11 @@ class Quiz:
 
     def is_blocked_by(self, quizzes: Quizzes) -> bool:
         """Return whether this quiz should come after any of the given quizzes."""
-        return any(self.quiz_type.blocked_by(quiz_type) for quiz_type in quizzes.quiz_types)
+        return self.is_blocked_by_quiz_types(quizzes.quiz_types)
+
+    def is_blocked_by_quiz_types(self, quiz_types: Iterable[QuizType]) -> bool:
+        """Return whether this quiz should come after quizzes with any of the given quiz types."""
+        return any(self.quiz_type.blocked_by(quiz_type) for quiz_type in quiz_types)
 
     @property
     def _tips(self) -> str:
@@ -138,6 +156,11 @@ class Quizzes(frozenset[Quiz]):
         """Return the union of self and other."""
         return self.__class__(super().__or__(other))
 
+    @classmethod
+    def from_iterables(cls, *iterables: Iterable[Quiz]) -> Quizzes:
+        """Return the union of the iterables of quizzes, without creating intermediate sets."""
+        return cls(chain.from_iterable(iterables))
+
     def by_concept(self, concept: Concept) -> Quizzes:
         """Return the quizzes for the concept."""
         return self.__quizzes_by_concept.get(concept, Quizzes())
@@ -145,10 +168,7 @@ class Quizzes(frozenset[Quiz]):
     @cached_property
     def __quizzes_by_concept(self) -> dict[Concept, Quizzes]:
         """Return the quizzes by concept."""
-        mapping: dict[Concept, Quizzes] = {}
-        for quiz in self:
-            mapping[quiz.concept] = mapping.get(quiz.concept, Quizzes()) | Quizzes({quiz})
-        return mapping
+        return self.__index(lambda quiz: (quiz.concept,))
 
     def by_label(self, label: Label) -> Quizzes:
         """Return the quizzes for the label."""
@@ -157,18 +177,22 @@ class Quizzes(frozenset[Quiz]):
     @cached_property
     def __quizzes_by_label(self) -> dict[Label, Quizzes]:
         """Return the quizzes by label."""
-        mapping: dict[Label, Quizzes] = {}
+        return self.__index(lambda quiz: {quiz.question, *quiz.answers})
+
+    def __index[Key](self, keys: Callable[[Quiz], Iterable[Key]]) -> dict[Key, Quizzes]:
+        """Group the quizzes by their keys in one pass and create one set of quizzes per key."""
+        buckets: dict[Key, list[Quiz]] = {}
         for quiz in self:
-            for label in {quiz.question, *quiz.answers}:
-                mapping[label] = mapping.get(label, Quizzes()) | Quizzes({quiz})
-        return mapping
+            for key in keys(quiz):
+                buckets.setdefault(key, []).append(quiz)
+        return {key: self.__class__(bucket) for key, bucket in buckets.items()}
 
     def related_quizzes(self, quiz: Quiz) -> Quizzes:
         """Return the quizzes related to the quiz, meaning quizzes for the same concept and quizzes for examples."""
-        quizzes = self.by_concept(quiz.concept)
-        for example in quiz.concept.get_related_concepts("example"):
-            quizzes |= self.by_concept(example)
-        return quizzes
+        examples = quiz.concept.get_related_concepts("example")
+        if not examples:
+            return self.by_concept(quiz.concept)
+        return self.from_iterables(self.by_concept(quiz.concept), *(self.by_concept(example) for example in examples))
 
     @property
     def colloquial(self) -> Quizzes:
@@ -0,0 +1,130 @@
+"""Quiz catalogue."""
+
+from __future__ import annotations
+
+from itertools import chain
+
+from toisto.tools import first
+
+from ..language import LanguagePair
+from ..language.concept import Concept, ConceptId
+from ..language.label import Label, Labels
+from .quiz import Quiz, Quizzes
+from .quiz_factory import FACTORY_QUIZ_TYPES
+
+# A label is referenced by the identifier of the concept it belongs to and its index in the labels of the concept.
+# Cloze test labels are referenced by the reference of the label they belong to, plus their index in the cloze tests.
+LabelReference = list[ConceptId | int]
+# A quiz is referenced by its key, the index of its quiz type in FACTORY_QUIZ_TYPES, its action, a reference to its
+# question, and references to its answers.
+QuizReference = tuple[str, int, str, LabelReference, list[LabelReference]]
+QuizCatalogueDict = dict[ConceptId, list[QuizReference]]
+
+
+class QuizCatalogue:
+    """Catalogue of quizzes per concept.
+
+    The catalogue contains the keys of the quizzes and the references needed to rebuild the quizzes, so quizzes can be
+    rebuilt without generating them from the concepts. Quizzes are rebuilt lazily, per concept, when asked for.
+    """
+
+    def __init__(self, language_pair: LanguagePair, catalogue: QuizCatalogueDict) -> None:
+        self.language_pair = language_pair
+        self.__catalogue = catalogue
+        self.__quizzes: dict[ConceptId, Quizzes] = {}
+        self.__concepts: dict[ConceptId, Concept] = {}
+
+    @classmethod
+    def from_quizzes(cls, language_pair: LanguagePair, quizzes: Quizzes) -> QuizCatalogue:
+        """Create a catalogue from the quizzes."""
+        label_references = LabelReferences()
+        catalogue: QuizCatalogueDict = {}
+        quizzes_by_concept: dict[ConceptId, set[Quiz]] = {}
+        for quiz in sorted(quizzes, key=lambda quiz: quiz.key):
+            quizzes_by_concept.setdefault(quiz.concept.concept_id, set()).add(quiz)
+            question, answers = quiz.question_and_answers
+            question_reference = label_references.reference(quiz.concept, question)
+            answer_references = [label_references.reference(quiz.concept, answer) for answer in answers]
+            quiz_type_index = FACTORY_QUIZ_TYPES.index(quiz.quiz_type)
+            quiz_reference = (quiz.key, quiz_type_index, quiz.action, question_reference, answer_references)
+            catalogue.setdefault(quiz.concept.concept_id, []).append(quiz_reference)
+        quiz_catalogue = cls(language_pair, catalogue)
+        quiz_catalogue.__quizzes = {concept_id: Quizzes(quizzes) for concept_id, quizzes in quizzes_by_concept.items()}
+        return quiz_catalogue
+
+    def as_dict(self) -> QuizCatalogueDict:
+        """Return the catalogue as dict."""
+        return self.__catalogue
+
+    @property
+    def concept_ids(self) -> tuple[ConceptId, ...]:
+        """Return the identifiers of the concepts that have quizzes."""
+        return tuple(self.__catalogue)
+
+    def keys(self, concept_id: ConceptId) -> tuple[str, ...]:
+        """Return the keys of the quizzes of the concept, without rebuilding the quizzes."""
+        return tuple(quiz_reference[0] for quiz_reference in self.__catalogue.get(concept_id, []))
+
+    def all_keys(self) -> set[str]:
+        """Return the keys of the quizzes of all concepts, without rebuilding the quizzes."""
+        return {
+            quiz_reference[0] for quiz_references in self.__catalogue.values() for quiz_reference in quiz_references
+        }
+
+    def quizzes(self, concept_id: ConceptId) -> Quizzes:
+        """Return the quizzes of the concept, rebuilding them if they have not been rebuilt before."""
+        if concept_id not in self.__catalogue:
+            return Quizzes()
+        if concept_id not in self.__quizzes:
+            concept = self.concept(concept_id)
+            self.__quizzes[concept_id] = Quizzes(
+                self.__quiz(concept, quiz_reference) for quiz_reference in self.__catalogue[concept_id]
+            )
+        return self.__quizzes[concept_id]
+
+    def all_quizzes(self) -> Quizzes:
+        """Return the quizzes of all concepts."""
+        return Quizzes(chain.from_iterable(self.quizzes(concept_id) for concept_id in self.concept_ids))
+
+    def concept(self, concept_id: ConceptId) -> Concept:
+        """Return the concept with the identifier."""
+        if concept_id not in self.__concepts:
+            self.__concepts[concept_id] = first(Concept.instances.get_values(concept_id))
+        return self.__concepts[concept_id]
+
+    def __quiz(self, concept: Concept, quiz_reference: QuizReference) -> Quiz:
+        """Rebuild the quiz from the quiz reference."""
+        _key, quiz_type_index, action, question_reference, answer_references = quiz_reference
+        question = self.__label(question_reference)
+        answers = Labels(self.__label(answer_reference) for answer_reference in answer_references)
+        return Quiz(self.language_pair, concept, question, answers, FACTORY_QUIZ_TYPES[quiz_type_index], action)
+
+    def __label(self, label_reference: LabelReference) -> Label:
+        """Look up the label that is referenced."""
+        concept_id, label_index, *cloze_test_index = label_reference
+        label = self.concept(ConceptId(str(concept_id))).all_labels[int(label_index)]
+        return label.cloze_tests[int(cloze_test_index[0])] if cloze_test_index else label
+
+
+class LabelReferences:
+    """Create references to labels."""
+
+    def __init__(self) -> None:
+        # Labels are compared by value, but different concepts can have labels with equal values, such as homographs.
+        # Hence, labels are looked up by identity.
+        self.__references: dict[int, LabelReference] = {
+            id(label): [concept.concept_id, index]
+            for concept in Concept.instances.get_all_values()
+            for index, label in enumerate(concept.all_labels)
+        }
+
+    def reference(self, concept: Concept, label: Label) -> LabelReference:
+        """Return the reference to the label. If the label is not a concept label, it's a cloze test of the concept."""
+        if id(label) in self.__references:
+            return self.__references[id(label)]
+        for index, concept_label in enumerate(concept.all_labels):
+            for cloze_test_index, cloze_test in enumerate(concept_label.cloze_tests):
+                if cloze_test is label:
+                    return [concept.concept_id, index, cloze_test_index]
+        message = f"Label '{label}' does not belong to concept '{concept.concept_id}'"
+        raise ValueError(message)
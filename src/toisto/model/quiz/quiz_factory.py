@@ -1,12 +1,18 @@
 """Quiz factory."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import Final
 
 from ..language import LanguagePair
 from ..language.concept import Concept
 from .quiz import Quiz, Quizzes
 from .quiz_type import NON_GRAMMATICAL_QUIZ_TYPES, GrammaticalQuizType, QuizAction, QuizType
 
+# The quiz types the factory uses to create quizzes. One grammatical quiz type creates all grammatical quizzes, because
+# the action of grammatical quizzes depends on the grammatical differences between the question and the answer.
+FACTORY_QUIZ_TYPES: Final = (*NON_GRAMMATICAL_QUIZ_TYPES, GrammaticalQuizType())
+
 
 @dataclass(frozen=True)
 class QuizFactory:
@@ -17,22 +23,20 @@ class QuizFactory:
 
     def create_quizzes(self, *concepts: Concept) -> Quizzes:
         """Create quizzes for the concepts."""
-        return Quizzes(Quizzes().union(*(self.concept_quizzes(concept) for concept in concepts)))
+        return Quizzes.from_iterables(*(self.concept_quizzes(concept) for concept in concepts))
 
-    def concept_quizzes(self, concept: Concept) -> Quizzes:
-        """Create the quizzes for a concept."""
-        quizzes = Quizzes()
-        for quiz_type in (*NON_GRAMMATICAL_QUIZ_TYPES, GrammaticalQuizType()):
-            quizzes = quizzes | self._quizzes(concept, quiz_type)
-        return quizzes
+    def concept_quizzes(self, concept: Concept) -> Iterator[Quiz]:
+        """Generate the quizzes for a concept."""
+        for quiz_type in FACTORY_QUIZ_TYPES:
+            yield from self._quizzes(concept, quiz_type)
 
     def _quizzes(
         self,
         concept: Concept,
         quiz_type: QuizType,
-    ) -> Quizzes:
-        """Create the quizzes with the given quiz type for a concept."""
-        return Quizzes(
+    ) -> Iterator[Quiz]:
+        """Generate the quizzes with the given quiz type for a concept."""
+        return (
             Quiz(self.language_pair, concept, question, answers, quiz_type, action)
             for question, answers, action in quiz_type.questions_and_answers(self.language_pair, concept)
             if not self.actions or action in self.actions
@@ -0,0 +1,89 @@
+"""Quiz queue."""
+
+import heapq
+from collections.abc import Callable
+
+from .quiz import Quiz
+
+Priority = tuple[int, str]  # Lower is better
+
+
+class QuizQueue:
+    """Priority queue of quizzes that supports changing the priority of quizzes and removing quizzes.
+
+    Changing the priority of a quiz or removing a quiz leaves the old heap entry in place. Old entries are recognized
+    by comparing them with the current priority of the quiz, and are dropped when they reach the top of the heap.
+    """
+
+    def __init__(self) -> None:
+        self.__heap: list[tuple[Priority, int]] = []
+        self.__priorities: dict[int, Priority] = {}  # The current priority of each quiz in the queue, by quiz id
+        self.__quizzes: dict[int, Quiz] = {}
+
+    def push(self, quiz: Quiz, priority: Priority) -> None:
+        """Add the quiz to the queue, or change its priority if the quiz is in the queue already."""
+        if self.__priorities.get(quiz.quiz_id) == priority:
+            return
+        self.__priorities[quiz.quiz_id] = priority
+        self.__quizzes[quiz.quiz_id] = quiz
+        heapq.heappush(self.__heap, (priority, quiz.quiz_id))
+
+    def remove(self, quiz: Quiz) -> None:
+        """Remove the quiz from the queue."""
+        del self.__priorities[quiz.quiz_id]
+        del self.__quizzes[quiz.quiz_id]
+
+    def first(self, predicate: Callable[[Quiz], bool]) -> Quiz | None:
+        """Return the quiz with the highest priority for which the predicate holds, without removing it."""
+        popped: list[tuple[Priority, int]] = []
+        found: Quiz | None = None
+        while self.__heap:
+            entry = heapq.heappop(self.__heap)
+            priority, quiz_id = entry
+            if self.__priorities.get(quiz_id) != priority or (popped and popped[-1] == entry):
+                continue  # Drop entries of removed quizzes, old priorities, and duplicates
+            popped.append(entry)
+            if predicate(quiz := self.__quizzes[quiz_id]):
+                found = quiz
+                break
+        for entry in popped:
+            heapq.heappush(self.__heap, entry)
+        return found
+
+
+class SilencedQuizzes:
+    """Silenced quizzes, ordered by the end of their silence so quizzes can be released when their silence ends.
+
+    Like the quiz queue, removing a quiz leaves its heap entry in place. The entry is dropped when it is released.
+    """
+
+    def __init__(self) -> None:
+        self.__heap: list[tuple[float, int]] = []
+        self.__quizzes: dict[int, tuple[float, Quiz]] = {}  # The end of the silence and the quiz, by quiz id
+
+    def __contains__(self, quiz: object) -> bool:
+        """Return whether the quiz is silenced."""
+        return isinstance(quiz, Quiz) and quiz.quiz_id in self.__quizzes
+
+    def add(self, quiz: Quiz, skip_until: float) -> None:
+        """Add the quiz, silenced until the timestamp."""
+        self.__quizzes[quiz.quiz_id] = (skip_until, quiz)
+        heapq.heappush(self.__heap, (skip_until, quiz.quiz_id))
+
+    def remove(self, quiz: Quiz) -> None:
+        """Remove the quiz."""
+        del self.__quizzes[quiz.quiz_id]
+
+    def silence_ended(self, now: float) -> bool:
+        """Return whether the silence of a quiz may have ended, i.e. whether releasing quizzes may release a quiz."""
+        return bool(self.__heap) and self.__heap[0][0] <= now
+
+    def release(self, now: float) -> list[Quiz]:
+        """Remove and return the quizzes whose silence has ended."""
+        released = []
+        while self.__heap and self.__heap[0][0] <= now:
+            skip_until, quiz_id = heapq.heappop(self.__heap)
+            if (entry := self.__quizzes.get(quiz_id)) and entry[0] == skip_until:
+                del self.__quizzes[quiz_id]
+                released.append(entry[1])
+        return released
@@ -0,0 +1,247 @@
+"""Quiz sources."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Iterable, Sequence
+
+from ..language import LanguagePair
+from ..language.concept import Concept, ConceptRelation
+from ..language.label import Label, Labels
+from .quiz import Quiz, Quizzes
+from .quiz_factory import FACTORY_QUIZ_TYPES
+from .quiz_type import RelationshipQuizType
+
+# The concept relations used by quiz types that take their answers from related concepts
+ANSWER_RELATIONS: tuple[ConceptRelation, ...] = tuple(
+    quiz_type.concept_relation for quiz_type in FACTORY_QUIZ_TYPES if isinstance(quiz_type, RelationshipQuizType)
+)
+
+
+class QuizSource:
+    """Source of the quizzes the progress scheduler picks from. This source contains all quizzes from the start."""
+
+    def __init__(self, quizzes: Iterable[Quiz] = ()) -> None:
+        self.__quizzes_by_concept: dict[Concept, list[Quiz]] = {}
+        self.__quizzes_by_label: dict[Label, list[Quiz]] = {}
+        self.__quiz_ids: set[int] = set()
+        self.__generated_quizzes: list[Quiz] = []
+        self.__quizzes = Quizzes()
+        self.__related_quizzes: dict[Concept, Quizzes] = {}
+        self._add(quizzes)
+
+    def _add(self, quizzes: Iterable[Quiz], concept: Concept | None = None) -> None:
+        """Add the quizzes to the source, and register the concept as generated.
+
+        If multiple concepts have equal quizzes, the quiz of the concept that was generated first is kept, like a set
+        of quizzes keeps the first of equal quizzes added to it.
+        """
+        if concept is not None:
+            self.__quizzes_by_concept.setdefault(concept, [])
+        for quiz in quizzes:
+            if quiz.quiz_id in self.__quiz_ids:
+                continue
+            self.__quiz_ids.add(quiz.quiz_id)
+            self.__generated_quizzes.append(quiz)
+            self.__quizzes_by_concept.setdefault(quiz.concept, []).append(quiz)
+            for label in {quiz.question, *quiz.answers}:
+                self.__quizzes_by_label.setdefault(label, []).append(quiz)
+
+    @property
+    def generated_quizzes(self) -> Sequence[Quiz]:
+        """Return the quizzes generated so far, in the order they were generated."""
+        return self.__generated_quizzes
+
+    @property
+    def quizzes(self) -> Quizzes:
+        """Return the quizzes generated so far."""
+        if len(self.__quizzes) < len(self.__generated_quizzes):
+            self.__quizzes = Quizzes(self.__generated_quizzes)
+        return self.__quizzes
+
+    def all_quizzes(self) -> Quizzes:
+        """Return all quizzes, generating the quizzes not generated so far."""
+        self.generate_all()
+        return self.quizzes
+
+    @property
+    def complete(self) -> bool:
+        """Return whether all quizzes have been generated."""
+        return True
+
+    def generate_all(self) -> None:
+        """Generate the quizzes not generated so far."""
+
+    def generate_concepts_with_keys(self, *keys: str) -> None:
+        """Generate the quizzes of the concepts that may have quizzes with the keys."""
+
+    def generate_next_concept(self, below_key: str | None = None) -> bool:
+        """Generate the quizzes of the concept with the lowest quiz keys not generated so far.
+
+        Only generate the quizzes if the concept may have quizzes with keys below the given key. Return whether the
+        quizzes were generated.
+        """
+        return False
+
+    def by_concept(self, concept: Concept) -> Quizzes:
+        """Return the quizzes for the concept."""
+        return Quizzes(self.__quizzes_by_concept.get(concept, ()))
+
+    def by_label(self, label: Label) -> Quizzes:
+        """Return the quizzes for the label."""
+        return Quizzes(self.__quizzes_by_label.get(label, ()))
+
+    def related_quizzes(self, quiz: Quiz) -> Quizzes:
+        """Return the quizzes related to the quiz, meaning quizzes for the same concept and quizzes for examples.
+
+        The related quizzes are looked up once per concept. Looking them up generates the quizzes of the concept and its
+        examples, so the related quizzes do not change afterwards.
+        """
+        if quiz.concept not in self.__related_quizzes:
+            examples = quiz.concept.get_related_concepts("example")
+            self.__related_quizzes[quiz.concept] = Quizzes.from_iterables(
+                self.by_concept(quiz.concept), *(self.by_concept(example) for example in examples)
+            )
+        return self.__related_quizzes[quiz.concept]
+
+
+class LazyQuizSource(QuizSource):
+    """Source of quizzes that generates the quizzes of a concept when they are first needed.
+
+    To allow the progress scheduler to pick the same quizzes as when all quizzes are generated up front, the source
+    can tell which concepts may have quizzes with a given key or label, without generating quizzes. For this, the
+    source uses the fact that the question of a quiz is a label (or cloze test) of the quiz's concept and that the
+    answers of a quiz are labels of the quiz's concept or its related concepts.
+
+    If a completion callback is passed, the source calls it with all quizzes once the quizzes of all concepts have been
+    generated.
+    """
+
+    def __init__(
+        self,
+        language_pair: LanguagePair,
+        concepts: Iterable[Concept],
+        generate: Callable[[Concept], Iterable[Quiz]],
+        on_complete: Callable[[Quizzes], None] | None = None,
+    ) -> None:
+        super().__init__()
+        self.languages = (language_pair.target, language_pair.source)
+        # The (question language, answer language) pairs of the quizzes, these are the first two parts of quiz keys:
+        self.directions = {
+            (quiz_type.direction.question_language(language_pair), quiz_type.direction.answer_language(language_pair))
+            for quiz_type in FACTORY_QUIZ_TYPES
+        }
+        self.__generate = generate
+        self.__on_complete = on_complete
+        self.__pending = dict.fromkeys(concepts)  # The concepts whose quizzes have not been generated yet
+        self.__concepts_by_question: dict[tuple[str, str], list[Concept]] | None = None
+        self.__concepts_by_label: dict[tuple[str, str], list[Concept]] | None = None
+        self.__lower_bounds: list[tuple[str, int, Concept]] | None = None
+
+    @property
+    def complete(self) -> bool:
+        """Override to return whether the quizzes of all concepts have been generated."""
+        return not self.__pending
+
+    def generate(self, *concepts: Concept) -> None:
+        """Generate the quizzes of the concepts, unless they have been generated before."""
+        for concept in concepts:
+            if concept in self.__pending:
+                del self.__pending[concept]
+                self._add(Quizzes(self.__generate(concept)), concept)
+        if self.__on_complete and not self.__pending:
+            on_complete, self.__on_complete = self.__on_complete, None
+            on_complete(self.quizzes)
+
+    def generate_all(self) -> None:
+        """Override to generate the quizzes of all concepts not generated so far."""
+        self.generate(*self.__pending)
+
+    def generate_concepts_with_keys(self, *keys: str) -> None:
+        """Override to generate the quizzes of the concepts that may have quizzes with the keys."""
+        concepts_by_question = self.__question_index()
+        for key in keys:
+            question_language, _, rest = key.partition(":")
+            rest = rest.partition(":")[2]  # Skip the answer language
+            # The question may contain colons, so try each colon in the rest of the key as end of the question:
+            for index, character in enumerate(rest):
+                if character == ":":
+                    self.generate(*concepts_by_question.get((question_language, rest[:index]), []))
+
+    def generate_next_concept(self, below_key: str | None = None) -> bool:
+        """Override to generate the quizzes of the concept with the lowest quiz key lower bound."""
+        lower_bounds = self.__lower_bound_heap()
+        while lower_bounds and lower_bounds[0][-1] not in self.__pending:
+            heapq.heappop(lower_bounds)  # Skip concepts generated in the mean time
+        if not lower_bounds or (below_key is not None and lower_bounds[0][0] >= below_key):
+            return False
+        self.generate(heapq.heappop(lower_bounds)[-1])
+        return True
+
+    def by_concept(self, concept: Concept) -> Quizzes:
+        """Extend to generate the quizzes of the concept first."""
+        self.generate(concept)
+        return super().by_concept(concept)
+
+    def by_label(self, label: Label) -> Quizzes:
+        """Extend to generate the quizzes of the concepts that may have quizzes for the label first."""
+        if self.__pending:
+            self.generate(*self.__label_index().get((label.language, str(label)), []))
+        return super().by_label(label)
+
+    def __question_index(self) -> dict[tuple[str, str], list[Concept]]:
+        """Return the concepts by the (language, text) of the labels that can be the question of their quizzes."""
+        if self.__concepts_by_question is None:
+            self.__concepts_by_question = {}
+            for concept in self.__pending:
+                for question in self.__questions(concept):
+                    self.__concepts_by_question.setdefault((question.language, str(question)), []).append(concept)
+        return self.__concepts_by_question
+
+    def __label_index(self) -> dict[tuple[str, str], list[Concept]]:
+        """Return the concepts by the (language, text) of the labels that can be part of their quizzes."""
+        if self.__concepts_by_label is None:
+            self.__concepts_by_label = {}
+            for concept in self.__pending:
+                labels = self.__labels(concept)
+                for related_concept in self.__answer_concepts(concept):
+                    labels += self.__labels(related_concept)
+                for label in labels:
+                    self.__concepts_by_label.setdefault((label.language, str(label)), []).append(concept)
+        return self.__concepts_by_label
+
+    def __lower_bound_heap(self) -> list[tuple[str, int, Concept]]:
+        """Return a heap of the lower bounds of the quiz keys of the concepts not generated so far.
+
+        A quiz key starts with the question language, the answer language, and the question, so the lowest of those
+        prefixes over the possible questions of a concept is a lower bound for the keys of the concept's quizzes.
+        Concepts without possible questions have no quizzes and are left out.
+        """
+        if self.__lower_bounds is None:
+            self.__lower_bounds = []
+            for index, concept in enumerate(self.__pending):
+                prefixes = [
+                    f"{question_language}:{answer_language}:{question}"
+                    for question in self.__questions(concept)
+                    for question_language, answer_language in self.directions
+                    if question.language == question_language
+                ]
+                if prefixes:
+                    self.__lower_bounds.append((min(prefixes), index, concept))
+            heapq.heapify(self.__lower_bounds)
+        return self.__lower_bounds
+
+    def __questions(self, concept: Concept) -> Labels:
+        """Return the labels that can be the question of the concept's quizzes."""
+        labels = Labels(label for label in concept.all_labels if label.language in self.languages)
+        return labels + labels.cloze_tests
+
+    def __labels(self, concept: Concept) -> Labels:
+        """Return the labels that can be part of the concept's quizzes, including spelling alternatives."""
+        questions = self.__questions(concept)
+        return questions + questions.spelling_alternatives
+
+    @staticmethod
+    def __answer_concepts(concept: Concept) -> list[Concept]:
+        """Return the related concepts whose labels can be the answers of the concept's quizzes."""
+        return [related for relation in ANSWER_RELATIONS for related in concept.get_related_concepts(relation)]
@@ -7,13 +7,15 @@ import re
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from enum import Enum, auto
-from itertools import chain, permutations
+from functools import cache
+from itertools import chain
 from typing import ClassVar, final
 
 from toisto.model.language import Language, LanguagePair
 from toisto.model.language.concept import Concept, ConceptRelation
+from toisto.model.language.grammatical_category import grammatical_categories_from_mask
 from toisto.model.language.iana_language_subtag_registry import ALL_LANGUAGES
-from toisto.model.language.label import Label, Labels
+from toisto.model.language.label import GrammaticalSiblings, Label, Labels
 from toisto.tools import first
 from toisto.ui.dictionary import linkified
 from toisto.ui.format import quoted
@@ -240,12 +242,15 @@ class GrammaticalQuizType(QuizType):
         self, language_pair: LanguagePair, concept: Concept
     ) -> Iterable[tuple[Label, Labels, QuizAction]]:
         """Generate the questions and answers for each question."""
-        results = []
         question_language = self.direction.question_language(language_pair)
-        for question, answer in permutations(concept.labels(question_language).non_colloquial, r=2):
-            if self._include_pair(question, answer) and (action := self.grammatical_quiz_action(question, answer)):
-                results.append((question, Labels((answer,)), action))
-        return results
+        labels = concept.labels(question_language).non_colloquial
+        grammatical_siblings = GrammaticalSiblings(labels)
+        return [
+            (question, Labels((answer,)), action)
+            for question in labels
+            for answer in grammatical_siblings.siblings(question)
+            if self._include_pair(question, answer) and (action := self.grammatical_quiz_action(question, answer))
+        ]
 
     def blocked_by(self, quiz_type: QuizType) -> bool:
         """Return whether this quiz type is blocked by the given quiz type."""
@@ -253,8 +258,8 @@ class GrammaticalQuizType(QuizType):
 
     @staticmethod
     def _include_pair(question: Label, answer: Label) -> bool:
-        """Return whether to include a (question, answer) pair as a grammatical quiz."""
-        return question.has_same_grammatical_base(answer) and not question.is_homograph(answer)
+        """Return whether to include a (question, answer) pair of grammatical siblings as a grammatical quiz."""
+        return question is not answer and not question.is_homograph(answer)
 
     def _include_grammatical_notes(self) -> bool:
         """Return whether to include the grammatical notes for the grammatical categories."""
@@ -269,10 +274,17 @@ class GrammaticalQuizType(QuizType):
         complex ("Give the affirmative past tense plural third person...") we only combine actions when all of them
         come from COMBINABLE_ACTIONS; otherwise the quiz requires a single action.
         """
+        return cls._grammatical_quiz_action(
+            label1.grammatical_form.grammatical_differences_mask(label2.grammatical_form)
+        )
+
+    @classmethod
+    @cache
+    def _grammatical_quiz_action(cls, grammatical_differences_mask: int) -> QuizAction | None:
+        """Return the quiz action for the grammatical differences, encoded as bitmask."""
+        grammatical_differences = grammatical_categories_from_mask(grammatical_differences_mask)
         quiz_actions = {
-            quiz_type.action
-            for quiz_type in GRAMMATICAL_QUIZ_TYPES
-            if quiz_type.action in label2.grammatical_differences(label1)
+            quiz_type.action for quiz_type in GRAMMATICAL_QUIZ_TYPES if quiz_type.action in grammatical_differences
         }
         if quiz_actions <= cls.COMBINABLE_ACTIONS and len(quiz_actions) > 1:
             return " ".join(sorted(quiz_actions))
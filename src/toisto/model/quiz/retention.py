@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from math import e, log
@@ -23,6 +24,20 @@ SKIP_INTERVAL_WHEN_FIRST_ANSWER_IS_CORRECT: Final = timedelta(days=1)
 SKIP_INTERVAL_WHEN_RELATED_QUIZ_IS_ANSWERED_CORRECTLY: Final = timedelta(minutes=5)
 
 
+def system_clock() -> datetime:
+    """Return the current datetime in the local timezone."""
+    return datetime.now().astimezone()
+
+
+# The clock that tells the current datetime. Can be replaced, for example to simulate practicing over a long period:
+clock: Callable[[], datetime] = system_clock
+
+
+def now() -> datetime:
+    """Return the current datetime according to the clock."""
+    return clock()
+
+
 @dataclass
 class Retention:
     """Class to keep track of the retention of one quiz."""
@@ -35,14 +50,14 @@ class Retention:
     def increase(self) -> None:
         """Increase the retention of the quiz after a correct answer."""
         self.count += 1
-        self.end = now = datetime.now().astimezone()
+        self.end = current_datetime = now()
         if self.start is None:
-            self.start = now
+            self.start = current_datetime
         if self.count == 1:
-            self.skip_until = now + SKIP_INTERVAL_WHEN_FIRST_ANSWER_IS_CORRECT
-        elif now > self.start:
-            retention_period = now - self.start
-            self.skip_until = now + retention_period * self.__growth_factor(retention_period)
+            self.skip_until = current_datetime + SKIP_INTERVAL_WHEN_FIRST_ANSWER_IS_CORRECT
+        elif current_datetime > self.start:
+            retention_period = current_datetime - self.start
+            self.skip_until = current_datetime + retention_period * self.__growth_factor(retention_period)
         else:
             self.skip_until = None
 
@@ -66,12 +81,6 @@ class Retention:
         ratio = retention_period / SKIP_INTERVAL_DAMPING_TIMESCALE  # dimensionless: how many "timescales" long
         return SKIP_INTERVAL_MAX_GROWTH_FACTOR / log(e + ratio)
 
-    def pause(self) -> None:
-        """Pause this quiz for a brief while because a related quiz was answered correctly."""
-        now = datetime.now().astimezone()
-        current_skip_until = self.skip_until or now
-        self.skip_until = max(current_skip_until, now + SKIP_INTERVAL_WHEN_RELATED_QUIZ_IS_ANSWERED_CORRECTLY)
-
     def reset(self) -> None:
         """Reset the retention of the quiz after an incorrect answer."""
         self.count += 1
@@ -84,7 +93,7 @@ class Retention:
 
     def is_silenced(self) -> bool:
         """Return whether the quiz is silenced."""
-        return self.skip_until > datetime.now().astimezone() if self.skip_until else False
+        return self.skip_until > now() if self.skip_until else False
 
     def as_dict(self) -> RetentionDict:
         """Return the retention as dict."""
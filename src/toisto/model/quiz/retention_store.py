@@ -0,0 +1,202 @@
+"""Retention store."""
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from math import isnan, nan
+from typing import cast
+
+from toisto.persistence.progress_format import RetentionDict
+from toisto.persistence.progress_snapshot import ProgressSnapshot
+
+from .retention import Retention
+
+
+class RetentionStore:
+    """Store the retention of quizzes in columns, indexed by quiz id.
+
+    Datetimes are stored as seconds since the epoch, with NaN meaning no datetime. The retention dicts the store was
+    loaded with are kept until the retention of a quiz changes, so unchanged retentions need not be formatted again
+    when the progress is saved. Loaded retention dicts are decoded when the retention is first needed, so retentions
+    of quizzes that are not practiced are never decoded. The store also keeps track of the quizzes whose retention
+    changed, and their counts before they changed, so the changes can be saved without saving all retentions and can be
+    merged with the retentions saved by other sessions.
+    """
+
+    def __init__(self) -> None:
+        self.__count = array("q")
+        self.__start = array("d")
+        self.__end = array("d")
+        self.__skip_until = array("d")
+        self.__retention_dicts: dict[int, RetentionDict | None] = {}  # The quiz ids in the store and their dicts
+        self.__changed_quiz_ids: set[int] = set()
+        self.__base_counts: dict[int, int] = {}  # The counts of the changed quizzes before they changed
+        self.__undecoded_quiz_ids: set[int] = set()  # Quizzes whose retention dict has not been decoded yet
+
+    def __contains__(self, quiz_id: int) -> bool:
+        """Return whether the store has a retention for the quiz."""
+        return quiz_id in self.__retention_dicts
+
+    def __iter__(self) -> Iterator[int]:
+        """Return the ids of the quizzes that the store has a retention for."""
+        return iter(self.__retention_dicts)
+
+    def load(self, quiz_id: int, retention_dict: RetentionDict) -> None:
+        """Load the retention of the quiz from its retention dict. The dict is decoded when the retention is needed."""
+        self.__retention_dicts[quiz_id] = retention_dict
+        self.__undecoded_quiz_ids.add(quiz_id)
+
+    def load_snapshot(self, snapshot: ProgressSnapshot, rows: dict[int, int]) -> None:
+        """Load the retentions of the quizzes from the rows of the snapshot, given as rows by quiz id.
+
+        The snapshot stores datetimes as timestamps too, so the retentions are copied without parsing datetimes.
+        """
+        self.__make_room(max(rows, default=-1))
+        self.__undecoded_quiz_ids.difference_update(rows)
+        for quiz_id, row in rows.items():
+            self.__count[quiz_id] = snapshot.count[row]
+            self.__start[quiz_id] = snapshot.start[row]
+            self.__end[quiz_id] = snapshot.end[row]
+            self.__skip_until[quiz_id] = snapshot.skip_until[row]
+            self.__retention_dicts[quiz_id] = None
+
+    def put(self, quiz_id: int, retention: Retention) -> None:
+        """Store the retention of the quiz."""
+        self.__changing(quiz_id)
+        self.__make_room(quiz_id)
+        self.__count[quiz_id] = retention.count
+        self.__start[quiz_id] = self.__timestamp(retention.start)
+        self.__end[quiz_id] = self.__timestamp(retention.end)
+        self.__skip_until[quiz_id] = self.__timestamp(retention.skip_until)
+        self.__retention_dicts[quiz_id] = None
+
+    def pause(self, quiz_ids: Iterable[int], until: float) -> None:
+        """Silence the quizzes until the timestamp, unless they are silenced longer already."""
+        for quiz_id in quiz_ids:
+            self.__changing(quiz_id)
+            if quiz_id not in self.__retention_dicts:
+                self.__make_room(quiz_id)
+                self.__count[quiz_id] = 0
+                self.__start[quiz_id] = self.__end[quiz_id] = self.__skip_until[quiz_id] = nan
+            if not self.__skip_until[quiz_id] >= until:  # Also true if NaN
+                self.__skip_until[quiz_id] = until
+            self.__retention_dicts[quiz_id] = None
+
+    def merge(self, quiz_id: int, retention_dict: RetentionDict) -> None:
+        """Merge the retention of the quiz as saved by another session since this session loaded or saved it.
+
+        If the retention did not change in this session, the other retention replaces it. Otherwise, the presentations
+        of both sessions are added up and the quiz is silenced until the latest of both datetimes.
+        """
+        if quiz_id not in self.__changed_quiz_ids:
+            self.load(quiz_id, retention_dict)
+            return
+        other_count = int(retention_dict.get("count", 0))
+        self.__count[quiz_id] += other_count - self.__base_counts[quiz_id]
+        self.__base_counts[quiz_id] = other_count
+        other_skip_until = self.__parse(retention_dict.get("skip_until"))
+        if not isnan(other_skip_until) and not self.__skip_until[quiz_id] >= other_skip_until:  # Also true if NaN
+            self.__skip_until[quiz_id] = other_skip_until
+
+    def remove(self, quiz_id: int) -> None:
+        """Remove the retention of the quiz."""
+        del self.__retention_dicts[quiz_id]
+        self.__changed_quiz_ids.discard(quiz_id)
+        self.__base_counts.pop(quiz_id, None)
+        self.__undecoded_quiz_ids.discard(quiz_id)
+
+    def get(self, quiz_id: int) -> Retention:
+        """Return the retention of the quiz."""
+        if quiz_id not in self.__retention_dicts:
+            return Retention()
+        self.__decode(quiz_id)
+        start = self.__datetime(self.__start[quiz_id])
+        end = self.__datetime(self.__end[quiz_id])
+        skip_until = self.__datetime(self.__skip_until[quiz_id])
+        return Retention(start, end, skip_until, self.__count[quiz_id])
+
+    def count(self, quiz_id: int) -> int:
+        """Return the number of times the quiz was presented."""
+        self.__decode(quiz_id)
+        return self.__count[quiz_id] if quiz_id in self.__retention_dicts else 0
+
+    def skip_until(self, quiz_id: int) -> float:
+        """Return the timestamp until which the quiz is silenced, or NaN if the quiz is not silenced."""
+        self.__decode(quiz_id)
+        return self.__skip_until[quiz_id] if quiz_id in self.__retention_dicts else nan
+
+    def as_dict(self) -> dict[int, RetentionDict]:
+        """Return the retention dicts by quiz id."""
+        return {quiz_id: self.__retention_dict(quiz_id) for quiz_id in self.__retention_dicts}
+
+    def snapshot(self, key: Callable[[int], str]) -> ProgressSnapshot:
+        """Return a snapshot of the retentions, using the key function to get the key of each quiz id."""
+        for quiz_id in list(self.__undecoded_quiz_ids):
+            self.__decode(quiz_id)
+        quiz_ids = list(self.__retention_dicts)
+        return ProgressSnapshot(
+            [key(quiz_id) for quiz_id in quiz_ids],
+            array("q", (self.__count[quiz_id] for quiz_id in quiz_ids)),
+            *(
+                array("d", (column[quiz_id] for quiz_id in quiz_ids))
+                for column in (self.__start, self.__end, self.__skip_until)
+            ),
+        )
+
+    def changed(self) -> list[int]:
+        """Return the ids of the quizzes whose retention changed since the previous call of pop_changes()."""
+        return sorted(self.__changed_quiz_ids)
+
+    def pop_changes(self) -> dict[int, RetentionDict]:
+        """Return the retention dicts of the quizzes whose retention changed since the previous call, by quiz id."""
+        changes = {quiz_id: self.__retention_dict(quiz_id) for quiz_id in self.changed()}
+        self.__changed_quiz_ids.clear()
+        self.__base_counts.clear()
+        return changes
+
+    def __retention_dict(self, quiz_id: int) -> RetentionDict:
+        """Return the retention dict of the quiz, formatting it if the retention changed since it was formatted."""
+        if (retention_dict := self.__retention_dicts[quiz_id]) is None:
+            retention_dict = self.__retention_dicts[quiz_id] = self.get(quiz_id).as_dict()
+        return retention_dict
+
+    def __changing(self, quiz_id: int) -> None:
+        """Mark the retention of the quiz as changed, remembering its count before the first change."""
+        if quiz_id not in self.__changed_quiz_ids:
+            self.__base_counts[quiz_id] = self.count(quiz_id)
+            self.__changed_quiz_ids.add(quiz_id)
+
+    def __decode(self, quiz_id: int) -> None:
+        """Decode the retention dict the quiz was loaded with into the columns, if not decoded yet."""
+        if quiz_id not in self.__undecoded_quiz_ids:
+            return
+        retention_dict = cast("RetentionDict", self.__retention_dicts[quiz_id])  # Loaded retention dicts are not None
+        self.__make_room(quiz_id)
+        self.__count[quiz_id] = int(retention_dict.get("count", 0))
+        self.__start[quiz_id] = self.__parse(retention_dict.get("start"))
+        self.__end[quiz_id] = self.__parse(retention_dict.get("end"))
+        self.__skip_until[quiz_id] = self.__parse(retention_dict.get("skip_until"))
+        self.__undecoded_quiz_ids.remove(quiz_id)
+
+    def __make_room(self, quiz_id: int) -> None:
+        """Extend the columns so they have room for the quiz."""
+        if quiz_id >= len(self.__count):
+            extension = quiz_id + 1 - len(self.__count)
+            self.__count.extend([0] * extension)
+            for column in (self.__start, self.__end, self.__skip_until):
+                column.extend([nan] * extension)
+
+    @staticmethod
+    def __parse(value: object) -> float:
+        """Return the ISO formatted datetime as timestamp. Naive datetimes are in the local timezone."""
+        return datetime.fromisoformat(str(value)).timestamp() if value else nan
+
+    @staticmethod
+    def __timestamp(value: datetime | None) -> float:
+        """Return the datetime as timestamp."""
+        return nan if value is None else value.timestamp()
+
+    @staticmethod
+    def __datetime(timestamp: float) -> datetime | None:
+        """Return the timestamp as datetime in the local timezone."""
+        return None if isnan(timestamp) else datetime.fromtimestamp(timestamp).astimezone()
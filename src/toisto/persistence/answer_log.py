@@ -0,0 +1,49 @@
+"""Log the answers of the user."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from threading import Lock
+from typing import cast
+
+from toisto.model.quiz.evaluation import Evaluation
+from toisto.model.quiz.retention import now
+
+from .json_file import append_json_lines, iter_json_lines
+from .progress_format import AnswerDict
+
+
+class AnswerLog:
+    """Log of the answers of the user, in a file with one JSON object per answer per line.
+
+    Answers are kept in memory until the log is flushed, so logging an answer does not wait for the disk. The progress
+    writer flushes the log in the background.
+    """
+
+    def __init__(self, answer_log_filepath: Path) -> None:
+        self.__filepath = answer_log_filepath
+        self.__answers: list[AnswerDict] = []
+        self.__lock = Lock()
+
+    def log(self, quiz_key: str, evaluation: Evaluation, attempt: int, latency: float) -> None:
+        """Log the answer."""
+        answer = AnswerDict(
+            quiz=quiz_key,
+            evaluation=evaluation.value,
+            attempt=attempt,
+            latency=round(latency, 3),
+            timestamp=now().isoformat(timespec="milliseconds"),
+        )
+        with self.__lock:
+            self.__answers.append(answer)
+
+    def flush(self) -> None:
+        """Append the answers logged since the previous flush to the file."""
+        with self.__lock:
+            answers, self.__answers = self.__answers, []
+        if answers:
+            append_json_lines(self.__filepath, answers)
+
+
+def iter_answers(answer_log_filepath: Path) -> Iterator[AnswerDict]:
+    """Yield the answers in the answer log, reading one answer at a time."""
+    return (cast("AnswerDict", answer) for answer in iter_json_lines(answer_log_filepath))
@@ -0,0 +1,62 @@
+"""Cache derived data in files so it need not be recomputed each time Toisto starts."""
+
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+
+from toisto.metadata import NAME, VERSION
+
+from .folder import home
+from .json_file import dump_json, load_json
+
+CACHE_FOLDER = home() / f".{NAME.lower()}-cache"
+
+
+def cache_key(*parts: str, paths: tuple[Path, ...] = ()) -> str:
+    """Return a key that changes when the Toisto version, one of the parts, or one of the files changes.
+
+    Files are compared by size and modification time, so the files don't need to be read to compute the key. If a path
+    is a folder, the JSON files in the folder are used.
+    """
+    digest = sha256()
+    for part in (VERSION, *parts, *(_file_signature(path) for path in _file_paths(*paths))):
+        digest.update(f"{part}\n".encode())
+    return digest.hexdigest()
+
+
+def load_cache(name: str, key: str) -> dict | None:
+    """Return the cached contents if the cache exists and was created with the same key, otherwise None."""
+    try:
+        cache = load_json(get_cache_filepath(name), default={})
+    except (OSError, ValueError):
+        return None  # The cache is corrupt or unreadable, treat it as missing so it gets rebuilt
+    return cache.get("contents") if cache.get("key") == key else None
+
+
+def dump_cache(name: str, key: str, contents: dict) -> None:
+    """Save the contents in the cache. Failing to write the cache is not an error, so it is ignored."""
+    with suppress(OSError):
+        CACHE_FOLDER.mkdir(parents=True, exist_ok=True)
+        dump_json(get_cache_filepath(name), {"key": key, "contents": contents})
+
+
+def get_cache_filepath(name: str) -> Path:
+    """Return the file path of the cache with the given name."""
+    return CACHE_FOLDER / f"{name}.json"
+
+
+def _file_paths(*paths: Path) -> list[Path]:
+    """Return the file paths, replacing folders with the JSON files they contain."""
+    file_paths: list[Path] = []
+    for path in paths:
+        file_paths.extend(sorted(path.rglob("*.json")) if path.is_dir() else [path])
+    return file_paths
+
+
+def _file_signature(path: Path) -> str:
+    """Return a signature of the file that changes when the file changes."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return f"{path}:missing"
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
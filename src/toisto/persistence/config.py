@@ -58,7 +58,11 @@ CONFIG_SCHEMA: Final[dict[str, dict[str, Option] | list[str]]] = {
         "progress_update": Option(Quantifier.INTEGER, ["0", "1", "2", "3", "..."], "0", lambda value: value.isdigit()),
         "show_quiz_retention": Option(Quantifier.ONE_OF, ["no", "yes"], "no"),
     },
-    "progress": {"folder": Option(Quantifier.ANY, default_value=str(home()))},
+    "progress": {
+        "folder": Option(Quantifier.ANY, default_value=str(home())),
+        "backend": Option(Quantifier.ONE_OF, ["json", "sqlite", "binary"], "json"),
+        "answer_log": Option(Quantifier.ONE_OF, ["no", "yes"], "no"),
+    },
     "identity": {"uuid": Option(Quantifier.ANY, default_value=str(uuid1()))},
     "files": [],
 }
@@ -0,0 +1,31 @@
+"""Advisory file locks."""
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def locked(lock_filepath: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on the lock file, waiting until other processes have released it.
+
+    The lock is advisory, so it only keeps out processes that lock the same lock file.
+    """
+    with lock_filepath.open("ab") as lock_file:
+        if sys.platform == "win32":  # pragma: no cover
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield  # Closing the lock file releases the lock
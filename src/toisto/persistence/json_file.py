@@ -3,8 +3,9 @@
 import errno
 import json
 import os
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
-from typing import cast
+from typing import BinaryIO, cast
 
 from toisto.metadata import ENCODING
 
@@ -20,6 +21,78 @@ def load_json(json_file_path: Path, default: dict | None = None) -> dict:
 
 
 def dump_json(json_file_path: Path, contents: dict | list) -> None:
-    """Dump the JSON into the file."""
-    with json_file_path.open("w", encoding=ENCODING) as json_file:
+    """Dump the JSON into the file.
+
+    The JSON is written to a temporary file that then replaces the file, so the file is either written completely or
+    not changed at all, even if writing is interrupted.
+    """
+    temporary_file_path = json_file_path.with_name(f"{json_file_path.name}.tmp")
+    with temporary_file_path.open("w", encoding=ENCODING) as json_file:
         json.dump(contents, json_file)
+        json_file.flush()
+        os.fsync(json_file.fileno())
+    temporary_file_path.replace(json_file_path)
+
+
+def load_json_lines(json_lines_file_path: Path, offset: int = 0) -> list[dict]:
+    """Load the JSON objects from the file with one JSON object per line. Return an empty list if there's no file.
+
+    If an offset is given, load the JSON objects after the offset only. A last line without line ending was not
+    written completely, so it is ignored. Lines that cannot be decoded were torn by an earlier crash, so they are
+    skipped.
+    """
+    if not json_lines_file_path.exists():
+        return []
+    with json_lines_file_path.open(encoding=ENCODING) as json_lines_file:
+        json_lines_file.seek(offset)
+        lines = json_lines_file.read().split("\n")
+    return list(_decode_json_lines(lines[:-1]))
+
+
+def append_json_line(json_lines_file_path: Path, contents: dict) -> None:
+    """Append the JSON object as one line to the file."""
+    append_json_lines(json_lines_file_path, [contents])
+
+
+def append_json_lines(json_lines_file_path: Path, contents: Iterable[Mapping[str, object]]) -> None:
+    """Append the JSON objects to the file, one per line, with one write so the lines are not interleaved.
+
+    If the last line of the file was not written completely, start a new line first so the appended lines are not
+    glued to the torn line.
+    """
+    lines = "".join(json.dumps(json_object) + "\n" for json_object in contents)
+    with json_lines_file_path.open("ab+") as json_lines_file:
+        if _ends_with_incomplete_line(json_lines_file):
+            lines = "\n" + lines
+        json_lines_file.write(lines.encode(ENCODING))
+        json_lines_file.flush()
+        os.fsync(json_lines_file.fileno())
+
+
+def iter_json_lines(json_lines_file_path: Path) -> Iterator[dict]:
+    """Yield the JSON objects from the file with one JSON object per line, reading one line at a time.
+
+    Yield nothing if there's no file. A last line without line ending was not written completely, so it is ignored.
+    Lines that cannot be decoded were torn by an earlier crash, so they are skipped.
+    """
+    if not json_lines_file_path.exists():
+        return
+    with json_lines_file_path.open(encoding=ENCODING) as json_lines_file:
+        yield from _decode_json_lines(line for line in json_lines_file if line.endswith("\n"))
+
+
+def _decode_json_lines(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield the JSON objects from the lines, skipping lines that cannot be decoded."""
+    for line in lines:
+        try:
+            yield cast("dict", json.loads(line))
+        except json.JSONDecodeError:
+            continue
+
+
+def _ends_with_incomplete_line(json_lines_file: BinaryIO) -> bool:
+    """Return whether the file is not empty and does not end with a line ending."""
+    if json_lines_file.seek(0, os.SEEK_END) == 0:
+        return False
+    json_lines_file.seek(-1, os.SEEK_END)
+    return json_lines_file.read(1) != b"\n"
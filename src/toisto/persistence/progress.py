@@ -1,16 +1,49 @@
 """Store and load progress data."""
 
+import sqlite3
 from argparse import ArgumentParser
+from collections.abc import Callable, Collection, Iterator
 from configparser import ConfigParser
+from contextlib import closing
+from dataclasses import dataclass
 from pathlib import Path
+from threading import Event, Thread
+from typing import Final, NoReturn
+from weakref import WeakKeyDictionary
 
 from toisto.metadata import NAME
 from toisto.model.language import Language
 from toisto.model.quiz.progress import Progress
 from toisto.model.quiz.quiz import Quizzes
+from toisto.model.quiz.quiz_source import QuizSource
 
-from .json_file import dump_json, load_json
-from .progress_format import ProgressDict, RetentionDict
+from .answer_log import AnswerLog, iter_answers
+from .cache import cache_key, dump_cache, load_cache
+from .file_lock import locked
+from .json_file import append_json_line, dump_json, load_json, load_json_lines
+from .progress_database import ProgressDatabase
+from .progress_format import AnswerDict, PausesCacheEntry, ProgressDict, RetentionDict
+from .progress_snapshot import (
+    ProgressSnapshot,
+    dump_progress_snapshot,
+    load_progress_snapshot,
+    load_progress_snapshot_rows,
+)
+
+type FileStamp = tuple[int, int, int]  # The inode, modification time, and size of a file
+
+
+@dataclass(frozen=True)
+class JournalPosition:
+    """The state of the progress file or snapshot, and of its journal, when a session last loaded or saved them."""
+
+    progress_file: FileStamp | None
+    journal_size: int
+
+
+# The journal positions of the progress loaded or saved by this session, so changes saved by other sessions of this
+# device can be merged without loading the complete progress again:
+JOURNAL_POSITIONS: Final[WeakKeyDictionary[Progress, JournalPosition]] = WeakKeyDictionary()
 
 
 def get_progress_filepath(target_language: Language, folder: Path, uuid: str = "") -> Path:
@@ -19,53 +52,485 @@ def get_progress_filepath(target_language: Language, folder: Path, uuid: str = "
 
 
 def get_progress_filepaths(target_language: Language, folder: Path) -> list[Path]:
-    """Return the filenames of the progress files for the specified language in the folder."""
-    return list(folder.glob(f".{NAME.lower()}*-progress-{target_language}.json"))
+    """Return the filenames of the progress files, databases, and snapshots for the specified language in the folder."""
+    filepaths = folder.glob(f".{NAME.lower()}*-progress-{target_language}.*")
+    return [filepath for filepath in filepaths if filepath.suffix in (".json", ".db", ".bin")]
+
+
+def get_database_filepath(progress_filepath: Path) -> Path:
+    """Return the filename of the progress database that replaces the progress file when using the SQLite backend."""
+    return progress_filepath.with_suffix(".db")
+
+
+def get_snapshot_filepath(progress_filepath: Path) -> Path:
+    """Return the filename of the progress snapshot that replaces the progress file when using the binary backend."""
+    return progress_filepath.with_suffix(".bin")
+
+
+def get_archive_filepath(progress_filepath: Path) -> Path:
+    """Return the filename of the archive with progress on quizzes that Toisto does not generate anymore."""
+    return progress_filepath.with_suffix(".archive")
+
+
+def get_journal_filepath(progress_filepath: Path) -> Path:
+    """Return the filename of the journal with the progress changes not yet saved in the progress file."""
+    return progress_filepath.with_suffix(".journal")
+
+
+def get_answer_log_filepath(progress_filepath: Path) -> Path:
+    """Return the filename of the answer log with the answers of the user, if the user enabled the answer log."""
+    return progress_filepath.with_suffix(".answers")
+
+
+def get_lock_filepath(progress_filepath: Path) -> Path:
+    """Return the filename of the lock file that sessions lock while loading or saving the progress file."""
+    return progress_filepath.with_suffix(".lock")
 
 
 def load_progress(
-    target_language: Language, quizzes: Quizzes, argument_parser: ArgumentParser, config: ConfigParser
+    target_language: Language,
+    quizzes: Quizzes | QuizSource,
+    argument_parser: ArgumentParser,
+    config: ConfigParser,
+    keys: Collection[str] | None = None,
 ) -> Progress:
-    """Load the progress from the configured progress folder."""
+    """Load the progress from the configured progress folder.
+
+    If keys are passed, only load the progress of the quizzes with those keys. The SQLite backend then only queries
+    the rows of those quizzes and the binary backend only reads their rows from the snapshot.
+    """
     folder = Path(config["progress"]["folder"])
     uuid = config["identity"]["uuid"]
     progress_filepath = get_progress_filepath(target_language, folder, uuid)
-    progress_dict = load_progress_file(progress_filepath, argument_parser)
-    progress_filepaths = get_progress_filepaths(target_language, folder)
-    other_progress_dicts = [
-        load_progress_file(other_progress_filepath, argument_parser)
-        for other_progress_filepath in progress_filepaths
-        if other_progress_filepath != progress_filepath
+    database_filepath = get_database_filepath(progress_filepath)
+    snapshot_filepath = get_snapshot_filepath(progress_filepath)
+    journal_filepath = get_journal_filepath(progress_filepath)
+    snapshot, position = None, None
+    match config["progress"]["backend"]:
+        case "sqlite":
+            if not database_filepath.exists() and not progress_filepath.exists() and snapshot_filepath.exists():
+                with locked(get_lock_filepath(progress_filepath)):
+                    export_progress_snapshot(snapshot_filepath, progress_filepath, argument_parser)
+            progress_dict = load_progress_database(database_filepath, progress_filepath, argument_parser, keys)
+        case "binary":
+            with locked(get_lock_filepath(progress_filepath)):
+                if not snapshot_filepath.exists() and not progress_filepath.exists() and database_filepath.exists():
+                    export_progress_database(database_filepath, progress_filepath, argument_parser)
+                snapshot, progress_dict = load_progress_snapshot_file(
+                    snapshot_filepath, progress_filepath, argument_parser, keys
+                )
+                position = journal_position(snapshot_filepath, journal_filepath)
+        case _:
+            with locked(get_lock_filepath(progress_filepath)):
+                if not progress_filepath.exists() and snapshot_filepath.exists():
+                    export_progress_snapshot(snapshot_filepath, progress_filepath, argument_parser)
+                elif not progress_filepath.exists() and database_filepath.exists():
+                    export_progress_database(database_filepath, progress_filepath, argument_parser)
+                progress_dict = load_progress_file(progress_filepath, argument_parser)
+                position = journal_position(progress_filepath, journal_filepath)
+    other_filepaths = [
+        filepath
+        for filepath in get_progress_filepaths(target_language, folder)
+        if filepath not in (progress_filepath, database_filepath, snapshot_filepath)
     ]
-    update_progress_dict(progress_dict, *other_progress_dicts)
-    return Progress(target_language, quizzes, progress_dict)
+    other_pauses = load_other_pauses(target_language, other_filepaths, argument_parser)
+    if snapshot:
+        copy_paused_retentions(progress_dict, snapshot, *other_pauses)
+    update_progress_dict(progress_dict, *other_pauses)
+    if keys is not None:
+        progress_dict = {key: retention_dict for key, retention_dict in progress_dict.items() if key in keys}
+    progress = Progress(target_language, quizzes, progress_dict, snapshot=snapshot)
+    if position:
+        JOURNAL_POSITIONS[progress] = position
+    return progress
+
+
+def load_other_pauses(
+    target_language: Language, filepaths: list[Path], argument_parser: ArgumentParser
+) -> list[ProgressDict]:
+    """Load the pauses from the progress files and progress databases of other devices.
+
+    Only the pauses are needed to take the progress of other devices into account. The pauses are cached per file,
+    with a key that changes when the file or its journal changes, so only files changed since the previous run are
+    loaded again.
+    """
+    if not filepaths:
+        return []
+    cache_name, key = f"progress-pauses-{target_language}", cache_key()
+    cache: dict[str, PausesCacheEntry] = load_cache(cache_name, key) or {}
+    entries: dict[str, PausesCacheEntry] = {}
+    for filepath in filepaths:
+        file_key = cache_key(paths=(filepath, get_journal_filepath(filepath)))
+        if (entry := cache.get(str(filepath))) is None or entry["key"] != file_key:
+            match filepath.suffix:
+                case ".db":
+                    pauses = load_pauses(filepath, argument_parser)
+                case ".bin":
+                    snapshot, changes = load_progress_snapshot_file(filepath, filepath, argument_parser)
+                    pauses = snapshot.pauses() | get_pauses(changes)
+                case _:
+                    pauses = get_pauses(load_progress_file(filepath, argument_parser))
+            entry = PausesCacheEntry(key=file_key, pauses=pauses)
+        entries[str(filepath)] = entry
+    if entries != cache:
+        dump_cache(cache_name, key, dict(entries))
+    return [entry["pauses"] for entry in entries.values()]
 
 
 def load_progress_file(progress_filepath: Path, argument_parser: ArgumentParser) -> ProgressDict:
-    """Load progress from one progress file."""
+    """Load progress from one progress file, and replay the changes in its journal."""
     try:
         progress_dict = load_json(progress_filepath, default={})
+        for changes in load_json_lines(get_journal_filepath(progress_filepath)):
+            progress_dict.update(changes)
     except Exception as reason:  # noqa: BLE001
-        return argument_parser.error(
-            f"""{NAME} cannot parse the progress information in {progress_filepath}: {reason}.
+        return progress_error(argument_parser, progress_filepath, reason)
+    return progress_dict
+
+
+def load_progress_snapshot_file(
+    snapshot_filepath: Path,
+    progress_filepath: Path,
+    argument_parser: ArgumentParser,
+    keys: Collection[str] | None = None,
+) -> tuple[ProgressSnapshot, ProgressDict]:
+    """Load the progress snapshot, or only the rows of the quizzes with the keys, and the changes in its journal.
+
+    If there's no snapshot yet, import the progress file first.
+    """
+    try:
+        if not snapshot_filepath.exists() and progress_filepath.exists():
+            import_progress_file(
+                progress_filepath,
+                lambda progress_dict: dump_progress_snapshot(
+                    snapshot_filepath, ProgressSnapshot.from_progress_dict(progress_dict)
+                ),
+                argument_parser,
+            )
+        if not snapshot_filepath.exists():
+            snapshot = ProgressSnapshot.from_progress_dict({})
+        elif keys is None:
+            snapshot = load_progress_snapshot(snapshot_filepath)
+        else:
+            snapshot = load_progress_snapshot_rows(snapshot_filepath, keys)
+        changes: ProgressDict = {}
+        for journal_changes in load_json_lines(get_journal_filepath(snapshot_filepath)):
+            changes.update(journal_changes)
+    except Exception as reason:  # noqa: BLE001
+        progress_error(argument_parser, snapshot_filepath, reason)
+    return snapshot, changes
+
+
+def export_progress_snapshot(snapshot_filepath: Path, progress_filepath: Path, argument_parser: ArgumentParser) -> None:
+    """Export the progress snapshot, including its journal, to a new progress file, and remove the snapshot."""
+    snapshot, changes = load_progress_snapshot_file(snapshot_filepath, progress_filepath, argument_parser)
+    dump_json(progress_filepath, snapshot.as_dict() | changes)
+    snapshot_filepath.unlink()
+    get_journal_filepath(snapshot_filepath).unlink(missing_ok=True)
+
+
+def copy_paused_retentions(progress_dict: ProgressDict, snapshot: ProgressSnapshot, *pauses: ProgressDict) -> None:
+    """Copy the retentions of quizzes paused on other devices from the snapshot into the progress dict.
+
+    Quizzes paused on other devices are not copied if their retention is in the progress dict already. This allows for
+    merging the pauses with the retentions in the snapshot without converting the whole snapshot into a progress dict.
+    """
+    if paused_keys := {key for other_pauses in pauses for key in other_pauses} - progress_dict.keys():
+        rows = {key: row for row, key in enumerate(snapshot.keys)}
+        for key in paused_keys & rows.keys():
+            progress_dict[key] = snapshot.retention_dict(rows[key])
+
+
+def get_pauses(progress_dict: ProgressDict) -> ProgressDict:
+    """Return the pauses in the progress dict, meaning the datetimes until which quizzes have been silenced."""
+    return {
+        key: RetentionDict(skip_until=skip_until)
+        for key, retention_dict in progress_dict.items()
+        if (skip_until := retention_dict.get("skip_until"))
+    }
+
+
+def load_progress_database(
+    database_filepath: Path,
+    progress_filepath: Path,
+    argument_parser: ArgumentParser,
+    keys: Collection[str] | None = None,
+) -> ProgressDict:
+    """Load progress, or the progress of the quizzes with the keys, from the progress database.
+
+    Import the progress file first if there's no database yet.
+    """
+    try:
+        if not database_filepath.exists() and progress_filepath.exists():
+            import_progress_file(
+                progress_filepath,
+                lambda progress_dict: save_progress_database(database_filepath, progress_dict),
+                argument_parser,
+            )
+        with closing(ProgressDatabase(database_filepath)) as database:
+            return database.load() if keys is None else database.load_keys(list(keys))
+    except sqlite3.Error as reason:
+        return progress_error(argument_parser, database_filepath, reason)
+
+
+def export_progress_database(database_filepath: Path, progress_filepath: Path, argument_parser: ArgumentParser) -> None:
+    """Export the progress database to a new progress file, and remove the database."""
+    try:
+        with closing(ProgressDatabase(database_filepath, read_only=True)) as database:
+            progress_dict = database.load()
+    except sqlite3.Error as reason:
+        progress_error(argument_parser, database_filepath, reason)
+    dump_json(progress_filepath, progress_dict)
+    database_filepath.unlink()
+
+
+def import_progress_file(
+    progress_filepath: Path, import_progress: Callable[[ProgressDict], None], argument_parser: ArgumentParser
+) -> None:
+    """Import the progress file, including its journal, into a new progress database or progress snapshot.
+
+    Keep a copy of the imported progress with the extension .imported, and remove the progress file and its journal
+    so they are not mistaken for progress of another device.
+    """
+    progress_dict = load_progress_file(progress_filepath, argument_parser)
+    import_progress(progress_dict)
+    dump_json(progress_filepath.with_suffix(".imported"), progress_dict)
+    progress_filepath.unlink()
+    get_journal_filepath(progress_filepath).unlink(missing_ok=True)
+
+
+def save_progress_database(database_filepath: Path, progress_dict: ProgressDict) -> None:
+    """Save the progress in the progress database."""
+    with closing(ProgressDatabase(database_filepath)) as database:
+        database.save(progress_dict)
+
+
+def load_pauses(database_filepath: Path, argument_parser: ArgumentParser) -> ProgressDict:
+    """Load the pauses from the progress database of another device."""
+    try:
+        with closing(ProgressDatabase(database_filepath, read_only=True)) as database:
+            return database.load_pauses()
+    except sqlite3.Error as reason:
+        return progress_error(argument_parser, database_filepath, reason)
+
+
+def load_sorted_keys(progress: Progress, config: ConfigParser, sort: str) -> list[str]:
+    """Return the keys of the quizzes in progress sorted by the sort column, in descending order.
+
+    With the SQLite backend, the database sorts the keys using its indexes. Otherwise, the columns of a snapshot of the
+    progress are sorted, so no retentions need to be created for sorting.
+    """
+    if config["progress"]["backend"] != "sqlite":
+        return progress.snapshot().sorted_keys(sort)
+    progress_filepath = get_progress_filepath(
+        progress.target_language, Path(config["progress"]["folder"]), config["identity"]["uuid"]
+    )
+    with closing(ProgressDatabase(get_database_filepath(progress_filepath))) as database:
+        return database.sorted_keys(sort)
+
+
+def progress_error(argument_parser: ArgumentParser, progress_filepath: Path, reason: Exception) -> NoReturn:
+    """Report that the progress cannot be loaded and exit."""
+    argument_parser.error(
+        f"""{NAME} cannot parse the progress information in {progress_filepath}: {reason}.
 To fix this, remove or rename {progress_filepath} and start {NAME} again.
 Unfortunately, this will reset your progress.
 Please consider opening a bug report at https://github.com/fniessink/{NAME.lower()}.
 Be sure to attach the invalid progress file to the issue.
 """,
-        )
-    return progress_dict
+    )
 
 
 def save_progress(progress: Progress, config: ConfigParser) -> None:
-    """Save the progress to the user's home folder."""
+    """Save the progress to the user's home folder.
+
+    When using the SQLite backend, save the changes since the previous save in the progress database. Otherwise,
+    append the changes to the journal, so the complete progress need not be written after each quiz. Once the journal
+    is larger than the progress file or, when using the binary backend, the progress snapshot, compact the journal
+    into the progress file or snapshot.
+
+    Other sessions on this device, for example in another terminal, may save the same progress. To not lose their
+    progress, the progress file is locked while saving and the changes saved by other sessions are merged first.
+    """
     folder = Path(config["progress"]["folder"])
     progress_filepath = get_progress_filepath(progress.target_language, folder, config["identity"]["uuid"])
-    dump_json(progress_filepath, progress.as_dict())
+    backend = config["progress"]["backend"]
+    with locked(get_lock_filepath(progress_filepath)):
+        if backend == "sqlite":
+            with closing(ProgressDatabase(get_database_filepath(progress_filepath))) as database:
+                if changes := progress.pop_changes(merge=database.load_keys):
+                    database.save(changes)
+        else:
+            filepath = get_snapshot_filepath(progress_filepath) if backend == "binary" else progress_filepath
+            journal_filepath = get_journal_filepath(progress_filepath)
+            if changes := progress.pop_changes(
+                merge=lambda _keys: load_changes_of_other_sessions(progress, filepath, journal_filepath)
+            ):
+                append_json_line(journal_filepath, changes)
+            if file_size(journal_filepath) > file_size(filepath):
+                if backend == "binary":
+                    dump_progress_snapshot(filepath, progress.snapshot())
+                else:
+                    dump_json(filepath, progress.as_dict())
+                journal_filepath.unlink()
+            JOURNAL_POSITIONS[progress] = journal_position(filepath, journal_filepath)
     # Remove the progress file without UUID as saved by Toisto <= v0.26.0 if it still exists:
     get_progress_filepath(progress.target_language, folder).unlink(missing_ok=True)
 
 
+def load_changes_of_other_sessions(progress: Progress, filepath: Path, journal_filepath: Path) -> ProgressDict:
+    """Return the changes saved by other sessions since this session loaded or saved the progress file or snapshot.
+
+    Other sessions append their changes to the journal, so only the journal after the position up to which this
+    session loaded or saved it needs to be loaded. If another session compacted the journal, the progress file or
+    snapshot has changed and the complete progress is loaded.
+    """
+    if (position := JOURNAL_POSITIONS.get(progress)) is None:
+        return {}  # The progress was not loaded from the progress file or snapshot
+    changes: ProgressDict = {}
+    offset = position.journal_size
+    if file_stamp(filepath) != position.progress_file:
+        offset = 0
+        if filepath.exists():
+            changes = load_progress_snapshot(filepath).as_dict() if filepath.suffix == ".bin" else load_json(filepath)
+    for journal_changes in load_json_lines(journal_filepath, offset):
+        changes.update(journal_changes)
+    return changes
+
+
+def remove_progress(progress: Progress, keys: Collection[str], config: ConfigParser) -> None:
+    """Remove the progress on the quizzes with the keys from the progress and from the user's home folder.
+
+    Removing progress cannot be appended to the journal, so unless the SQLite backend is used, the complete progress
+    is saved and the journal is removed. To not lose the changes saved by other sessions in the journal, these are
+    merged first.
+    """
+    progress.remove(keys)
+    progress_filepath = get_progress_filepath(
+        progress.target_language, Path(config["progress"]["folder"]), config["identity"]["uuid"]
+    )
+    backend = config["progress"]["backend"]
+    with locked(get_lock_filepath(progress_filepath)):
+        if backend == "sqlite":
+            with closing(ProgressDatabase(get_database_filepath(progress_filepath))) as database:
+                database.delete(keys)
+        else:
+            filepath = get_snapshot_filepath(progress_filepath) if backend == "binary" else progress_filepath
+            journal_filepath = get_journal_filepath(progress_filepath)
+            progress.pop_changes(
+                merge=lambda _keys: load_changes_of_other_sessions(progress, filepath, journal_filepath)
+            )
+            if backend == "binary":
+                dump_progress_snapshot(filepath, progress.snapshot())
+            else:
+                dump_json(filepath, progress.as_dict())
+            journal_filepath.unlink(missing_ok=True)
+            JOURNAL_POSITIONS[progress] = journal_position(filepath, journal_filepath)
+
+
+def archive_progress(progress_dict: ProgressDict, target_language: Language, config: ConfigParser) -> Path:
+    """Add the progress to the archive in the user's home folder and return the path of the archive.
+
+    Archived progress on a quiz replaces progress on the same quiz archived before.
+    """
+    progress_filepath = get_progress_filepath(
+        target_language, Path(config["progress"]["folder"]), config["identity"]["uuid"]
+    )
+    archive_filepath = get_archive_filepath(progress_filepath)
+    dump_json(archive_filepath, load_json(archive_filepath, default={}) | progress_dict)
+    return archive_filepath
+
+
+def create_answer_log(target_language: Language, config: ConfigParser) -> AnswerLog | None:
+    """Return the answer log in the user's home folder, if the user enabled the answer log."""
+    if config["progress"]["answer_log"] != "yes":
+        return None
+    progress_filepath = get_progress_filepath(
+        target_language, Path(config["progress"]["folder"]), config["identity"]["uuid"]
+    )
+    return AnswerLog(get_answer_log_filepath(progress_filepath))
+
+
+def load_answers(target_language: Language, config: ConfigParser) -> Iterator[AnswerDict]:
+    """Yield the answers in the answer log in the user's home folder, reading one answer at a time."""
+    progress_filepath = get_progress_filepath(
+        target_language, Path(config["progress"]["folder"]), config["identity"]["uuid"]
+    )
+    return iter_answers(get_answer_log_filepath(progress_filepath))
+
+
+class ProgressWriter:
+    """Save the progress, and flush the answer log if any, in a background thread, so saving does not block practicing.
+
+    Saves requested while the writer is saving are coalesced into one save. If saving fails, the error is raised in
+    the thread that uses the writer, the next time it requests a save or closes the writer.
+    """
+
+    def __init__(self, progress: Progress, config: ConfigParser, answer_log: AnswerLog | None = None) -> None:
+        self.__progress = progress
+        self.__config = config
+        self.__answer_log = answer_log
+        self.__save_requested = Event()
+        self.__closed = False
+        self.__error: Exception | None = None
+        self.__thread = Thread(target=self.__write, daemon=True)
+        self.__thread.start()
+
+    def save(self) -> None:
+        """Request the progress to be saved."""
+        self.__raise_error()
+        self.__save_requested.set()
+
+    def close(self) -> None:
+        """Save the progress a last time and wait until the progress has been saved."""
+        self.__closed = True
+        self.__save_requested.set()
+        self.__thread.join()
+        self.__raise_error()
+
+    def __write(self) -> None:
+        """Save the progress each time a save is requested, until the writer is closed."""
+        closed = False
+        while not closed:
+            self.__save_requested.wait()
+            self.__save_requested.clear()
+            closed = self.__closed  # Read before saving, so changes made before the writer was closed are saved
+            try:
+                save_progress(self.__progress, self.__config)
+                if self.__answer_log:
+                    self.__answer_log.flush()
+            except Exception as error:  # noqa: BLE001
+                self.__error = error  # Keep writing, so the next save can still save the progress
+
+    def __raise_error(self) -> None:
+        """Raise the error that occurred while saving, if any, once."""
+        error, self.__error = self.__error, None
+        if error:
+            raise error
+
+
+def file_size(filepath: Path) -> int:
+    """Return the size of the file, or zero if the file does not exist."""
+    try:
+        return filepath.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def file_stamp(filepath: Path) -> FileStamp | None:
+    """Return the inode, modification time, and size of the file, or None if the file does not exist."""
+    try:
+        stat = filepath.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def journal_position(filepath: Path, journal_filepath: Path) -> JournalPosition:
+    """Return the current journal position of the progress file or snapshot."""
+    return JournalPosition(file_stamp(filepath), file_size(journal_filepath))
+
+
 def update_progress_dict(progress_dict: ProgressDict, *progress_dicts: ProgressDict) -> None:
     """Update the progress dict with the pauses from the other progress dicts."""
     for other_progress_dict in progress_dicts:
@@ -0,0 +1,98 @@
+"""Store and load progress data in an SQLite database."""
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Final, cast
+
+from .progress_format import ProgressDict, RetentionDict
+
+SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS retention (
+    key TEXT PRIMARY KEY,
+    start TEXT,
+    "end" TEXT,
+    skip_until TEXT,
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS retention_skip_until ON retention (skip_until);
+CREATE INDEX IF NOT EXISTS retention_count ON retention (count);
+CREATE INDEX IF NOT EXISTS retention_length ON retention (julianday("end") - julianday(start));
+"""
+
+# The columns of the retention table, in the order of the SELECT and INSERT statements below:
+COLUMNS: Final = ("key", "count", "start", "end", "skip_until")
+
+# The SQL expressions to sort the retentions by, per sort column of the progress command. Each has an index:
+SORT_EXPRESSIONS: Final = {"attempts": "count", "retention": 'julianday("end") - julianday(start)'}
+
+
+class ProgressDatabase:
+    """Progress stored in an SQLite database, with a row per quiz.
+
+    The datetimes are stored in the same ISO format as in the JSON progress files, so progress can be moved between
+    the database and JSON progress files without changes. The retentions are indexed by the datetime until which the
+    quiz is silenced, the count, and the length of the retention, so querying pauses and sorting progress is done by
+    the database.
+    """
+
+    def __init__(self, database_filepath: Path, *, read_only: bool = False) -> None:
+        if read_only:
+            self.__connection = sqlite3.connect(f"file:{database_filepath}?mode=ro", uri=True)
+        else:
+            self.__connection = sqlite3.connect(database_filepath)
+            self.__connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        self.__connection.close()
+
+    def load(self) -> ProgressDict:
+        """Return the progress."""
+        return self.__progress_dict('SELECT key, count, start, "end", skip_until FROM retention')
+
+    def load_pauses(self) -> ProgressDict:
+        """Return the progress of the quizzes that have been silenced, with the datetime until which they are silenced.
+
+        This is the progress needed to take the progress made on other devices into account.
+        """
+        # Compare with the empty string instead of NULL so SQLite uses the index:
+        return self.__progress_dict("SELECT key, 0, NULL, NULL, skip_until FROM retention WHERE skip_until > ''")
+
+    def load_keys(self, keys: list[str]) -> ProgressDict:
+        """Return the progress of the quizzes with the keys."""
+        return self.__progress_dict(
+            'SELECT key, count, start, "end", skip_until FROM retention WHERE key IN (SELECT value FROM json_each(?))',
+            json.dumps(keys),
+        )
+
+    def save(self, progress_dict: ProgressDict) -> None:
+        """Save the progress, replacing the progress of quizzes saved before, in one transaction."""
+        rows = [
+            (key, retention_dict.get("count", 0), *(retention_dict.get(column) for column in COLUMNS[2:]))
+            for key, retention_dict in progress_dict.items()
+        ]
+        with self.__connection:
+            self.__connection.executemany(
+                'INSERT OR REPLACE INTO retention (key, count, start, "end", skip_until) VALUES (?, ?, ?, ?, ?)', rows
+            )
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """Delete the progress of the quizzes with the keys, in one transaction."""
+        with self.__connection:
+            self.__connection.executemany("DELETE FROM retention WHERE key = ?", [(key,) for key in keys])
+
+    def sorted_keys(self, sort: str) -> list[str]:
+        """Return the keys of the quizzes in progress, sorted by the sort column in descending order."""
+        query = f"SELECT key FROM retention ORDER BY {SORT_EXPRESSIONS[sort]} DESC"  # noqa: S608
+        return [key for (key,) in self.__connection.execute(query)]
+
+    def __progress_dict(self, query: str, *parameters: str) -> ProgressDict:
+        """Return the progress dict with the rows returned by the query, leaving out empty values."""
+        return {
+            row[0]: cast(
+                "RetentionDict", {column: value for column, value in zip(COLUMNS[1:], row[1:], strict=True) if value}
+            )
+            for row in self.__connection.execute(query, parameters)
+        }
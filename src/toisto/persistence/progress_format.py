@@ -13,3 +13,20 @@ class RetentionDict(TypedDict, total=False):
 
 
 ProgressDict = dict[str, RetentionDict]
+
+
+class PausesCacheEntry(TypedDict):
+    """Cached pauses of the progress file or progress database of another device."""
+
+    key: str  # Changes when the progress file or its journal changes
+    pauses: ProgressDict
+
+
+class AnswerDict(TypedDict):
+    """Answer as logged in the answer log."""
+
+    quiz: str  # The key of the quiz
+    evaluation: str
+    attempt: int
+    latency: float  # Seconds between presenting the quiz and the user submitting the answer
+    timestamp: str
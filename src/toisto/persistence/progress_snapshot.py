@@ -0,0 +1,189 @@
+"""Store and load progress snapshots in a compact binary format."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Buffer, Collection
+from dataclasses import dataclass
+from datetime import datetime
+from math import isnan, nan
+from pathlib import Path
+from typing import Final
+
+from toisto.metadata import ENCODING
+
+from .progress_format import ProgressDict, RetentionDict
+
+MAGIC: Final = b"TOISTOPS"
+FORMAT_VERSION: Final = 1
+# The header: the magic bytes, the format version, the number of rows, and the number of bytes of the keys:
+HEADER: Final = struct.Struct("<8sIQQ")
+KEY_SEPARATOR: Final = "\0"
+DATETIME_COLUMNS: Final = ("start", "end", "skip_until")
+# The values in the count, start, end, and skip until columns:
+COLUMN_VALUES: Final = (struct.Struct("<q"), *(struct.Struct("<d") for _column in DATETIME_COLUMNS))
+
+
+@dataclass
+class ProgressSnapshot:
+    """Progress in columns, with the retention of the quiz with the nth key in the nth row of each column.
+
+    Datetimes are stored as seconds since the epoch, with NaN meaning no datetime, like the retention store does.
+    """
+
+    keys: list[str]
+    count: array[int]
+    start: array[float]
+    end: array[float]
+    skip_until: array[float]
+
+    @classmethod
+    def from_progress_dict(cls, progress_dict: ProgressDict) -> ProgressSnapshot:
+        """Create a snapshot from the progress dict."""
+        retention_dicts = progress_dict.values()
+        return cls(
+            list(progress_dict),
+            array("q", (int(retention_dict.get("count", 0)) for retention_dict in retention_dicts)),
+            *(
+                array("d", (parse(retention_dict.get(column)) for retention_dict in retention_dicts))
+                for column in DATETIME_COLUMNS
+            ),
+        )
+
+    def as_dict(self) -> ProgressDict:
+        """Return the snapshot as progress dict."""
+        return {key: self.retention_dict(row) for row, key in enumerate(self.keys)}
+
+    def retention_dict(self, row: int) -> RetentionDict:
+        """Return the retention dict of the row, in the same format as the retention dicts in progress files."""
+        retention_dict = RetentionDict()
+        if count := self.count[row]:
+            retention_dict["count"] = count
+        for column in DATETIME_COLUMNS:
+            if not isnan(timestamp := getattr(self, column)[row]):
+                retention_dict[column] = datetime.fromtimestamp(timestamp).astimezone().isoformat(timespec="seconds")
+        return retention_dict
+
+    def sorted_keys(self, sort: str) -> list[str]:
+        """Return the keys sorted by the sort column, attempts or retention, in descending order.
+
+        Sorting uses the timestamps in the columns, so no datetimes are created. Retentions without start or end have
+        length zero.
+        """
+        if sort == "attempts":
+            sort_values: list[float] = list(self.count)
+        else:
+            sort_values = [
+                end - start if end >= start else 0.0 for start, end in zip(self.start, self.end, strict=True)
+            ]
+        rows = sorted(range(len(self.keys)), key=sort_values.__getitem__, reverse=True)
+        return [self.keys[row] for row in rows]
+
+    def pauses(self) -> ProgressDict:
+        """Return the pauses in the snapshot, meaning the datetimes until which quizzes have been silenced."""
+        return {
+            key: RetentionDict(skip_until=self.retention_dict(row)["skip_until"])
+            for row, key in enumerate(self.keys)
+            if not isnan(self.skip_until[row])
+        }
+
+
+def parse(value: object) -> float:
+    """Return the ISO formatted datetime as timestamp. Naive datetimes are in the local timezone."""
+    return datetime.fromisoformat(str(value)).timestamp() if value else nan
+
+
+def dump_progress_snapshot(snapshot_filepath: Path, snapshot: ProgressSnapshot) -> None:
+    """Dump the progress snapshot into the file.
+
+    The file starts with a header, followed by the keys and then the columns. Numbers are little-endian and the
+    columns are aligned at eight bytes, so the columns can be read without parsing. Like JSON files, the snapshot is
+    written to a temporary file that then replaces the file.
+    """
+    keys = KEY_SEPARATOR.join(snapshot.keys).encode(ENCODING)
+    padding = bytes(-(HEADER.size + len(keys)) % 8)
+    temporary_file_path = snapshot_filepath.with_name(f"{snapshot_filepath.name}.tmp")
+    with temporary_file_path.open("wb") as snapshot_file:
+        snapshot_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(snapshot.keys), len(keys)) + keys + padding)
+        for column in (snapshot.count, snapshot.start, snapshot.end, snapshot.skip_until):
+            snapshot_file.write(little_endian_bytes(column))
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    temporary_file_path.replace(snapshot_filepath)
+
+
+def load_progress_snapshot(snapshot_filepath: Path) -> ProgressSnapshot:
+    """Load the progress snapshot from the file."""
+    contents = memoryview(snapshot_filepath.read_bytes())
+    nr_rows, keys_length = read_header(contents)
+    offset = columns_offset(keys_length)
+    keys = decode_keys(contents[HEADER.size : HEADER.size + keys_length], nr_rows)
+    columns = [contents[offset + 8 * nr_rows * index : offset + 8 * nr_rows * (index + 1)] for index in range(4)]
+    return ProgressSnapshot(
+        keys,
+        from_little_endian_bytes(array("q"), columns[0]),
+        *(from_little_endian_bytes(array("d"), column) for column in columns[1:]),
+    )
+
+
+def load_progress_snapshot_rows(snapshot_filepath: Path, keys: Collection[str]) -> ProgressSnapshot:
+    """Load the rows of the quizzes with the keys from the progress snapshot.
+
+    The file is memory-mapped. To find the rows of the quizzes, all keys are decoded and compared with the keys. Of
+    the columns, only the values in the rows of the quizzes with the keys are read.
+    """
+    with (
+        snapshot_filepath.open("rb") as snapshot_file,
+        mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as contents,
+    ):
+        nr_rows, keys_length = read_header(contents)
+        offset = columns_offset(keys_length)
+        snapshot_keys = decode_keys(contents[HEADER.size : HEADER.size + keys_length], nr_rows)
+        rows = [row for row, key in enumerate(snapshot_keys) if key in keys]
+        columns = [
+            array(
+                value.format[-1],
+                (value.unpack_from(contents, offset + 8 * (nr_rows * index + row))[0] for row in rows),
+            )
+            for index, value in enumerate(COLUMN_VALUES)
+        ]
+    return ProgressSnapshot([snapshot_keys[row] for row in rows], *columns)
+
+
+def read_header(contents: Buffer) -> tuple[int, int]:
+    """Check the header of the snapshot and return the number of rows and the number of bytes of the keys."""
+    magic, version, nr_rows, keys_length = HEADER.unpack_from(contents)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        message = f"unknown progress snapshot format version {version}" if magic == MAGIC else "not a progress snapshot"
+        raise ValueError(message)
+    return nr_rows, keys_length
+
+
+def columns_offset(keys_length: int) -> int:
+    """Return the offset of the first column, after the header, the keys, and the padding."""
+    return HEADER.size + keys_length + -(HEADER.size + keys_length) % 8
+
+
+def decode_keys(keys: Buffer, nr_rows: int) -> list[str]:
+    """Return the keys of the rows."""
+    return str(keys, ENCODING).split(KEY_SEPARATOR) if nr_rows else []
+
+
+def little_endian_bytes(column: array[int] | array[float]) -> bytes:
+    """Return the column as bytes in little-endian byte order."""
+    if sys.byteorder == "big":  # pragma: no cover
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def from_little_endian_bytes[T: (int, float)](column: array[T], contents: memoryview) -> array[T]:
+    """Extend the column with the values in the bytes in little-endian byte order, and return the column."""
+    column.frombytes(contents)
+    if sys.byteorder == "big":  # pragma: no cover
+        column.byteswap()
+    return column
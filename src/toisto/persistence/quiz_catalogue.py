@@ -0,0 +1,84 @@
+"""Load and cache the quiz catalogue."""
+
+from pathlib import Path
+
+from ..model.language import LanguagePair
+from ..model.language.concept import Concept
+from ..model.quiz.quiz import Quizzes
+from ..model.quiz.quiz_catalogue import QuizCatalogue, QuizCatalogueDict
+from ..model.quiz.quiz_factory import QuizFactory, create_quizzes
+from ..model.quiz.quiz_source import LazyQuizSource
+from ..model.quiz.quiz_type import QuizType
+from .cache import cache_key, dump_cache, load_cache
+
+
+def load_quiz_catalogue(
+    language_pair: LanguagePair, quiz_types: tuple[QuizType, ...], concepts: set[Concept], *concept_files: Path
+) -> QuizCatalogue:
+    """Load the quiz catalogue for the concepts from the cache.
+
+    If the cache is missing or outdated, create the quizzes and cache the catalogue. The cache is outdated if the
+    concepts, the quiz types, or one of the concept files has changed since it was created.
+    """
+    cache_name, key = quiz_catalogue_cache_name_and_key(language_pair, quiz_types, concepts, *concept_files)
+    catalogue_dict: QuizCatalogueDict | None = load_cache(cache_name, key)
+    if catalogue_dict is None:
+        quizzes = create_quizzes(language_pair, quiz_types, *concepts)
+        catalogue = QuizCatalogue.from_quizzes(language_pair, quizzes)
+        dump_cache(cache_name, key, catalogue.as_dict())
+        return catalogue
+    return QuizCatalogue(language_pair, catalogue_dict)
+
+
+def quiz_catalogue_cache_name_and_key(
+    language_pair: LanguagePair, quiz_types: tuple[QuizType, ...], concepts: set[Concept], *concept_files: Path
+) -> tuple[str, str]:
+    """Return the name and the key of the quiz catalogue cache."""
+    target, source = language_pair.target, language_pair.source
+    actions = sorted(quiz_type.action for quiz_type in quiz_types)
+    concept_ids = sorted(concept.concept_id for concept in concepts)
+    return f"quizzes-{target}-{source}", cache_key(target, source, *actions, "|", *concept_ids, paths=concept_files)
+
+
+def load_quiz_source(
+    language_pair: LanguagePair, quiz_types: tuple[QuizType, ...], concepts: set[Concept], *concept_files: Path
+) -> LazyQuizSource:
+    """Return a quiz source that generates the quizzes for the concepts when needed.
+
+    If the quiz catalogue cache is up to date, rebuild the quizzes from the catalogue, otherwise create them. Unlike
+    load_quiz_catalogue(), this does not create the cache up front, as that would mean creating all quizzes up front.
+    Instead, the cache is created once the quiz source has created the quizzes of all concepts.
+    """
+    cache_name, key = quiz_catalogue_cache_name_and_key(language_pair, quiz_types, concepts, *concept_files)
+    catalogue_dict: QuizCatalogueDict | None = load_cache(cache_name, key)
+    if catalogue_dict is None:
+        actions = tuple(quiz_type.action for quiz_type in quiz_types)
+
+        def dump_catalogue(quizzes: Quizzes) -> None:
+            """Cache the catalogue of the quizzes."""
+            dump_cache(cache_name, key, QuizCatalogue.from_quizzes(language_pair, quizzes).as_dict())
+
+        return LazyQuizSource(
+            language_pair, concepts, QuizFactory(language_pair, actions).concept_quizzes, dump_catalogue
+        )
+    catalogue = QuizCatalogue(language_pair, catalogue_dict)
+    return LazyQuizSource(language_pair, concepts, lambda concept: catalogue.quizzes(concept.concept_id))
+
+
+def load_quiz_keys_and_source(
+    language_pair: LanguagePair, quiz_types: tuple[QuizType, ...], concepts: set[Concept], *concept_files: Path
+) -> tuple[set[str], LazyQuizSource]:
+    """Load the keys of the quizzes for the concepts, and a quiz source that rebuilds the quizzes when needed.
+
+    The keys are taken from the quiz catalogue, so the quizzes need not be rebuilt to know which progress to load.
+    """
+    catalogue = load_quiz_catalogue(language_pair, quiz_types, concepts, *concept_files)
+    quiz_source = LazyQuizSource(language_pair, concepts, lambda concept: catalogue.quizzes(concept.concept_id))
+    return catalogue.all_keys(), quiz_source
+
+
+def load_quiz_keys(
+    language_pair: LanguagePair, quiz_types: tuple[QuizType, ...], concepts: set[Concept], *concept_files: Path
+) -> set[str]:
+    """Load the keys of the quizzes for the concepts, without rebuilding the quizzes if the catalogue is cached."""
+    return load_quiz_catalogue(language_pair, quiz_types, concepts, *concept_files).all_keys()
@@ -1,10 +1,12 @@
 """Load spelling alternatives."""
 
 import re
+from pathlib import Path
 
 from ..metadata import SPELLING_ALTERNATIVES_FILE
 from ..model.language import LanguagePair
-from ..model.language.label import Label
+from ..model.language.label import GeneratedSpellingAlternatives, Label
+from .cache import cache_key, dump_cache, load_cache
 from .json_file import load_json
 
 
@@ -16,3 +18,26 @@ def load_spelling_alternatives(language_pair: LanguagePair) -> None:
     for key, language in key_language_mapping.items():
         for regexp, replacement in spelling_alternatives.get(key, {}).items():
             Label.ALTERNATIVES_TO_GENERATE.setdefault(language, {})[re.compile(regexp)] = replacement
+
+
+def load_generated_spelling_alternatives(language_pair: LanguagePair, *concept_files: Path) -> None:
+    """Load the generated spelling alternatives of the labels in the concept files from the cache.
+
+    If the cache is missing or outdated, generate the spelling alternatives for all labels and cache them. The cache
+    is outdated if the spelling alternatives file or one of the concept files has changed since it was created.
+    """
+    target, source = language_pair.target, language_pair.source
+    cache_name = f"spelling-alternatives-{target}-{source}"
+    key = cache_key(target, source, paths=(SPELLING_ALTERNATIVES_FILE, *concept_files))
+    generated_alternatives: GeneratedSpellingAlternatives | None = load_cache(cache_name, key)
+    if generated_alternatives is None:
+        generated_alternatives = {
+            language: {
+                value: Label.generate_spelling_alternatives(language, value)
+                for label_language, value in Label.homograph_mapping
+                if label_language == language
+            }
+            for language in (target, source)
+        }
+        dump_cache(cache_name, key, generated_alternatives)
+    Label.GENERATED_ALTERNATIVES.update(generated_alternatives)
@@ -53,3 +53,22 @@ class Registry[Key, Value]:
     def clear(self) -> None:
         """Clear the registry."""
         self.__items.clear()
+
+
+class Identities[Key]:
+    """Map keys to dense integer identities and back."""
+
+    def __init__(self) -> None:
+        self.__identities: dict[Key, int] = {}
+        self.__keys: list[Key] = []
+
+    def identity(self, key: Key) -> int:
+        """Return the identity of the key, assigning the next identity if the key is new."""
+        if (identity := self.__identities.get(key)) is None:
+            identity = self.__identities[key] = len(self.__keys)
+            self.__keys.append(key)
+        return identity
+
+    def key(self, identity: int) -> Key:
+        """Return the key with the identity."""
+        return self.__keys[identity]
@@ -174,6 +174,26 @@ class CommandBuilder:
             help="folder where to save progress; default: %(default)s",
         )
 
+    def add_progress_backend_argument(self, parser: ArgumentParser) -> None:
+        """Add the progress backend argument to the command."""
+        parser.add_argument(
+            "-b",
+            "--progress-backend",
+            choices=["json", "sqlite", "binary"],
+            default=self.config.get("progress", "backend"),
+            help="how to save progress, in JSON files, in an SQLite database, or in binary files; default: %(default)s",
+        )
+
+    def add_answer_log_argument(self, parser: ArgumentParser) -> None:
+        """Add the answer log argument to the command."""
+        parser.add_argument(
+            "-a",
+            "--answer-log",
+            choices=["yes", "no"],
+            default=self.config.get("progress", "answer_log"),
+            help="log each answer, so answers can be exported with `toisto progress --export`; default: %(default)s",
+        )
+
     def add_progress_update_argument(self, parser: ArgumentParser) -> None:
         """Add the progress update argument to the command."""
         parser.add_argument(
@@ -238,6 +258,8 @@ class ConfigureCommandBuilder(CommandBuilder):
         self.add_language_arguments(parser)
         self.add_extra_concepts_arguments(parser)
         self.add_progress_folder_argument(parser)
+        self.add_progress_backend_argument(parser)
+        self.add_answer_log_argument(parser)
         self.add_progress_update_argument(parser)
         self.add_show_quiz_retention_argument(parser)
         self.add_mp3player_argument(parser)
@@ -276,6 +298,8 @@ class ProgressCommandBuilder(CommandBuilder):
         self.add_extra_concepts_arguments(parser)
         self.add_quiz_type_argument(parser)
         self.add_sort_argument(parser)
+        self.add_orphans_argument(parser)
+        self.add_export_arguments(parser)
 
     def add_sort_argument(self, parser: ArgumentParser) -> None:
         """Add the sort argument to the command."""
@@ -288,6 +312,33 @@ class ProgressCommandBuilder(CommandBuilder):
             help="how to sort progress information; default: by %(default)s; available options: %(choices)s",
         )
 
+    def add_orphans_argument(self, parser: ArgumentParser) -> None:
+        """Add the orphans argument to the command."""
+        parser.add_argument(
+            "-o",
+            "--orphans",
+            choices=["show", "remove", "archive"],
+            help="instead of showing progress, show, remove, or archive the progress on quizzes that are no longer "
+            "generated, for example because a concept was removed; can't be combined with concepts or quiz types",
+        )
+
+    def add_export_arguments(self, parser: ArgumentParser) -> None:
+        """Add the export and export format arguments to the command."""
+        parser.add_argument(
+            "-x",
+            "--export",
+            choices=["answers", "progress"],
+            help="instead of showing progress, write the logged answers or the progress of all quizzes to standard "
+            "output; can't be combined with orphans",
+        )
+        parser.add_argument(
+            "-f",
+            "--format",
+            choices=["csv", "jsonl"],
+            default="csv",
+            help="format of the export, CSV or JSON lines; default: %(default)s",
+        )
+
 
 class SelfUpgradeCommandBuilder(CommandBuilder):
     """Self-upgrade command builder."""
@@ -372,4 +423,8 @@ def parse_arguments(argument_parser: ArgumentParser) -> Namespace:
     if namespace.command not in ("configure", "self") and namespace.target_language == namespace.source_language:
         message = f"target and source language are the same: '{namespace.target_language}' "
         argument_parser.error(message)
+    if namespace.command == "progress" and namespace.orphans and (namespace.concepts or namespace.quiz_type):
+        argument_parser.error("argument -o/--orphans: not allowed with concepts or quiz types")
+    if namespace.command == "progress" and namespace.orphans and namespace.export:
+        argument_parser.error("argument -x/--export: not allowed with argument -o/--orphans")
     return namespace
@@ -71,6 +71,7 @@ class ToistoTestCase(unittest.TestCase):
         Concept.instances.clear()
         Label.homograph_mapping.clear()
         Label.capitonym_mapping.clear()
+        Label.GENERATED_ALTERNATIVES.clear()
 
     @staticmethod
     def create_concept(
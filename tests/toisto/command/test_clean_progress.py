@@ -0,0 +1,83 @@
+"""Unit tests for the clean progress command."""
+
+from argparse import Namespace
+from configparser import ConfigParser
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from toisto.command.clean_progress import clean_progress
+from toisto.model.language import FI, NL
+from toisto.model.quiz.progress import Progress
+from toisto.model.quiz.quiz import Quizzes
+from toisto.model.quiz.quiz_factory import create_quizzes
+from toisto.model.quiz.quiz_type import READ
+from toisto.persistence.progress_format import RetentionDict
+
+from ...base import FI_NL, ToistoTestCase
+
+
+@patch("toisto.command.clean_progress.remove_progress")
+@patch("toisto.command.clean_progress.archive_progress")
+class CleanProgressTest(ToistoTestCase):
+    """Test the clean progress command."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        super().setUp()
+        concept = self.create_concept(
+            "hello", labels=[{"label": "Terve!", "language": FI}, {"label": "Hoi!", "language": NL}]
+        )
+        self.quizzes = Quizzes(create_quizzes(FI_NL, (READ,), concept))
+        self.quiz_keys = {quiz.key for quiz in self.quizzes}
+        self.orphan_key = "fi:nl:Hei!:Hallo!:read"
+        self.progress = Progress(FI, self.quizzes, {self.orphan_key: {"count": 2}})
+        self.config = ConfigParser()
+
+    def clean_progress(self, orphans: str) -> Mock:
+        """Run the clean progress command."""
+        with patch("rich.console.Console.print") as console_print:
+            clean_progress(self.progress, FI_NL, self.quiz_keys, self.config, Namespace(orphans=orphans))
+        return console_print
+
+    def test_no_orphans(self, archive_progress: Mock, remove_progress: Mock) -> None:
+        """Test that the user is told there are no orphans."""
+        self.progress = Progress(FI, self.quizzes, {})
+        console_print = self.clean_progress("remove")
+        console_print.assert_called_once_with("No orphaned progress Finnish.")
+        archive_progress.assert_not_called()
+        remove_progress.assert_not_called()
+
+    def test_show_orphans(self, archive_progress: Mock, remove_progress: Mock) -> None:
+        """Test that the orphans are shown."""
+        console_print = self.clean_progress("show")
+        table = console_print.call_args[0][0]
+        self.assertEqual("Orphaned progress Finnish", table.title)
+        self.assertEqual([self.orphan_key], list(table.columns[0].cells))
+        self.assertEqual(["2"], list(table.columns[1].cells))
+        self.assertEqual([""], list(table.columns[2].cells))
+        archive_progress.assert_not_called()
+        remove_progress.assert_not_called()
+
+    def test_show_retention_of_orphans(self, archive_progress: Mock, remove_progress: Mock) -> None:
+        """Test that the retention of orphans is shown."""
+        retention_dict = RetentionDict(start="2026-01-01T10:00:00+00:00", end="2026-01-01T11:00:00+00:00")
+        self.progress = Progress(FI, self.quizzes, {self.orphan_key: retention_dict})
+        console_print = self.clean_progress("show")
+        self.assertEqual(["60 minutes"], list(console_print.call_args[0][0].columns[2].cells))
+
+    def test_remove_orphans(self, archive_progress: Mock, remove_progress: Mock) -> None:
+        """Test that the orphans are removed."""
+        console_print = self.clean_progress("remove")
+        remove_progress.assert_called_once_with(self.progress, {self.orphan_key: {}}.keys(), self.config)
+        console_print.assert_called_with("Removed the progress on 1 orphaned quizzes.")
+        archive_progress.assert_not_called()
+
+    def test_archive_orphans(self, archive_progress: Mock, remove_progress: Mock) -> None:
+        """Test that the orphans are archived and removed."""
+        archive_progress.return_value = Path("/home/user/.toisto-uuid-progress-fi.archive")
+        console_print = self.clean_progress("archive")
+        archive_progress.assert_called_once_with({self.orphan_key: {"count": 2}}, FI, self.config)
+        console_print.assert_any_call(
+            "Archived the progress on 1 orphaned quizzes in /home/user/.toisto-uuid-progress-fi.archive."
+        )
+        remove_progress.assert_called_once()
@@ -54,6 +54,18 @@ class ConfigureTest(ToistoTestCase):
         configure(self.argument_parser, config, Namespace(target_language="en", source_language="fi"))
         self.assert_configured(config, ("languages", "target", "en"), ("languages", "source", "fi"))
 
+    def test_change_progress_backend(self) -> None:
+        """Test changing the progress backend."""
+        config = ConfigParserUnderTest()
+        configure(self.argument_parser, config, Namespace(progress_backend="sqlite"))
+        self.assert_configured(config, ("progress", "backend", "sqlite"))
+
+    def test_enable_answer_log(self) -> None:
+        """Test enabling the answer log."""
+        config = ConfigParserUnderTest()
+        configure(self.argument_parser, config, Namespace(answer_log="yes"))
+        self.assert_configured(config, ("progress", "answer_log", "yes"))
+
     def test_change_progess_update(self) -> None:
         """Test changing the progress update frequency."""
         config = ConfigParserUnderTest()
@@ -0,0 +1,78 @@
+"""Unit tests for the export progress command."""
+
+from argparse import Namespace
+from configparser import ConfigParser
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from toisto.command.export_progress import export_answers, export_progress
+from toisto.model.language import FI, NL
+from toisto.model.quiz.progress import Progress
+from toisto.model.quiz.quiz import Quizzes
+from toisto.model.quiz.quiz_factory import create_quizzes
+from toisto.model.quiz.quiz_type import READ
+
+from ...base import FI_NL, ToistoTestCase
+
+
+@patch("sys.stdout", new_callable=StringIO)
+class ExportAnswersTest(ToistoTestCase):
+    """Test exporting the answers."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        super().setUp()
+        self.answer = {
+            "quiz": "fi:nl:Terve!:Hoi!:read",
+            "evaluation": "correct",
+            "attempt": 1,
+            "latency": 1.5,
+            "timestamp": "2026-01-01T12:00:00.000+00:00",
+        }
+
+    def export_answers(self, export_format: str) -> None:
+        """Export the answers."""
+        with patch("toisto.command.export_progress.load_answers", Mock(return_value=iter([self.answer]))):
+            export_answers(FI, ConfigParser(), Namespace(format=export_format))
+
+    def test_export_csv(self, stdout: StringIO) -> None:
+        """Test that the answers are exported as CSV."""
+        self.export_answers("csv")
+        self.assertEqual(
+            "quiz,evaluation,attempt,latency,timestamp\n"
+            "fi:nl:Terve!:Hoi!:read,correct,1,1.5,2026-01-01T12:00:00.000+00:00\n",
+            stdout.getvalue(),
+        )
+
+    def test_export_json_lines(self, stdout: StringIO) -> None:
+        """Test that the answers are exported as JSON lines."""
+        self.export_answers("jsonl")
+        self.assertEqual(
+            '{"quiz": "fi:nl:Terve!:Hoi!:read", "evaluation": "correct", "attempt": 1, "latency": 1.5, '
+            '"timestamp": "2026-01-01T12:00:00.000+00:00"}\n',
+            stdout.getvalue(),
+        )
+
+
+@patch("sys.stdout", new_callable=StringIO)
+class ExportProgressTest(ToistoTestCase):
+    """Test exporting the progress."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        super().setUp()
+        concept = self.create_concept(
+            "hello", labels=[{"label": "Terve!", "language": FI}, {"label": "Hoi!", "language": NL}]
+        )
+        quizzes = Quizzes(create_quizzes(FI_NL, (READ,), concept))
+        self.progress = Progress(FI, quizzes, {"fi:nl:Terve!:Hoi!:read": {"count": 2}})
+
+    def test_export_csv(self, stdout: StringIO) -> None:
+        """Test that the progress is exported as CSV, with empty cells for missing datetimes."""
+        export_progress(self.progress, Namespace(format="csv"))
+        self.assertEqual("quiz,count,start,end,skip_until\nfi:nl:Terve!:Hoi!:read,2,,,\n", stdout.getvalue())
+
+    def test_export_json_lines(self, stdout: StringIO) -> None:
+        """Test that the progress is exported as JSON lines."""
+        export_progress(self.progress, Namespace(format="jsonl"))
+        self.assertEqual('{"quiz": "fi:nl:Terve!:Hoi!:read", "count": 2}\n', stdout.getvalue())
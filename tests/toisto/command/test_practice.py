@@ -11,6 +11,7 @@ from toisto.command.practice import ERASE_ENTIRE_LINE, practice
 from toisto.model.language import FI, NL, LanguagePair
 from toisto.model.language.concept import Concept, ConceptId
 from toisto.model.language.label import Label
+from toisto.model.quiz.evaluation import Evaluation
 from toisto.model.quiz.progress import Progress
 from toisto.model.quiz.quiz import Quizzes
 from toisto.model.quiz.quiz_factory import create_quizzes
@@ -118,6 +119,8 @@ class PracticeBase(ToistoTestCase):
 
 
 @patch("pathlib.Path.open", MagicMock())
+@patch("toisto.persistence.progress.locked", MagicMock())
+@patch("os.fsync", Mock())
 @patch("toisto.ui.speech.gTTS", Mock())
 @patch("toisto.ui.speech.Popen", Mock())
 class PracticeAnswerTest(PracticeBase):
@@ -217,6 +220,8 @@ class PracticeAnswerTest(PracticeBase):
 
 
 @patch("pathlib.Path.open", MagicMock())
+@patch("toisto.persistence.progress.locked", MagicMock())
+@patch("os.fsync", Mock())
 @patch("toisto.ui.speech.gTTS", Mock())
 @patch("toisto.ui.speech.Popen", Mock())
 class PracticeSpeakAnswerTest(PracticeBase):
@@ -269,6 +274,8 @@ class PracticeSpeakAnswerTest(PracticeBase):
 
 
 @patch("pathlib.Path.open", MagicMock())
+@patch("toisto.persistence.progress.locked", MagicMock())
+@patch("os.fsync", Mock())
 @patch("toisto.ui.speech.gTTS", Mock())
 @patch("toisto.ui.speech.Popen", Mock())
 class PracticeFeedbackTest(PracticeBase):
@@ -440,6 +447,8 @@ class PracticeFeedbackTest(PracticeBase):
 
 
 @patch("pathlib.Path.open", MagicMock())
+@patch("toisto.persistence.progress.locked", MagicMock())
+@patch("os.fsync", Mock())
 @patch("toisto.ui.speech.gTTS", Mock())
 @patch("toisto.ui.speech.Popen", Mock())
 class PracticeLifeCycleTest(PracticeBase):
@@ -454,6 +463,21 @@ class PracticeLifeCycleTest(PracticeBase):
         self.assert_printed(Feedback.TRY_AGAIN, patched_print)
         self.assert_printed(Feedback.CORRECT, patched_print)
 
+    @patch("builtins.input", Mock(side_effect=["incorrect\n", "Hoi\n", EOFError]))
+    @patch("toisto.command.practice.create_answer_log")
+    def test_log_answers(self, create_answer_log: Mock) -> None:
+        """Test that each attempt is logged if the user enabled the answer log."""
+        concept = self.create_concept_fixture()
+        quizzes = create_quizzes(FI_NL, (READ,), concept)
+        self.practice(FI_NL, quizzes)
+        answer_log = create_answer_log.return_value
+        quiz_key = next(iter(quizzes)).key
+        self.assertEqual(
+            [(quiz_key, Evaluation.TRY_AGAIN, 1), (quiz_key, Evaluation.CORRECT, 2)],
+            [logged.args[:3] for logged in answer_log.log.call_args_list],
+        )
+        answer_log.flush.assert_called()
+
     @patch("builtins.input", Mock(side_effect=["?\n", EOFError]))
     def test_quiz_skip_on_first_attempt(self):
         """Test that the answer is shown if the user skips the quiz on the first attempt."""
@@ -554,6 +578,16 @@ class PracticeLifeCycleTest(PracticeBase):
         patched_print = self.practice(FI_NL, quizzes)
         self.assert_printed(DONE, patched_print)
 
+    @patch("builtins.input", Mock(side_effect=["incorrect\n", "Hoi\n", EOFError]))
+    @patch("toisto.command.practice.Thread")
+    def test_look_ahead_after_last_attempt(self, thread: Mock) -> None:
+        """Test that the next quiz is determined in the background after the last attempt only."""
+        concept = self.create_concept_fixture()
+        quizzes = create_quizzes(FI_NL, (READ,), concept)
+        progress = self.progress(FI_NL, quizzes)
+        self.practice(FI_NL, quizzes, progress)
+        thread.assert_called_once_with(target=progress.look_ahead, daemon=True)
+
     @patch("builtins.input", Mock(side_effect=[EOFError]))
     def test_exit(self):
         """Test that the user can quit."""
@@ -564,6 +598,8 @@ class PracticeLifeCycleTest(PracticeBase):
 
 
 @patch("pathlib.Path.open", MagicMock())
+@patch("toisto.persistence.progress.locked", MagicMock())
+@patch("os.fsync", Mock())
 @patch("toisto.ui.speech.gTTS", Mock())
 @patch("toisto.ui.speech.Popen", Mock())
 class PracticeProgressTest(PracticeBase):
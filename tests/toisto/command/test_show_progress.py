@@ -32,10 +32,10 @@ class ShowProgressTestCase(ToistoTestCase):
         self.quizzes = Quizzes({self.quiz})
 
     @patch("rich.console.Console.pager", MagicMock())
-    def show_progress(self, progress: Progress) -> Mock:
+    def show_progress(self, progress: Progress, sorted_keys: list[str] | None = None) -> Mock:
         """Run the show progress command."""
         with patch("rich.console.Console.print") as console_print:
-            show_progress(progress, Namespace(sort=self.SORT_COLUMN))
+            show_progress(progress, Namespace(sort=self.SORT_COLUMN), sorted_keys)
         return console_print
 
 
@@ -76,15 +76,17 @@ class ShowProgressTest(ShowProgressTestCase):
 
     def test_quiz_silenced_until_time_in_the_future(self):
         """Test that if the time until which a quiz is silenced lies in the future, it is shown."""
-        skip_until = self.progress.get_retention(self.quiz).skip_until = self.now + timedelta(days=1)
+        skip_until = self.now + timedelta(days=1)
         formatted_skip_until = skip_until.replace(tzinfo=None).isoformat(sep=" ", timespec="minutes")
-        console_print = self.show_progress(self.progress)
+        progress = Progress(FI, self.quizzes, {self.quiz.key: {"skip_until": skip_until.isoformat()}})
+        console_print = self.show_progress(progress)
         self.assertEqual(formatted_skip_until, first(console_print.call_args[0][0].columns[7].cells))
 
     def test_quiz_silenced_until_time_in_the_past(self):
         """Test that if the time until which a quiz is silenced lies in the past, it is not shown."""
-        self.progress.get_retention(self.quiz).skip_until = self.now - timedelta(days=1)
-        console_print = self.show_progress(self.progress)
+        skip_until = self.now - timedelta(days=1)
+        progress = Progress(FI, self.quizzes, {self.quiz.key: {"skip_until": skip_until.isoformat()}})
+        console_print = self.show_progress(progress)
         self.assertEqual("", first(console_print.call_args[0][0].columns[7].cells))
 
     def test_that_spelling_alternatives_are_shown(self):
@@ -150,6 +152,12 @@ class ShowProgressByAttemptsTest(ShowProgressSortTestCase):
         console_print = self.show_progress(progress)
         self.assertEqual(["21", "4"], list(console_print.call_args[0][0].columns[5].cells))
 
+    def test_sorted_keys(self):
+        """Test that the quizzes are shown in the order of the sorted keys, followed by quizzes without progress."""
+        progress = Progress(FI, self.quizzes, {self.another_quiz.key: {"count": 4}})
+        console_print = self.show_progress(progress, [self.another_quiz.key, "unknown:read"])
+        self.assertEqual(["4", "0"], list(console_print.call_args[0][0].columns[5].cells))
+
 
 class ShowProgressByRetentionTest(ShowProgressSortTestCase):
     """Test the show progress command, when sorting by retention."""
@@ -0,0 +1,40 @@
+"""Unit tests for grammatical categories."""
+
+from typing import cast, get_args
+
+from toisto.model.language.grammatical_category import (
+    DEFAULT_CATEGORIES,
+    DEFAULT_CATEGORIES_MASK,
+    GrammaticalCategory,
+    grammatical_categories_from_mask,
+    grammatical_categories_mask,
+)
+
+from ....base import ToistoTestCase
+
+
+class GrammaticalCategoriesMaskTest(ToistoTestCase):
+    """Unit tests for encoding grammatical categories as bitmask."""
+
+    def test_empty(self):
+        """Test that no grammatical categories are encoded as zero."""
+        self.assertEqual(0, grammatical_categories_mask(()))
+        self.assertEqual(frozenset(), grammatical_categories_from_mask(0))
+
+    def test_one_bit_per_category(self):
+        """Test that each grammatical category has its own bit."""
+        masks = [grammatical_categories_mask([category]) for category in get_args(GrammaticalCategory)]
+        self.assertTrue(all(mask.bit_count() == 1 for mask in masks))
+        self.assertEqual(len(masks), len(set(masks)))
+
+    def test_round_trip(self):
+        """Test that the grammatical categories can be decoded from the bitmask."""
+        self.assertEqual(DEFAULT_CATEGORIES, grammatical_categories_from_mask(DEFAULT_CATEGORIES_MASK))
+
+    def test_unknown_category(self):
+        """Test that a grammatical category that is not in the GrammaticalCategory type gets a new bit."""
+        unknown = cast("GrammaticalCategory", "dual")
+        mask = grammatical_categories_mask([unknown])
+        self.assertEqual(1, mask.bit_count())
+        self.assertGreaterEqual(mask, 1 << len(get_args(GrammaticalCategory)))
+        self.assertEqual({unknown}, grammatical_categories_from_mask(mask))
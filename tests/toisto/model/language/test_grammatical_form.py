@@ -1,5 +1,6 @@
 """Unit tests for grammar."""
 
+from toisto.model.language.grammatical_category import grammatical_categories_mask
 from toisto.model.language.grammatical_form import GrammaticalForm
 
 from ....base import ToistoTestCase
@@ -37,3 +38,12 @@ class GrammaticalFormTest(ToistoTestCase):
         self.assertEqual({"first person"}, singular.grammatical_differences(first_person_singular))
         self.assertEqual(set(), first_person_singular.grammatical_differences(singular))
         self.assertEqual({"plural"}, first_person_singular.grammatical_differences(plural))
+
+    def test_grammatical_differences_mask(self):
+        """Test the grammatical differences between two grammatical forms as bitmask."""
+        singular = GrammaticalForm("", "singular")
+        first_person_singular = GrammaticalForm("", "singular", "first person")
+        self.assertEqual(0, first_person_singular.grammatical_differences_mask(singular))
+        self.assertEqual(
+            grammatical_categories_mask(["first person"]), singular.grammatical_differences_mask(first_person_singular)
+        )
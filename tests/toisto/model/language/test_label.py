@@ -4,7 +4,7 @@ from itertools import permutations
 
 from toisto.model.language import EN, FI, NL
 from toisto.model.language.grammatical_form import GrammaticalForm
-from toisto.model.language.label import Label, Labels
+from toisto.model.language.label import GrammaticalSiblings, Label, Labels
 
 from ....base import ToistoTestCase
 
@@ -198,6 +198,58 @@ class LabelTest(ToistoTestCase):
         self.assertFalse(o_a.has_same_grammatical_form(among_others))
 
 
+class GrammaticalSiblingsTest(ToistoTestCase):
+    """Unit tests for the GrammaticalSiblings class."""
+
+    def setUp(self) -> None:
+        """Extend to create the labels."""
+        super().setUp()
+        self.singular = Label(FI, "talo", GrammaticalForm("talo", "singular", "nominative"))
+        self.plural = Label(FI, "talot", GrammaticalForm("talo", "plural", "nominative"))
+        self.singular_partitive = Label(FI, "taloa", GrammaticalForm("talo", "singular", "partitive"))
+        self.plural_partitive = Label(FI, "taloja", GrammaticalForm("talo", "plural", "partitive"))
+        self.other_base = Label(FI, "auto", GrammaticalForm("auto", "singular", "nominative"))
+        self.other_language = Label(NL, "het huis", GrammaticalForm("talo", "singular"))
+        self.labels = (
+            self.singular,
+            self.plural,
+            self.singular_partitive,
+            self.plural_partitive,
+            self.other_base,
+            self.other_language,
+        )
+        self.grammatical_siblings = GrammaticalSiblings(self.labels)
+
+    def test_siblings(self):
+        """Test that the siblings are the labels with the same language and grammatical base, in order."""
+        self.assertEqual(
+            [self.singular, self.plural, self.singular_partitive, self.plural_partitive],
+            list(self.grammatical_siblings.siblings(self.plural_partitive)),
+        )
+        self.assertEqual([self.other_base], list(self.grammatical_siblings.siblings(self.other_base)))
+
+    def test_siblings_of_unknown_label(self):
+        """Test that a label that is not in the index has no siblings."""
+        self.assertEqual([], list(self.grammatical_siblings.siblings(Label(EN, "house"))))
+
+    def test_one_category_apart(self):
+        """Test that the siblings that have one grammatical category the label does not have can be enumerated."""
+        self.assertEqual(
+            [self.plural, self.singular_partitive], list(self.grammatical_siblings.one_category_apart(self.singular))
+        )
+        self.assertEqual([], list(self.grammatical_siblings.one_category_apart(self.other_language)))
+
+    def test_one_category_apart_is_consistent_with_grammatical_differences(self):
+        """Test that the siblings one category apart are the siblings with one grammatical difference."""
+        for label in self.labels:
+            expected = [
+                sibling
+                for sibling in self.grammatical_siblings.siblings(label)
+                if len(sibling.grammatical_differences(label)) == 1
+            ]
+            self.assertEqual(expected, list(self.grammatical_siblings.one_category_apart(label)))
+
+
 class LabelsTest(ToistoTestCase):
     """Unit tests for the Labels class."""
 
@@ -1,20 +1,35 @@
 """Progress unit tests."""
 
-from typing import TYPE_CHECKING, cast
+from collections import deque
+from datetime import UTC, datetime, timedelta, tzinfo
+from typing import Self, cast
+from unittest.mock import Mock, patch
 
-from toisto.model.language import EN, FI, NL
-from toisto.model.language.concept import ConceptId
+from toisto.model.language import EN, FI, NL, LanguagePair
+from toisto.model.language.concept import Concept, ConceptId
 from toisto.model.quiz.evaluation import Evaluation
 from toisto.model.quiz.progress import Progress
-from toisto.model.quiz.quiz import Quizzes
-from toisto.model.quiz.quiz_factory import create_quizzes
+from toisto.model.quiz.quiz import Quiz, Quizzes
+from toisto.model.quiz.quiz_factory import QuizFactory, create_quizzes
+from toisto.model.quiz.quiz_source import LazyQuizSource
 from toisto.model.quiz.quiz_type import DICTATE, TranslationQuizType
+from toisto.model.quiz.retention import SKIP_INTERVAL_WHEN_RELATED_QUIZ_IS_ANSWERED_CORRECTLY, Retention
+from toisto.persistence.progress_format import ProgressDict, RetentionDict
+from toisto.persistence.progress_snapshot import ProgressSnapshot
 from toisto.tools import first
 
 from ....base import FI_NL, NL_EN, ToistoTestCase
 
-if TYPE_CHECKING:
-    from toisto.model.quiz.quiz import Quiz
+
+class Clock(datetime):
+    """Clock that can be set and advanced by the tests."""
+
+    current = datetime(2026, 1, 1, tzinfo=UTC)
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> Self:  # noqa: ARG003
+        """Override to return the current time of the clock."""
+        return cls.fromtimestamp(cls.current.timestamp(), cls.current.tzinfo)
 
 
 class ProgressTest(ToistoTestCase):
@@ -73,6 +88,22 @@ class ProgressTest(ToistoTestCase):
         next_quiz = cast("Quiz", self.progress.next_quiz())
         self.assertTrue(next_quiz.has_quiz_type(TranslationQuizType))
 
+    def test_grammatical_quizzes_block_answer_quizzes(self):
+        """Test that answer quizzes are blocked if grammatical quizzes are eligible."""
+        question = self.create_concept(
+            "how are you", {"answer": ConceptId("fine")}, labels=[{"label": "Mitä kuuluu?", "language": FI}]
+        )
+        answer = self.create_concept("fine", labels=[{"label": "Hyvää.", "language": FI}])
+        house = self.create_concept(
+            "house", labels=[{"label": {"singular": "talo", "plural": "talot"}, "language": FI}]
+        )
+        quizzes = create_quizzes(FI_NL, (), question, answer, house)
+        silenced: ProgressDict = {
+            quiz.key: {"skip_until": "3000-01-01T00:00:00+00:00"} for quiz in quizzes if quiz.action == "dictate"
+        }
+        progress = Progress(FI, quizzes, silenced)
+        self.assertIsNone(progress.next_quiz())  # The grammatical quizzes are blocked by the answer quiz in turn
+
     def test_roots_block_quizzes(self):
         """Test that quizzes are blocked if roots have eligible quizzes."""
         concept1 = self.create_concept(
@@ -90,6 +121,25 @@ class ProgressTest(ToistoTestCase):
         next_quiz = cast("Quiz", progress.next_quiz())
         self.assertEqual("good", next_quiz.concept.concept_id)
 
+    def test_roots_no_longer_block_quizzes_when_root_quizzes_are_silenced(self):
+        """Test that quizzes are unblocked when the quizzes of their roots are silenced."""
+        concept1 = self.create_concept(
+            "good day",
+            labels=[
+                {"label": "good day", "language": EN, "roots": "good"},
+                {"label": "goedendag", "language": NL, "roots": "goed"},
+            ],
+        )
+        concept2 = self.create_concept(
+            "good", labels=[{"label": "good", "language": EN}, {"label": "goed", "language": NL}]
+        )
+        quizzes = create_quizzes(NL_EN, (), concept1, concept2)
+        progress = Progress(NL, quizzes, {}, skip_concepts=0)
+        for quiz in quizzes.by_concept(concept2):
+            progress.mark_evaluation(quiz, Evaluation.CORRECT)
+        next_quiz = cast("Quiz", progress.next_quiz())
+        self.assertEqual("good day", next_quiz.concept.concept_id)
+
     def test_roots_block_quizzes_even_if_roots_only_apply_to_target_language(self):
         """Test that quizzes are blocked, even if the roots only apply to the target language."""
         concept1 = self.create_concept(
@@ -143,10 +193,11 @@ class ProgressTest(ToistoTestCase):
         ]
         quizzes = create_quizzes(FI_NL, (DICTATE,), *concepts)
         progress = Progress(FI, quizzes, {})
-        random_quiz = next(iter(quizzes))
-        retention = progress.mark_evaluation(random_quiz, Evaluation.CORRECT)
-        retention.skip_until = None
-        self.assertEqual(progress.next_quiz(), random_quiz)
+        last_quiz = max(quizzes, key=lambda quiz: quiz.key)
+        with patch("toisto.model.quiz.retention.datetime", Clock):
+            progress.mark_evaluation(last_quiz, Evaluation.CORRECT)
+            Clock.current += timedelta(days=2)
+            self.assertEqual(progress.next_quiz(), last_quiz)
 
     def test_next_quiz_prefers_most_practiced(self):
         """Test that within an eligible pool the most-practiced quiz comes first.
@@ -187,10 +238,109 @@ class ProgressTest(ToistoTestCase):
         progress_b = Progress(FI, quizzes, {})
         self.assertEqual(progress_a.next_quiz(), progress_b.next_quiz())
 
+    def test_look_ahead(self):
+        """Test that the next quiz can be determined in advance."""
+        expected_quiz = Progress(FI, self.quizzes, {}).next_quiz()
+        self.progress.look_ahead()
+        self.assertEqual(expected_quiz, self.progress.next_quiz())
+
+    def test_look_ahead_when_no_quizzes_are_left(self):
+        """Test that looking ahead finds no next quiz if all quizzes are silenced."""
+        progress = Progress(FI, self.quizzes, {}, skip_concepts=0)
+        for quiz in self.quizzes:
+            progress.mark_evaluation(quiz, Evaluation.CORRECT)
+        progress.look_ahead()
+        self.assertIsNone(progress.next_quiz())
+
+    def test_look_ahead_before_evaluation(self):
+        """Test that the next quiz is determined anew if an evaluation is marked after looking ahead."""
+        progress = Progress(FI, self.quizzes, {}, skip_concepts=0)
+        quiz = cast("Quiz", progress.next_quiz())
+        progress.look_ahead()
+        progress.mark_evaluation(quiz, Evaluation.CORRECT)  # Silences the quiz and pauses the other quizzes
+        self.assertIsNone(progress.next_quiz())
+
+    def test_look_ahead_before_silence_ends(self):
+        """Test that the next quiz is determined anew if the silence of a quiz ends after looking ahead."""
+        concepts = [
+            self.create_concept(
+                f"id{index}", labels=[{"label": f"fi{index}", "language": FI}, {"label": f"nl{index}", "language": NL}]
+            )
+            for index in range(2)
+        ]
+        quizzes = create_quizzes(FI_NL, (DICTATE,), *concepts)
+        progress = Progress(FI, quizzes, {}, skip_concepts=0)
+        last_quiz = max(quizzes, key=lambda quiz: quiz.key)
+        with patch("toisto.model.quiz.retention.datetime", Clock):
+            progress.mark_evaluation(last_quiz, Evaluation.CORRECT)
+            progress.look_ahead()
+            Clock.current += timedelta(days=2)
+            self.assertEqual(last_quiz, progress.next_quiz())
+
     def test_as_dict(self):
         """Test that the progress can be retrieved as dict."""
         self.assertEqual({}, self.progress.as_dict())
 
+    def test_orphans(self):
+        """Test that progress on quizzes of the language pair that are not among the quizzes is orphaned."""
+        quiz = first(self.quizzes)
+        progress_dict: ProgressDict = {
+            quiz.key: {"count": 1},
+            "fi:nl:vanha:oud:read": {"count": 2},
+            "nl:fi:oud:vanha:write": {"count": 3},
+            "fi:en:vanha:old:read": {"count": 4},
+        }
+        progress = Progress(FI, self.quizzes, progress_dict)
+        self.assertEqual(
+            {"fi:nl:vanha:oud:read": {"count": 2}, "nl:fi:oud:vanha:write": {"count": 3}},
+            progress.orphans(FI_NL, {quiz.key for quiz in self.quizzes}),
+        )
+
+    def test_remove(self):
+        """Test that progress can be removed."""
+        quiz = first(self.quizzes)
+        progress = Progress(FI, self.quizzes, {quiz.key: {"count": 1}, "fi:nl:vanha:oud:read": {"count": 2}})
+        progress.remove(["fi:nl:vanha:oud:read"])
+        self.assertEqual({quiz.key: {"count": 1}}, progress.as_dict())
+
+    def test_snapshot(self):
+        """Test that the progress can be loaded from and retrieved as snapshot."""
+        quiz = first(self.quizzes)
+        snapshot = ProgressSnapshot.from_progress_dict({quiz.key: {"count": 2}, "invalid:key": {"count": 1}})
+        progress = Progress(FI, Quizzes([quiz]), {}, snapshot=snapshot)
+        self.assertEqual({quiz.key: {"count": 2}}, progress.snapshot().as_dict())
+
+    def test_pop_changes(self):
+        """Test that the changed progress is popped once."""
+        quiz = first(self.quizzes)
+        self.progress.mark_evaluation(quiz, Evaluation.INCORRECT)
+        self.assertEqual({quiz.key: {"count": 1}}, self.progress.pop_changes())
+        self.assertEqual({}, self.progress.pop_changes())
+
+    def test_pop_changes_merges_progress_of_other_sessions(self):
+        """Test that the progress saved by other sessions is merged before the changes are popped."""
+        quiz = first(self.quizzes)
+        self.progress.mark_evaluation(quiz, Evaluation.INCORRECT)
+        merge = Mock(return_value={quiz.key: {"count": 3}, "invalid:key": {"count": 1}})
+        self.assertEqual({quiz.key: {"count": 4}}, self.progress.pop_changes(merge))
+        merge.assert_called_once_with([quiz.key])
+        self.assertEqual({}, self.progress.pop_changes(Mock(return_value={})))
+
+    def test_merged_progress_is_used_to_pick_the_next_quiz(self):
+        """Test that the next quiz is picked using the progress merged from other sessions."""
+        quizzes = sorted(self.quizzes, key=lambda quiz: quiz.key)
+        self.progress.look_ahead()
+        future = "3000-01-01T00:00:00+00:00"
+        self.progress.pop_changes(lambda _keys: {quiz.key: {"skip_until": future} for quiz in quizzes[:-1]})
+        self.assertEqual(quizzes[-1], self.progress.next_quiz())
+
+    def test_progress_dict_replaces_snapshot(self):
+        """Test that the retentions in the progress dict replace the retentions in the snapshot."""
+        quiz = first(self.quizzes)
+        snapshot = ProgressSnapshot.from_progress_dict({quiz.key: {"count": 2}})
+        progress = Progress(FI, Quizzes([quiz]), {quiz.key: {"count": 3}}, snapshot=snapshot)
+        self.assertEqual({quiz.key: {"count": 3}}, progress.as_dict())
+
 
 class ProgressOfRelatedQuizzesTest(ToistoTestCase):
     """Unit tests for the progress class."""
@@ -214,3 +364,241 @@ class ProgressOfRelatedQuizzesTest(ToistoTestCase):
         self.progress.mark_evaluation(next(iter(self.concept_quizzes)), Evaluation.CORRECT)
         for quiz in self.quizzes:
             self.assertIsNotNone(self.progress.get_retention(quiz).skip_until, quiz)
+
+
+class ProgressOfLazyQuizSourceTest(ToistoTestCase):
+    """Unit tests for the progress class with a quiz source that generates quizzes lazily."""
+
+    def assert_same_quizzes(self, language_pair: LanguagePair, *concepts: Concept, **progress_dict: int) -> None:
+        """Assert that the progress picks the same quizzes from all quizzes as from a lazy quiz source."""
+        progress_dicts: ProgressDict = {key: RetentionDict(count=count) for key, count in progress_dict.items()}
+        eager = Progress(language_pair.target, create_quizzes(language_pair, (), *concepts), progress_dicts)
+        quiz_source = LazyQuizSource(language_pair, concepts, QuizFactory(language_pair, ()).concept_quizzes)
+        lazy = Progress(language_pair.target, quiz_source, progress_dicts)
+        while quiz := eager.next_quiz():
+            self.assertEqual(quiz.key, cast("Quiz", lazy.next_quiz()).key)
+            for progress in (eager, lazy):
+                progress.mark_evaluation(quiz, Evaluation.CORRECT)
+        self.assertIsNone(lazy.next_quiz())
+
+    def test_roots(self):
+        """Test that quizzes blocked by roots are picked in the same order."""
+        good_day = self.create_concept(
+            "good day",
+            labels=[
+                {"label": "good day", "language": EN, "roots": "good"},
+                {"label": "goedendag", "language": NL, "roots": "goed"},
+            ],
+        )
+        good = self.create_concept(
+            "good", labels=[{"label": "good", "language": EN}, {"label": "goed", "language": NL}]
+        )
+        self.assert_same_quizzes(NL_EN, good_day, good)
+
+    def test_grammatical_forms(self):
+        """Test that quizzes of concepts with grammatical forms are picked in the same order."""
+        morning = self.create_concept(
+            "morning",
+            labels=[
+                {"label": {"singular": "aamu", "plural": "aamut"}, "language": FI},
+                {"label": {"singular": "de ochtend", "plural": "de ochtenden"}, "language": NL},
+            ],
+        )
+        evening = self.create_concept(
+            "evening",
+            labels=[
+                {"label": {"singular": "ilta", "plural": "illat"}, "language": FI},
+                {"label": {"singular": "de avond", "plural": "de avonden"}, "language": NL},
+            ],
+        )
+        self.assert_same_quizzes(FI_NL, morning, evening)
+
+    def test_progress(self):
+        """Test that quizzes with progress are picked in the same order."""
+        concepts = [
+            self.create_concept(
+                f"id{index}", labels=[{"label": f"fi{index}", "language": FI}, {"label": f"nl{index}", "language": NL}]
+            )
+            for index in range(3)
+        ]
+        self.assert_same_quizzes(FI_NL, *concepts, **{"nl:fi:nl2:fi2:write": 2, "fi:fi:fi1:fi1:dictate": 1})
+
+    def test_quiz_types(self):
+        """Test that quizzes blocked by the quiz types of quizzes not generated yet are picked in the same order."""
+        target_only = self.create_concept("aaa", labels=[{"label": "aaa", "language": FI}])
+        translation = self.create_concept(
+            "zzz", labels=[{"label": "zzz", "language": FI}, {"label": "z", "language": NL}]
+        )
+        self.assert_same_quizzes(FI_NL, target_only, translation)
+
+
+class ReferenceScheduler:
+    """Scheduler that picks the next quiz by scanning all quizzes, as a reference for the progress class.
+
+    The reference keeps its own retentions, so it does not depend on how the progress class stores them.
+    """
+
+    def __init__(self, quizzes: Quizzes, progress_dict: ProgressDict) -> None:
+        self.quizzes = quizzes
+        self.retentions = {key: Retention.from_dict(retention_dict) for key, retention_dict in progress_dict.items()}
+        self.recent_concepts: deque[Concept] = deque(maxlen=5)
+
+    def retention(self, quiz: Quiz) -> Retention:
+        """Return the retention of the quiz."""
+        return self.retentions.get(quiz.key, Retention())
+
+    def next_quiz(self) -> Quiz | None:
+        """Return the next quiz."""
+        eligible = [
+            quiz
+            for quiz in self.quizzes
+            if quiz.concept not in self.recent_concepts and not self.retention(quiz).is_silenced()
+        ]
+        eligible_quiz_types = {quiz.quiz_type for quiz in eligible}
+        concepts_in_progress = {quiz.concept for quiz in self.quizzes if quiz.key in self.retentions}
+
+        def blocked(quiz: Quiz) -> bool:
+            roots = [root for label in {quiz.question, *quiz.answers} for root in label.roots]
+            root_quizzes = [other for root in roots for other in self.quizzes.by_label(root) if other != quiz]
+            return any(other in eligible for other in root_quizzes) or quiz.is_blocked_by_quiz_types(
+                eligible_quiz_types
+            )
+
+        tiers = [
+            [quiz for quiz in eligible if quiz.key in self.retentions],
+            [quiz for quiz in eligible if quiz.concept in concepts_in_progress],
+            eligible,
+        ]
+        for tier in tiers:
+            if unblocked := [quiz for quiz in tier if not blocked(quiz)]:
+                quiz = min(unblocked, key=lambda quiz: (-self.retention(quiz).count, quiz.key))
+                self.recent_concepts.append(quiz.concept)
+                return quiz
+        return None
+
+    def as_dict(self) -> ProgressDict:
+        """Return the retentions as progress dict."""
+        return {key: retention.as_dict() for key, retention in self.retentions.items()}
+
+    def mark_evaluation(self, quiz: Quiz, evaluation: Evaluation) -> None:
+        """Mark the evaluation, and pause the related quizzes if the answer was correct."""
+        retention = self.retentions.setdefault(quiz.key, Retention())
+        if evaluation == Evaluation.CORRECT:
+            retention.increase()
+            current_datetime = Clock.now()
+            for related_quiz in self.quizzes.related_quizzes(quiz):
+                if related_quiz != quiz:
+                    related_retention = self.retentions.setdefault(related_quiz.key, Retention())
+                    skip_until = related_retention.skip_until or current_datetime
+                    pause_until = current_datetime + SKIP_INTERVAL_WHEN_RELATED_QUIZ_IS_ANSWERED_CORRECTLY
+                    related_retention.skip_until = max(skip_until, pause_until)
+        else:
+            retention.reset()
+
+
+@patch("toisto.model.quiz.retention.datetime", Clock)
+class ProgressSchedulerTest(ToistoTestCase):
+    """Differential tests comparing the scheduler of the progress class with scanning all quizzes."""
+
+    def setUp(self) -> None:
+        """Extend to create the concepts."""
+        super().setUp()
+        Clock.current = datetime(2026, 1, 1, tzinfo=UTC)
+        self.concepts = [
+            self.create_concept(
+                "day", labels=[{"label": "päivä", "language": FI}, {"label": "de dag", "language": NL}]
+            ),
+            self.create_concept(
+                "good day",
+                labels=[
+                    {"label": "hyvää päivää", "language": FI, "roots": "päivä"},
+                    {"label": "goedendag", "language": NL},
+                ],
+            ),
+            self.create_concept(
+                "house",
+                {"example": ConceptId("my house")},
+                labels=[
+                    {"label": {"singular": "talo", "plural": "talot"}, "language": FI},
+                    {"label": {"singular": "het huis", "plural": "de huizen"}, "language": NL},
+                ],
+            ),
+            self.create_concept(
+                "my house",
+                labels=[{"label": "Tämä on taloni.", "language": FI}, {"label": "Dit is mijn huis.", "language": NL}],
+            ),
+            self.create_concept(
+                "small",
+                {"antonym": ConceptId("big")},
+                labels=[{"label": "pieni", "language": FI}, {"label": "klein", "language": NL}],
+            ),
+            self.create_concept("big", labels=[{"label": "iso", "language": FI}, {"label": "groot", "language": NL}]),
+            self.create_concept("hi", labels=[{"label": "moi", "language": FI}]),
+            *[
+                self.create_concept(
+                    f"word{index}",
+                    labels=[{"label": f"sana{index}", "language": FI}, {"label": f"woord{index}", "language": NL}],
+                )
+                for index in range(5)
+            ],
+        ]
+        self.quizzes = create_quizzes(FI_NL, (), *self.concepts)
+
+    def assert_same_quizzes(self, progress: Progress, progress_dict: ProgressDict) -> None:
+        """Assert that the progress picks the same quizzes as the reference, while answering and advancing time."""
+        reference = ReferenceScheduler(self.quizzes, progress_dict)
+        evaluations = [
+            Evaluation.CORRECT,
+            Evaluation.CORRECT,
+            Evaluation.CORRECT,
+            Evaluation.INCORRECT,
+            Evaluation.CORRECT,
+            Evaluation.CORRECT,
+            Evaluation.CORRECT,
+            Evaluation.CORRECT,
+            Evaluation.SKIPPED,
+        ]
+        for step in range(300):
+            expected = reference.next_quiz()
+            quiz = progress.next_quiz()
+            self.assertEqual(expected, quiz, f"step {step}")
+            if quiz:
+                evaluation = evaluations[step % len(evaluations)]
+                progress.mark_evaluation(quiz, evaluation)
+                reference.mark_evaluation(quiz, evaluation)
+                self.assertEqual(
+                    self.retentions(reference.as_dict()), self.retentions(progress.as_dict()), f"step {step}"
+                )
+            Clock.current += timedelta(days=2) if step % 25 == 0 else timedelta(minutes=3 if step % 3 else 90)
+
+    @staticmethod
+    def retentions(progress_dict: ProgressDict) -> dict[str, Retention]:
+        """Return the retentions in the progress dict, to compare retentions with the precision of progress files."""
+        return {key: Retention.from_dict(retention_dict) for key, retention_dict in progress_dict.items()}
+
+    def test_all_quizzes(self):
+        """Test that the scheduler picks the same quizzes as scanning all quizzes."""
+        self.assert_same_quizzes(Progress(FI, self.quizzes, {}), {})
+
+    def test_lazy_quiz_source(self):
+        """Test that the scheduler picks the same quizzes from a lazy quiz source as scanning all quizzes."""
+        quiz_source = LazyQuizSource(FI_NL, self.concepts, QuizFactory(FI_NL, ()).concept_quizzes)
+        self.assert_same_quizzes(Progress(FI, quiz_source, {}), {})
+
+    def test_progress(self):
+        """Test that the scheduler picks the same quizzes as scanning all quizzes when there is progress."""
+        progress_dict: ProgressDict = {
+            "nl:fi:de dag:päivä:write": {"count": 3, "skip_until": "2026-01-01T02:00:00+00:00"},
+            "fi:nl:talot:de huizen:read": {"count": 1},
+            "fi:fi:sana3:sana3:dictate": {"count": 2, "skip_until": "2026-01-03T00:00:00+00:00"},
+        }
+        self.assert_same_quizzes(Progress(FI, self.quizzes, progress_dict), progress_dict)
+
+    def test_progress_from_snapshot(self):
+        """Test that the scheduler picks the same quizzes when the progress is loaded from a snapshot."""
+        progress_dict: ProgressDict = {
+            "nl:fi:de dag:päivä:write": {"count": 3, "skip_until": "2026-01-01T02:00:00+00:00"},
+            "fi:fi:sana3:sana3:dictate": {"count": 2, "skip_until": "2026-01-03T00:00:00+00:00"},
+        }
+        snapshot = ProgressSnapshot.from_progress_dict(progress_dict)
+        self.assert_same_quizzes(Progress(FI, self.quizzes, {}, snapshot=snapshot), progress_dict)
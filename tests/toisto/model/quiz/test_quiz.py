@@ -3,6 +3,7 @@
 from toisto.model.language import EN, FI, NL
 from toisto.model.language.concept import ConceptId
 from toisto.model.language.label import Label
+from toisto.model.quiz.quiz import Quizzes
 from toisto.model.quiz.quiz_type import (
     ABBREVIATION,
     AFFIRMATIVE,
@@ -601,6 +602,20 @@ class QuizEqualityTests(QuizTestCase):
         self.assertEqual(self.copy_quiz(self.quiz, question=Label(FI, "englanti", notes=("note",))), self.quiz)
         self.assertEqual(self.copy_quiz(self.quiz, answers=[Label(NL, "Engels", notes=("note",))]), self.quiz)
 
+    def test_equal_quizzes_have_the_same_identity(self):
+        """Test that equal quizzes have the same integer identity, used for hashing."""
+        quiz = self.copy_quiz(self.quiz, question=Label(FI, "englanti", notes=("note",)))
+        self.assertEqual(self.quiz.quiz_id, quiz.quiz_id)
+        self.assertEqual(hash(self.quiz), hash(quiz))
+
+    def test_different_quizzes_have_different_identities(self):
+        """Test that quizzes that are not equal have different integer identities."""
+        self.assertNotEqual(self.copy_quiz(self.quiz, quiz_type=DICTATE).quiz_id, self.quiz.quiz_id)
+
+    def test_key_is_looked_up_by_identity(self):
+        """Test that the key of a quiz is stored once, with its identity."""
+        self.assertIs(self.quiz.key, self.copy_quiz(self.quiz).key)
+
     def test_not_equal_with_different_questions(self):
         """Test that quizzes are not equal if only their questions differ."""
         self.assertNotEqual(self.copy_quiz(self.quiz, question=Label(FI, "Saksa")), self.quiz)
@@ -624,3 +639,45 @@ class QuizEqualityTests(QuizTestCase):
         """Test that quizzes are not equal if only the case of the answers differs."""
         answers = [answer.copy(str(answer).lower()) for answer in self.quiz.answers]
         self.assertNotEqual(self.copy_quiz(self.quiz, answers=answers), self.quiz)
+
+
+class QuizzesTests(QuizTestCase):
+    """Unit tests for the quizzes class."""
+
+    def setUp(self) -> None:
+        """Extend to set up test fixtures."""
+        super().setUp()
+        self.dictate_quiz = self.copy_quiz(self.quiz, quiz_type=DICTATE)
+        self.german = self.create_concept("german", {})
+        self.german_quiz = self.create_quiz(FI_NL, self.german, Label(FI, "saksa"), [Label(NL, "Duits")])
+        self.quizzes = Quizzes({self.quiz, self.dictate_quiz, self.german_quiz})
+
+    def test_from_iterables(self):
+        """Test that quizzes can be created from multiple iterables of quizzes."""
+        quizzes = Quizzes.from_iterables([self.quiz], (self.quiz, self.dictate_quiz), Quizzes({self.german_quiz}))
+        self.assertIsInstance(quizzes, Quizzes)
+        self.assertEqual(self.quizzes, quizzes)
+
+    def test_from_no_iterables(self):
+        """Test that quizzes can be created from no iterables."""
+        self.assertEqual(Quizzes(), Quizzes.from_iterables())
+
+    def test_by_concept(self):
+        """Test that the quizzes can be looked up by concept."""
+        self.assertEqual(Quizzes({self.quiz, self.dictate_quiz}), self.quizzes.by_concept(self.concept))
+        self.assertEqual(Quizzes({self.german_quiz}), self.quizzes.by_concept(self.german))
+        self.assertEqual(Quizzes(), self.quizzes.by_concept(self.create_concept("french", {})))
+
+    def test_by_label(self):
+        """Test that the quizzes can be looked up by question and answer label."""
+        self.assertEqual(Quizzes({self.quiz, self.dictate_quiz}), self.quizzes.by_label(Label(FI, "englanti")))
+        self.assertEqual(Quizzes({self.quiz, self.dictate_quiz}), self.quizzes.by_label(Label(NL, "Engels")))
+        self.assertEqual(Quizzes({self.german_quiz}), self.quizzes.by_label(Label(NL, "Duits")))
+        self.assertEqual(Quizzes(), self.quizzes.by_label(Label(NL, "Frans")))
+
+    def test_related_quizzes(self):
+        """Test that the related quizzes include the quizzes of the concept and of its examples."""
+        self.assertEqual(Quizzes({self.quiz, self.dictate_quiz}), self.quizzes.related_quizzes(self.quiz))
+        concept = self.create_concept("language", {"example": [ConceptId("english"), ConceptId("german")]})
+        quiz = self.create_quiz(FI_NL, concept, Label(FI, "kieli"), [Label(NL, "de taal")])
+        self.assertEqual(self.quizzes, self.quizzes.related_quizzes(quiz))
@@ -0,0 +1,88 @@
+"""Quiz catalogue unit tests."""
+
+from toisto.model.language import EN, FI, NL
+from toisto.model.language.concept import Concept, ConceptId
+from toisto.model.language.label import Label
+from toisto.model.quiz.quiz import Quizzes
+from toisto.model.quiz.quiz_catalogue import LabelReferences, QuizCatalogue
+from toisto.model.quiz.quiz_factory import create_quizzes
+
+from ....base import EN_NL, ToistoTestCase
+
+
+class QuizCatalogueTest(ToistoTestCase):
+    """Unit tests for the quiz catalogue."""
+
+    def setUp(self) -> None:
+        """Extend to create concepts and quizzes."""
+        super().setUp()
+        self.small = self.create_concept(
+            "small",
+            {"antonym": ConceptId("big")},
+            labels=[
+                {"label": {"singular": "small", "plural": "smalls"}, "language": EN, "cloze": "(small)"},
+                {"label": {"singular": "klein", "plural": "kleinen"}, "language": NL},
+            ],
+        )
+        self.big = self.create_concept(
+            "big",
+            {"antonym": ConceptId("small")},
+            labels=[{"label": "big", "language": EN}, {"label": "groot", "language": NL}],
+        )
+        self.quizzes = create_quizzes(EN_NL, (), self.small, self.big)
+        self.catalogue = QuizCatalogue.from_quizzes(EN_NL, self.quizzes)
+
+    def rebuilt_catalogue(self) -> QuizCatalogue:
+        """Return a catalogue rebuilt from the catalogue dict, as if it was read from a file."""
+        return QuizCatalogue(EN_NL, self.catalogue.as_dict())
+
+    def test_concept_ids(self):
+        """Test that the catalogue contains the concepts with quizzes."""
+        self.assertEqual({"small", "big"}, set(self.catalogue.concept_ids))
+
+    def test_keys(self):
+        """Test that the catalogue contains the quiz keys per concept."""
+        expected_keys = sorted(quiz.key for quiz in self.quizzes.by_concept(self.big))
+        self.assertEqual(tuple(expected_keys), self.rebuilt_catalogue().keys(ConceptId("big")))
+
+    def test_all_keys(self):
+        """Test that the catalogue contains the quiz keys of all concepts."""
+        self.assertEqual({quiz.key for quiz in self.quizzes}, self.rebuilt_catalogue().all_keys())
+
+    def test_rebuild_quizzes(self):
+        """Test that the quizzes can be rebuilt from the catalogue."""
+        self.assertEqual(self.quizzes, self.rebuilt_catalogue().all_quizzes())
+
+    def test_rebuild_quizzes_with_the_same_labels(self):
+        """Test that the rebuilt quizzes use the same labels, including cloze tests and labels of related concepts."""
+        quizzes = {quiz.key: quiz for quiz in self.quizzes}
+        for quiz in self.rebuilt_catalogue().all_quizzes():
+            question, answers = quiz.question_and_answers
+            original_question, original_answers = quizzes[quiz.key].question_and_answers
+            self.assertIs(original_question, question)
+            self.assertEqual(len(original_answers), len(answers))
+            for original_answer, answer in zip(original_answers, answers, strict=True):
+                self.assertIs(original_answer, answer)
+            self.assertEqual(quizzes[quiz.key].quiz_type, quiz.quiz_type)
+
+    def test_rebuild_quizzes_per_concept(self):
+        """Test that the quizzes of one concept can be rebuilt."""
+        self.assertEqual(self.quizzes.by_concept(self.small), self.rebuilt_catalogue().quizzes(ConceptId("small")))
+
+    def test_rebuild_quizzes_of_concept_without_quizzes(self):
+        """Test that rebuilding the quizzes of a concept without quizzes returns no quizzes."""
+        self.assertEqual(Quizzes(), self.rebuilt_catalogue().quizzes(ConceptId("medium")))
+
+
+class LabelReferencesTest(ToistoTestCase):
+    """Unit tests for the label references."""
+
+    def test_reference_to_label(self):
+        """Test that a label of a concept can be referenced."""
+        concept = self.create_concept("hello", labels=[{"label": "moi", "language": FI}])
+        self.assertEqual(["hello", 0], LabelReferences().reference(concept, concept.labels(FI)[0]))
+
+    def test_reference_to_label_of_other_concept(self):
+        """Test that a label that does not belong to a concept can't be referenced."""
+        concept: Concept = self.create_concept("hello", labels=[{"label": "moi", "language": FI, "cloze": "(moi)"}])
+        self.assertRaises(ValueError, LabelReferences().reference, concept, Label(FI, "moi"))
@@ -0,0 +1,138 @@
+"""Quiz queue unit tests."""
+
+from datetime import UTC, datetime
+
+from toisto.model.language import FI, NL
+from toisto.model.language.label import Label
+from toisto.model.quiz.quiz import Quiz
+from toisto.model.quiz.quiz_queue import QuizQueue, SilencedQuizzes
+
+from ....base import FI_NL, ToistoTestCase
+
+
+class QuizQueueTest(ToistoTestCase):
+    """Unit tests for the quiz queue."""
+
+    def setUp(self) -> None:
+        """Extend to create quizzes and the queue."""
+        super().setUp()
+        self.quiz1, self.quiz2, self.quiz3 = (
+            self.create_quiz(
+                FI_NL,
+                self.create_concept(f"concept{index}"),
+                Label(FI, f"kysymys{index}"),
+                [Label(NL, f"antwoord{index}")],
+            )
+            for index in range(3)
+        )
+        self.queue = QuizQueue()
+        for quiz in (self.quiz1, self.quiz2, self.quiz3):
+            self.queue.push(quiz, (0, quiz.key))
+
+    def visited_quizzes(self) -> list[Quiz]:
+        """Return the quizzes in the order in which the queue visits them when looking for the first quiz."""
+        quizzes: list[Quiz] = []
+
+        def visit(quiz: Quiz) -> bool:
+            """Record the quiz and return False, so the queue visits all quizzes."""
+            quizzes.append(quiz)
+            return False
+
+        self.queue.first(visit)
+        return quizzes
+
+    def test_empty(self):
+        """Test that an empty queue has no first quiz."""
+        self.assertIsNone(QuizQueue().first(lambda _quiz: True))
+
+    def test_first(self):
+        """Test that the first quiz is the quiz with the highest priority."""
+        self.assertEqual(self.quiz1, self.queue.first(lambda _quiz: True))
+
+    def test_first_with_predicate(self):
+        """Test that the first quiz is the quiz with the highest priority for which the predicate holds."""
+        self.assertEqual(self.quiz2, self.queue.first(lambda quiz: quiz != self.quiz1))
+        self.assertIsNone(self.queue.first(lambda _quiz: False))
+
+    def test_first_keeps_quizzes(self):
+        """Test that looking for the first quiz does not remove quizzes from the queue."""
+        self.queue.first(lambda quiz: quiz == self.quiz3)
+        self.assertEqual(self.quiz1, self.queue.first(lambda _quiz: True))
+
+    def test_change_priority(self):
+        """Test that the priority of a quiz can be changed."""
+        self.queue.push(self.quiz3, (-1, self.quiz3.key))
+        self.assertEqual(self.quiz3, self.queue.first(lambda _quiz: True))
+        self.queue.push(self.quiz3, (0, self.quiz3.key))
+        self.assertEqual(self.quiz1, self.queue.first(lambda _quiz: True))
+
+    def test_push_same_priority(self):
+        """Test that pushing a quiz with the same priority twice does not add the quiz twice."""
+        self.queue.push(self.quiz1, (0, self.quiz1.key))
+        self.assertEqual([self.quiz1, self.quiz2, self.quiz3], self.visited_quizzes())
+
+    def test_remove(self):
+        """Test that quizzes can be removed."""
+        self.queue.remove(self.quiz1)
+        self.assertEqual(self.quiz2, self.queue.first(lambda _quiz: True))
+
+    def test_remove_and_push_again(self):
+        """Test that a quiz that is removed and pushed again with the same priority is only returned once."""
+        self.queue.remove(self.quiz1)
+        self.queue.push(self.quiz1, (0, self.quiz1.key))
+        self.assertEqual([self.quiz1, self.quiz2, self.quiz3], self.visited_quizzes())
+
+
+class SilencedQuizzesTest(ToistoTestCase):
+    """Unit tests for the silenced quizzes."""
+
+    def setUp(self) -> None:
+        """Extend to create quizzes and silence them."""
+        super().setUp()
+        self.now = datetime(2026, 1, 1, tzinfo=UTC).timestamp()
+        self.quiz1, self.quiz2 = (
+            self.create_quiz(
+                FI_NL,
+                self.create_concept(f"concept{index}"),
+                Label(FI, f"kysymys{index}"),
+                [Label(NL, f"antwoord{index}")],
+            )
+            for index in range(2)
+        )
+        self.silenced_quizzes = SilencedQuizzes()
+        self.silenced_quizzes.add(self.quiz1, self.now + 7200)
+        self.silenced_quizzes.add(self.quiz2, self.now + 3600)
+
+    def test_contains(self):
+        """Test that silenced quizzes are contained."""
+        self.assertIn(self.quiz1, self.silenced_quizzes)
+
+    def test_silence_ended(self):
+        """Test that the silence has ended when the first quiz can be released."""
+        self.assertFalse(self.silenced_quizzes.silence_ended(self.now))
+        self.assertTrue(self.silenced_quizzes.silence_ended(self.now + 3600))
+        self.assertFalse(SilencedQuizzes().silence_ended(self.now))
+
+    def test_release_none(self):
+        """Test that no quizzes are released before their silence ends."""
+        self.assertEqual([], self.silenced_quizzes.release(self.now))
+
+    def test_release_in_order(self):
+        """Test that quizzes are released in the order in which their silence ends."""
+        self.assertEqual([self.quiz2], self.silenced_quizzes.release(self.now + 3600))
+        self.assertNotIn(self.quiz2, self.silenced_quizzes)
+        self.assertEqual([self.quiz1], self.silenced_quizzes.release(self.now + 86400))
+        self.assertEqual([], self.silenced_quizzes.release(self.now + 86400))
+
+    def test_remove(self):
+        """Test that removed quizzes are not released."""
+        self.silenced_quizzes.remove(self.quiz2)
+        self.assertNotIn(self.quiz2, self.silenced_quizzes)
+        self.assertEqual([self.quiz1], self.silenced_quizzes.release(self.now + 86400))
+
+    def test_silence_again(self):
+        """Test that a quiz that is silenced again is released when its new silence ends."""
+        self.silenced_quizzes.remove(self.quiz2)
+        self.silenced_quizzes.add(self.quiz2, self.now + 10800)
+        self.assertEqual([self.quiz1], self.silenced_quizzes.release(self.now + 7200))
+        self.assertEqual([self.quiz2], self.silenced_quizzes.release(self.now + 10800))
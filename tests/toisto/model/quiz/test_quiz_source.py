@@ -0,0 +1,181 @@
+"""Quiz source unit tests."""
+
+from toisto.model.language import EN, FI, NL
+from toisto.model.language.concept import ConceptId
+from toisto.model.language.label import Label
+from toisto.model.quiz.quiz import Quizzes
+from toisto.model.quiz.quiz_factory import QuizFactory, create_quizzes
+from toisto.model.quiz.quiz_source import LazyQuizSource, QuizSource
+
+from ....base import FI_NL, ToistoTestCase
+
+
+class QuizSourceTestCase(ToistoTestCase):
+    """Base class for quiz source unit tests."""
+
+    def setUp(self) -> None:
+        """Extend to create concepts."""
+        super().setUp()
+        self.english = self.create_concept(
+            "english", labels=[{"label": "englanti", "language": FI}, {"label": "Engels", "language": NL}]
+        )
+        self.language = self.create_concept(
+            "language",
+            {"example": ConceptId("english")},
+            labels=[{"label": "kieli", "language": FI}, {"label": "de taal", "language": NL}],
+        )
+        self.small = self.create_concept(
+            "small",
+            {"antonym": ConceptId("big")},
+            labels=[{"label": "pieni", "language": FI}, {"label": "klein", "language": NL}],
+        )
+        self.big = self.create_concept(
+            "big", labels=[{"label": "iso", "language": FI}, {"label": "groot", "language": NL}]
+        )
+        self.concepts = (self.english, self.language, self.small, self.big)
+
+
+class QuizSourceTest(QuizSourceTestCase):
+    """Unit tests for the quiz source that contains all quizzes from the start."""
+
+    def setUp(self) -> None:
+        """Extend to create the quiz source."""
+        super().setUp()
+        self.quizzes = create_quizzes(FI_NL, (), *self.concepts)
+        self.quiz_source = QuizSource(self.quizzes)
+
+    def test_quizzes(self):
+        """Test that the quiz source contains all quizzes."""
+        self.assertTrue(self.quiz_source.complete)
+        self.assertEqual(self.quizzes, self.quiz_source.quizzes)
+        self.assertEqual(self.quizzes, self.quiz_source.all_quizzes())
+        self.assertEqual(self.quizzes, Quizzes(self.quiz_source.generated_quizzes))
+
+    def test_by_concept(self):
+        """Test that the quizzes can be looked up by concept."""
+        for concept in self.concepts:
+            self.assertEqual(self.quizzes.by_concept(concept), self.quiz_source.by_concept(concept))
+
+    def test_by_label(self):
+        """Test that the quizzes can be looked up by label."""
+        for label in (Label(FI, "kieli"), Label(NL, "groot"), Label(NL, "Frans")):
+            self.assertEqual(self.quizzes.by_label(label), self.quiz_source.by_label(label))
+
+    def test_related_quizzes(self):
+        """Test that the related quizzes are the quizzes of the concept and its examples."""
+        quiz = next(iter(self.quizzes.by_concept(self.language)))
+        self.assertEqual(self.quizzes.related_quizzes(quiz), self.quiz_source.related_quizzes(quiz))
+
+    def test_related_quizzes_are_looked_up_once(self):
+        """Test that the related quizzes of a concept are looked up once."""
+        quiz = next(iter(self.quizzes.by_concept(self.language)))
+        self.assertIs(self.quiz_source.related_quizzes(quiz), self.quiz_source.related_quizzes(quiz))
+
+    def test_generate(self):
+        """Test that generating quizzes is a no-op as the source contains all quizzes."""
+        self.quiz_source.generate_all()
+        self.quiz_source.generate_concepts_with_keys("fi:nl:kieli:de taal:read")
+        self.assertFalse(self.quiz_source.generate_next_concept())
+        self.assertEqual(self.quizzes, self.quiz_source.quizzes)
+
+    def test_keep_first_of_equal_quizzes(self):
+        """Test that if quizzes of different concepts are equal, the quiz added first is kept."""
+        homograph = self.create_concept(
+            "homograph", labels=[{"label": "englanti", "language": FI}, {"label": "Engels", "language": NL}]
+        )
+        quiz_source = QuizSource([*self.quizzes.by_concept(self.english), *create_quizzes(FI_NL, (), homograph)])
+        self.assertEqual(Quizzes(), quiz_source.by_concept(homograph))
+
+
+class LazyQuizSourceTest(QuizSourceTestCase):
+    """Unit tests for the lazy quiz source."""
+
+    def setUp(self) -> None:
+        """Extend to create the quiz source."""
+        super().setUp()
+        self.quiz_source = LazyQuizSource(FI_NL, self.concepts, QuizFactory(FI_NL, ()).concept_quizzes)
+
+    def generated_concepts(self) -> set[str]:
+        """Return the ids of the concepts whose quizzes have been generated."""
+        return {quiz.concept.concept_id for quiz in self.quiz_source.generated_quizzes}
+
+    def test_no_quizzes_generated_initially(self):
+        """Test that the source does not generate quizzes up front."""
+        self.assertFalse(self.quiz_source.complete)
+        self.assertEqual(Quizzes(), self.quiz_source.quizzes)
+
+    def test_all_quizzes(self):
+        """Test that all quizzes can be generated."""
+        self.assertEqual(create_quizzes(FI_NL, (), *self.concepts), self.quiz_source.all_quizzes())
+        self.assertTrue(self.quiz_source.complete)
+
+    def test_by_concept(self):
+        """Test that looking up quizzes by concept generates the quizzes of the concept only."""
+        self.assertEqual(create_quizzes(FI_NL, (), self.english), self.quiz_source.by_concept(self.english))
+        self.assertEqual({"english"}, self.generated_concepts())
+
+    def test_related_quizzes(self):
+        """Test that looking up related quizzes generates the quizzes of the concept and its examples."""
+        quiz = next(iter(self.quiz_source.by_concept(self.language)))
+        related_quizzes = create_quizzes(FI_NL, (), self.english, self.language)
+        self.assertEqual(related_quizzes, self.quiz_source.related_quizzes(quiz))
+        self.assertEqual({"english", "language"}, self.generated_concepts())
+
+    def test_by_label(self):
+        """Test that looking up quizzes by label generates the quizzes of the concepts that may have the label."""
+        label = Label(NL, "Engels")
+        self.assertEqual(create_quizzes(FI_NL, (), self.english).by_label(label), self.quiz_source.by_label(label))
+        self.assertEqual({"english"}, self.generated_concepts())
+
+    def test_by_label_of_related_concept(self):
+        """Test that looking up quizzes by label generates the quizzes that have the label as answer."""
+        quizzes = self.quiz_source.by_label(Label(FI, "iso"))
+        self.assertEqual({"big", "small"}, {quiz.concept.concept_id for quiz in quizzes})
+        self.assertEqual(
+            {"big", "small"}, {quiz.concept.concept_id for quiz in self.quiz_source.by_label(Label(FI, "iso"))}
+        )
+
+    def test_by_label_when_complete(self):
+        """Test that looking up quizzes by label does not need the label index when all quizzes are generated."""
+        self.quiz_source.generate_all()
+        self.assertEqual(Quizzes(), self.quiz_source.by_label(Label(NL, "Frans")))
+
+    def test_generate_concepts_with_keys(self):
+        """Test that the quizzes of concepts with keys are generated."""
+        self.quiz_source.generate_concepts_with_keys("nl:fi:de taal:kieli:write", "invalid")
+        self.quiz_source.generate_concepts_with_keys("fi:fi:iso:iso:dictate")
+        self.assertEqual({"language", "big"}, self.generated_concepts())
+
+    def test_generate_concepts_with_keys_with_colons(self):
+        """Test that the quizzes of concepts with keys are generated, even if the question contains a colon."""
+        concept = self.create_concept(
+            "time", labels=[{"label": "klo 12:00", "language": FI}, {"label": "12:00 uur", "language": NL}]
+        )
+        quiz_source = LazyQuizSource(FI_NL, (concept,), QuizFactory(FI_NL, ()).concept_quizzes)
+        quiz_source.generate_concepts_with_keys("nl:fi:12:00 uur:klo 12:00:write")
+        self.assertTrue(quiz_source.complete)
+
+    def test_generate_next_concept(self):
+        """Test that the concepts are generated in the order of the lower bounds of their quiz keys."""
+        generated_concepts: list[str] = []
+        while self.quiz_source.generate_next_concept():
+            generated_concepts.extend(self.generated_concepts() - set(generated_concepts))
+        self.assertEqual(["english", "big", "language", "small"], generated_concepts)
+
+    def test_generate_next_concept_below_key(self):
+        """Test that a concept is only generated if it may have quizzes with keys below the given key."""
+        self.assertFalse(self.quiz_source.generate_next_concept("fi:fi:englanti"))
+        self.assertTrue(self.quiz_source.generate_next_concept("fi:fi:englantia"))
+        self.assertEqual({"english"}, self.generated_concepts())
+
+    def test_generate_next_concept_skips_generated_concepts(self):
+        """Test that concepts that were generated in the mean time are skipped."""
+        self.quiz_source.by_concept(self.english)
+        self.assertTrue(self.quiz_source.generate_next_concept())
+        self.assertEqual({"english", "big"}, self.generated_concepts())
+
+    def test_concepts_without_labels_are_not_generated(self):
+        """Test that concepts without labels in the language pair have no quizzes and are not generated."""
+        concept = self.create_concept("english", labels=[{"label": "English", "language": EN}])
+        quiz_source = LazyQuizSource(FI_NL, (concept,), QuizFactory(FI_NL, ()).concept_quizzes)
+        self.assertFalse(quiz_source.generate_next_concept())
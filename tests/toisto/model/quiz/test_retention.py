@@ -3,6 +3,7 @@
 import unittest
 from datetime import UTC, datetime, timedelta
 from typing import Literal, cast
+from unittest.mock import patch
 
 from toisto.model.quiz.retention import Retention
 
@@ -41,6 +42,16 @@ class RetentionTest(unittest.TestCase):
             (datetime.now().astimezone() + timedelta(days=1)).replace(microsecond=0),
         )
 
+    def test_clock(self):
+        """Test that the retention uses the clock to tell the time, so the clock can be replaced."""
+        current = datetime(2026, 1, 1, tzinfo=UTC)
+        with patch("toisto.model.quiz.retention.clock", lambda: current):
+            self.retention.increase()
+            self.assertEqual(current, self.retention.start)
+            self.assertTrue(self.retention.is_silenced())
+            current += timedelta(days=1)
+            self.assertFalse(self.retention.is_silenced())
+
     def test_is_not_silenced_after_one_correct_guess(self):
         """Test that a retention is not silenced after one correct guess."""
         self.guess("incorrect", "correct")
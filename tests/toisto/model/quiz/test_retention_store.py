@@ -0,0 +1,184 @@
+"""Retention store unit tests."""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from math import isnan
+
+from toisto.model.quiz.retention import Retention
+from toisto.model.quiz.retention_store import RetentionStore
+from toisto.persistence.progress_format import RetentionDict
+from toisto.persistence.progress_snapshot import ProgressSnapshot
+
+
+class RetentionStoreTest(unittest.TestCase):
+    """Unit tests for the retention store."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.store = RetentionStore()
+        self.start = datetime(2026, 1, 1, tzinfo=UTC)
+        self.retention = Retention(self.start, self.start + timedelta(days=1), self.start + timedelta(days=2), 2)
+
+    def test_empty(self):
+        """Test that the store has no retentions initially."""
+        self.assertNotIn(0, self.store)
+        self.assertEqual([], list(self.store))
+        self.assertEqual(Retention(), self.store.get(0))
+        self.assertEqual(0, self.store.count(0))
+        self.assertTrue(isnan(self.store.skip_until(0)))
+        self.assertEqual({}, self.store.as_dict())
+
+    def test_put(self):
+        """Test that a retention can be stored."""
+        self.store.put(3, self.retention)
+        self.assertIn(3, self.store)
+        self.assertNotIn(2, self.store)
+        self.assertEqual(self.retention, self.store.get(3))
+        self.assertEqual(2, self.store.count(3))
+        self.assertEqual((self.start + timedelta(days=2)).timestamp(), self.store.skip_until(3))
+
+    def test_put_empty_retention(self):
+        """Test that a retention without datetimes can be stored."""
+        self.store.put(0, Retention())
+        self.assertEqual(Retention(), self.store.get(0))
+        self.assertTrue(isnan(self.store.skip_until(0)))
+        self.assertEqual({0: {}}, self.store.as_dict())
+
+    def test_put_overwrites(self):
+        """Test that storing a retention again overwrites the stored retention."""
+        self.store.put(1, Retention())
+        self.store.put(1, self.retention)
+        self.assertEqual(self.retention, self.store.get(1))
+        self.assertEqual([1], list(self.store))
+
+    def test_load(self):
+        """Test that a retention can be loaded from a retention dict and is saved as is, unless changed."""
+        retention_dict = RetentionDict(count=2, skip_until="2026-01-03T00:00:00+00:00")
+        self.store.load(5, retention_dict)
+        self.assertEqual(Retention(skip_until=self.start + timedelta(days=2), count=2), self.store.get(5))
+        self.assertIs(retention_dict, self.store.as_dict()[5])
+        self.store.put(5, Retention(count=3))
+        self.assertEqual({5: {"count": 3}}, self.store.as_dict())
+
+    def test_load_is_lazy(self):
+        """Test that a loaded retention dict is not decoded until the retention of the quiz is needed."""
+        self.store.load(5, RetentionDict(count=2, start="invalid"))
+        self.assertEqual({5: {"count": 2, "start": "invalid"}}, self.store.as_dict())
+        self.assertRaises(ValueError, self.store.count, 5)
+
+    def test_load_and_pause(self):
+        """Test that a loaded retention is decoded before it is paused."""
+        self.store.load(5, RetentionDict(count=2, skip_until="2026-01-03T00:00:00+00:00"))
+        self.store.pause([5], self.start.timestamp())
+        self.assertEqual(Retention(skip_until=self.start + timedelta(days=2), count=2), self.store.get(5))
+
+    def test_load_and_put(self):
+        """Test that a stored retention replaces a loaded retention dict that has not been decoded."""
+        self.store.load(5, RetentionDict(count=2, start="2026-01-01T00:00:00+00:00"))
+        self.store.put(5, Retention(count=3))
+        self.assertEqual({5: {"count": 3}}, self.store.pop_changes())
+
+    def test_load_and_remove(self):
+        """Test that a loaded retention can be removed before it is decoded."""
+        self.store.load(5, RetentionDict(count=2))
+        self.store.remove(5)
+        self.assertEqual(0, self.store.count(5))
+
+    def test_load_snapshot(self):
+        """Test that retentions can be loaded from a snapshot and are not changed."""
+        snapshot = ProgressSnapshot.from_progress_dict({"a": {"count": 1}, "b": {"count": 2, "end": "2026-01-02"}})
+        self.store.load_snapshot(snapshot, {3: 1})
+        self.assertEqual(Retention(end=datetime(2026, 1, 2).astimezone(), count=2), self.store.get(3))
+        self.assertEqual([3], list(self.store))
+        self.assertEqual({}, self.store.pop_changes())
+
+    def test_load_empty_snapshot(self):
+        """Test that an empty snapshot can be loaded."""
+        self.store.load_snapshot(ProgressSnapshot.from_progress_dict({}), {})
+        self.assertEqual([], list(self.store))
+
+    def test_snapshot(self):
+        """Test that a snapshot of the retentions can be taken."""
+        self.store.put(2, self.retention)
+        self.store.load(0, RetentionDict(count=1))
+        snapshot = self.store.snapshot(lambda quiz_id: f"quiz{quiz_id}")
+        self.assertEqual({"quiz2": self.retention.as_dict(), "quiz0": {"count": 1}}, snapshot.as_dict())
+
+    def test_remove(self):
+        """Test that a retention can be removed, also if it was changed."""
+        self.store.load(0, RetentionDict(count=1))
+        self.store.put(1, self.retention)
+        self.store.remove(1)
+        self.assertNotIn(1, self.store)
+        self.assertEqual({0: {"count": 1}}, self.store.as_dict())
+        self.assertEqual({}, self.store.pop_changes())
+
+    def test_pause(self):
+        """Test that quizzes can be paused, both quizzes with and without retention."""
+        until = self.start + timedelta(days=1)
+        self.store.put(1, Retention(count=1))
+        self.store.pause([1, 4], until.timestamp())
+        self.assertEqual(Retention(skip_until=until, count=1), self.store.get(1))
+        self.assertEqual(Retention(skip_until=until), self.store.get(4))
+        self.assertEqual([1, 4], list(self.store))
+
+    def test_pause_does_not_shorten_silence(self):
+        """Test that pausing a quiz does not shorten its silence."""
+        self.store.put(3, self.retention)
+        self.store.pause([3], self.start.timestamp())
+        self.assertEqual(self.retention, self.store.get(3))
+
+    def test_pop_changes(self):
+        """Test that the changed retentions can be popped, and are popped once."""
+        self.store.load(0, RetentionDict(count=1))
+        self.store.put(2, Retention(count=3))
+        self.store.pause([1], self.start.timestamp())
+        self.assertEqual(
+            {1: {"skip_until": self.start.astimezone().isoformat(timespec="seconds")}, 2: {"count": 3}},
+            self.store.pop_changes(),
+        )
+        self.assertEqual({}, self.store.pop_changes())
+
+    def test_changed(self):
+        """Test that the ids of the quizzes whose retention changed can be retrieved without popping the changes."""
+        self.store.load(0, RetentionDict(count=1))
+        self.store.put(2, Retention(count=3))
+        self.store.pause([1], self.start.timestamp())
+        self.assertEqual([1, 2], self.store.changed())
+        self.store.pop_changes()
+        self.assertEqual([], self.store.changed())
+
+    def test_merge_unchanged_retention(self):
+        """Test that the retention saved by another session replaces a retention that did not change."""
+        self.store.load(0, RetentionDict(count=1))
+        self.store.merge(0, RetentionDict(count=2))
+        self.store.merge(1, RetentionDict(count=1))
+        self.assertEqual({0: {"count": 2}, 1: {"count": 1}}, self.store.as_dict())
+        self.assertEqual({}, self.store.pop_changes())
+
+    def test_merge_changed_retention(self):
+        """Test that the presentations of both sessions are added up and the latest silence is kept."""
+        self.store.load(0, RetentionDict(count=1))
+        self.store.put(0, self.retention)  # Count 1 -> 2
+        self.store.merge(0, RetentionDict(count=4, skip_until="2026-01-05T00:00:00+00:00"))  # Count 1 -> 4
+        self.assertEqual(
+            Retention(self.retention.start, self.retention.end, self.start + timedelta(days=4), 5), self.store.get(0)
+        )
+        self.store.merge(0, RetentionDict(count=6))  # Count 4 -> 6 in the other session, the silence is kept
+        self.assertEqual(
+            Retention(self.retention.start, self.retention.end, self.start + timedelta(days=4), 7), self.store.get(0)
+        )
+
+    def test_merge_changed_retention_with_earlier_silence(self):
+        """Test that the silence of this session is kept if the silence of the other session ends earlier."""
+        self.store.put(0, self.retention)
+        self.store.merge(0, RetentionDict(count=1, skip_until="2026-01-02T00:00:00+00:00"))
+        self.assertEqual(
+            Retention(self.retention.start, self.retention.end, self.retention.skip_until, 3), self.store.get(0)
+        )
+
+    def test_merge_paused_retention(self):
+        """Test that the count of the other session is kept if this session only paused the quiz."""
+        self.store.pause([0], self.start.timestamp())
+        self.store.merge(0, RetentionDict(count=3))
+        self.assertEqual(Retention(skip_until=self.start, count=3), self.store.get(0))
@@ -0,0 +1,56 @@
+"""Unit tests for the answer log."""
+
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, Mock, patch
+
+from toisto.model.quiz.evaluation import Evaluation
+from toisto.persistence.answer_log import AnswerLog, iter_answers
+
+
+@patch("os.fsync", Mock())
+class AnswerLogTest(unittest.TestCase):
+    """Unit tests for the answer log."""
+
+    def setUp(self) -> None:
+        """Set up the test fixtures."""
+        self.filepath = MagicMock()
+        self.filepath.open.return_value.__enter__.return_value = self.answer_log_file = MagicMock()
+        self.answer_log_file.seek.return_value = 0
+        self.answer_log = AnswerLog(self.filepath)
+
+    @patch("toisto.persistence.answer_log.now", Mock(return_value=datetime(2026, 1, 1, 12, tzinfo=UTC)))
+    def test_flush(self) -> None:
+        """Test that the logged answers are appended to the answer log when the log is flushed."""
+        self.answer_log.log("fi:nl:Terve:Hoi:read", Evaluation.INCORRECT, 1, 2.34567)
+        self.answer_log.log("fi:nl:Terve:Hoi:read", Evaluation.CORRECT, 2, 1.5)
+        self.filepath.open.assert_not_called()
+        self.answer_log.flush()
+        self.answer_log_file.write.assert_called_once_with(
+            b'{"quiz": "fi:nl:Terve:Hoi:read", "evaluation": "incorrect", "attempt": 1, "latency": 2.346, '
+            b'"timestamp": "2026-01-01T12:00:00.000+00:00"}\n'
+            b'{"quiz": "fi:nl:Terve:Hoi:read", "evaluation": "correct", "attempt": 2, "latency": 1.5, '
+            b'"timestamp": "2026-01-01T12:00:00.000+00:00"}\n'
+        )
+
+    def test_flush_once(self) -> None:
+        """Test that answers are appended to the answer log only once."""
+        self.answer_log.log("fi:nl:Terve:Hoi:read", Evaluation.CORRECT, 1, 1.0)
+        self.answer_log.flush()
+        self.answer_log.flush()
+        self.answer_log_file.write.assert_called_once()
+
+    def test_flush_without_answers(self) -> None:
+        """Test that the answer log is not opened if there are no answers to flush."""
+        self.answer_log.flush()
+        self.filepath.open.assert_not_called()
+
+
+class IterAnswersTest(unittest.TestCase):
+    """Unit tests for reading the answer log."""
+
+    def test_iter_answers(self) -> None:
+        """Test that the answers are read from the answer log."""
+        filepath = MagicMock()
+        filepath.open.return_value.__enter__.return_value = iter(['{"quiz": "fi:nl:Terve:Hoi:read"}\n'])
+        self.assertEqual([{"quiz": "fi:nl:Terve:Hoi:read"}], list(iter_answers(filepath)))
@@ -0,0 +1,94 @@
+"""Unit tests for the cache module."""
+
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+from toisto.persistence.cache import cache_key, dump_cache, get_cache_filepath, load_cache
+
+
+class CacheKeyTest(unittest.TestCase):
+    """Unit tests for the cache key."""
+
+    def test_same_parts_same_key(self):
+        """Test that the key is stable."""
+        self.assertEqual(cache_key("fi", "en"), cache_key("fi", "en"))
+
+    def test_different_parts_different_key(self):
+        """Test that the key depends on the parts."""
+        self.assertNotEqual(cache_key("fi", "en"), cache_key("en", "fi"))
+
+    @patch("pathlib.Path.is_dir", Mock(return_value=False))
+    @patch("pathlib.Path.stat")
+    def test_changed_file_different_key(self, stat: Mock) -> None:
+        """Test that the key changes when a file changes."""
+        stat.return_value = Mock(st_size=100, st_mtime_ns=1)
+        key = cache_key("fi", paths=(Path("concepts.json"),))
+        stat.return_value = Mock(st_size=100, st_mtime_ns=2)
+        self.assertNotEqual(key, cache_key("fi", paths=(Path("concepts.json"),)))
+
+    @patch("pathlib.Path.is_dir", Mock(return_value=False))
+    @patch("pathlib.Path.stat", Mock(side_effect=FileNotFoundError))
+    def test_missing_file(self):
+        """Test that a missing file does not prevent computing a key."""
+        self.assertNotEqual(cache_key("fi"), cache_key("fi", paths=(Path("missing.json"),)))
+
+    @patch("pathlib.Path.is_dir", Mock(return_value=True))
+    @patch("pathlib.Path.rglob")
+    @patch("pathlib.Path.stat", Mock(return_value=Mock(st_size=100, st_mtime_ns=1)))
+    def test_folder(self, rglob: Mock) -> None:
+        """Test that the key changes when files are added to a folder."""
+        rglob.return_value = [Path("folder/concept1.json")]
+        key = cache_key(paths=(Path("folder"),))
+        rglob.return_value = [Path("folder/concept1.json"), Path("folder/concept2.json")]
+        self.assertNotEqual(key, cache_key(paths=(Path("folder"),)))
+
+
+@patch("pathlib.Path.exists", Mock(return_value=True))
+@patch("pathlib.Path.open")
+class LoadCacheTest(unittest.TestCase):
+    """Unit tests for loading caches."""
+
+    def test_load_cache(self, path_open: Mock) -> None:
+        """Test that the cached contents are returned if the key matches."""
+        path_open.return_value.__enter__.return_value.read.return_value = '{"key": "key", "contents": {"foo": "bar"}}'
+        self.assertEqual({"foo": "bar"}, load_cache("name", "key"))
+
+    def test_load_outdated_cache(self, path_open: Mock) -> None:
+        """Test that None is returned if the key does not match."""
+        path_open.return_value.__enter__.return_value.read.return_value = '{"key": "old", "contents": {"foo": "bar"}}'
+        self.assertIsNone(load_cache("name", "key"))
+
+    def test_load_corrupt_cache(self, path_open: Mock) -> None:
+        """Test that None is returned if the cache can't be parsed."""
+        path_open.return_value.__enter__.return_value.read.return_value = '{"key": "key", "con'
+        self.assertIsNone(load_cache("name", "key"))
+
+    def test_load_unreadable_cache(self, path_open: Mock) -> None:
+        """Test that None is returned if the cache can't be read."""
+        path_open.side_effect = PermissionError
+        self.assertIsNone(load_cache("name", "key"))
+
+
+@patch("pathlib.Path.mkdir", Mock())
+class DumpCacheTest(unittest.TestCase):
+    """Unit tests for dumping caches."""
+
+    @patch("os.fsync", Mock())
+    @patch("pathlib.Path.replace", Mock())
+    @patch("pathlib.Path.open")
+    @patch("json.dump")
+    def test_dump_cache(self, dump: Mock, path_open: Mock) -> None:
+        """Test that the contents are saved with the key."""
+        path_open.return_value.__enter__.return_value = json_file = MagicMock()
+        dump_cache("name", "key", {"foo": "bar"})
+        dump.assert_called_once_with({"key": "key", "contents": {"foo": "bar"}}, json_file)
+
+    @patch("pathlib.Path.open", Mock(side_effect=PermissionError))
+    def test_dump_cache_fails(self):
+        """Test that failing to write the cache is ignored."""
+        dump_cache("name", "key", {"foo": "bar"})
+
+    def test_cache_filepath(self):
+        """Test the cache file path."""
+        self.assertEqual("name.json", get_cache_filepath("name").name)
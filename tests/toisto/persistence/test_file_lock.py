@@ -0,0 +1,23 @@
+"""Unit tests for the file locks."""
+
+import fcntl
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from toisto.persistence.file_lock import locked
+
+
+class LockedTest(unittest.TestCase):
+    """Unit tests for locking files."""
+
+    @patch("fcntl.flock")
+    @patch("pathlib.Path.open")
+    def test_lock(self, path_open: Mock, flock: Mock) -> None:
+        """Test that the lock file is locked exclusively while the context is active, and closed afterwards."""
+        lock_file = path_open.return_value.__enter__.return_value
+        with locked(Path("/home/user/.toisto-uuid-progress-fi.lock")):
+            path_open.assert_called_once_with("ab")
+            flock.assert_called_once_with(lock_file, fcntl.LOCK_EX)
+            path_open.return_value.__exit__.assert_not_called()
+        path_open.return_value.__exit__.assert_called_once()
@@ -1,9 +1,18 @@
 """Unit tests for the persistence module."""
 
 import unittest
+from collections.abc import Mapping
+from io import BytesIO
 from unittest.mock import MagicMock, Mock, patch
 
-from toisto.persistence.json_file import dump_json, load_json
+from toisto.persistence.json_file import (
+    append_json_line,
+    append_json_lines,
+    dump_json,
+    iter_json_lines,
+    load_json,
+    load_json_lines,
+)
 
 
 class PersistenceTestCase(unittest.TestCase):
@@ -33,9 +42,107 @@ class LoadJSONTest(PersistenceTestCase):
 class DumpJSONTest(PersistenceTestCase):
     """Unit tests for dumping JSON."""
 
+    @patch("os.fsync", Mock())
     @patch("json.dump")
     def test_dump(self, dump: Mock) -> None:
-        """Test that the JSON is dumped."""
-        self.file_path.open.return_value.__enter__.return_value = json_file = MagicMock()
+        """Test that the JSON is dumped into a temporary file that replaces the file."""
+        temporary_file_path = self.file_path.with_name.return_value
+        temporary_file_path.open.return_value.__enter__.return_value = json_file = MagicMock()
         dump_json(self.file_path, self.contents)
         dump.assert_called_once_with(self.contents, json_file)
+        temporary_file_path.replace.assert_called_once_with(self.file_path)
+
+
+class LoadJSONLinesTest(PersistenceTestCase):
+    """Unit tests for loading JSON lines."""
+
+    def test_return_empty_list_if_file_does_not_exist(self):
+        """Test that an empty list is returned if the file does not exist."""
+        self.file_path.exists.return_value = False
+        self.assertEqual([], load_json_lines(self.file_path))
+
+    def test_return_file_contents(self):
+        """Test that the JSON objects are returned, except for a last line that was not written completely."""
+        self.file_path.exists.return_value = True
+        self.file_path.open.return_value.__enter__.return_value.read.return_value = '{"foo": "bar"}\n{"foo": "b'
+        self.assertEqual([self.contents], load_json_lines(self.file_path))
+
+    def test_return_file_contents_after_offset(self):
+        """Test that the JSON objects after the offset are returned."""
+        self.file_path.exists.return_value = True
+        json_lines_file = self.file_path.open.return_value.__enter__.return_value
+        json_lines_file.read.return_value = '{"foo": "bar"}\n'
+        self.assertEqual([self.contents], load_json_lines(self.file_path, offset=15))
+        json_lines_file.seek.assert_called_once_with(15)
+
+    def test_skip_torn_lines(self):
+        """Test that lines that cannot be decoded because they were torn by an earlier crash are skipped."""
+        self.file_path.exists.return_value = True
+        json_lines_file = self.file_path.open.return_value.__enter__.return_value
+        json_lines_file.read.return_value = '{"foo": "b\n{"foo": "bar"}\n'
+        self.assertEqual([self.contents], load_json_lines(self.file_path))
+
+
+class IterJSONLinesTest(PersistenceTestCase):
+    """Unit tests for iterating over JSON lines."""
+
+    def test_yield_nothing_if_file_does_not_exist(self):
+        """Test that nothing is yielded if the file does not exist."""
+        self.file_path.exists.return_value = False
+        self.assertEqual([], list(iter_json_lines(self.file_path)))
+
+    def test_yield_file_contents(self):
+        """Test that the JSON objects are yielded, except for a last line that was not written completely."""
+        self.file_path.exists.return_value = True
+        self.file_path.open.return_value.__enter__.return_value = iter(['{"foo": "bar"}\n', '{"foo": "b'])
+        self.assertEqual([self.contents], list(iter_json_lines(self.file_path)))
+
+    def test_skip_torn_lines(self):
+        """Test that lines that cannot be decoded because they were torn by an earlier crash are skipped."""
+        self.file_path.exists.return_value = True
+        self.file_path.open.return_value.__enter__.return_value = iter(['{"foo": "b\n', '{"foo": "bar"}\n'])
+        self.assertEqual([self.contents], list(iter_json_lines(self.file_path)))
+
+
+class JSONLinesFile(BytesIO):
+    """In-memory JSON lines file."""
+
+    def fileno(self) -> int:
+        """Override to return a fake file descriptor."""
+        return 0
+
+
+@patch("os.fsync", Mock())
+class AppendJSONLineTest(PersistenceTestCase):
+    """Unit tests for appending a JSON line."""
+
+    def append(self, contents: bytes, *json_objects: Mapping[str, object]) -> bytes:
+        """Append the JSON objects to a file with the contents and return the new contents of the file."""
+        json_lines_file = JSONLinesFile(contents)
+        self.file_path.open.return_value.__enter__.return_value = json_lines_file
+        append_json_lines(self.file_path, json_objects)
+        return json_lines_file.getvalue()
+
+    def test_append(self):
+        """Test that the JSON is appended as one line."""
+        self.file_path.open.return_value.__enter__.return_value = json_lines_file = JSONLinesFile()
+        append_json_line(self.file_path, self.contents)
+        self.file_path.open.assert_called_once_with("ab+")
+        self.assertEqual(b'{"foo": "bar"}\n', json_lines_file.getvalue())
+
+    def test_append_lines(self):
+        """Test that the JSON objects are appended as lines."""
+        self.assertEqual(
+            b'{"baz": 0}\n{"foo": "bar"}\n{"baz": 1}\n', self.append(b'{"baz": 0}\n', self.contents, {"baz": 1})
+        )
+
+    def test_append_after_torn_line(self):
+        """Test that a new line is started if the last line was not written completely."""
+        self.assertEqual(b'{"baz": 0}\n{"ba\n{"foo": "bar"}\n', self.append(b'{"baz": 0}\n{"ba', self.contents))
+
+    def test_load_after_crash_and_append(self):
+        """Test that the lines can be loaded after a crash tore the last line and new lines were appended."""
+        self.file_path.exists.return_value = True
+        contents = self.append(b'{"baz": 0}\n{"ba', self.contents)
+        self.file_path.open.return_value.__enter__.return_value = MagicMock(read=Mock(return_value=contents.decode()))
+        self.assertEqual([{"baz": 0}, self.contents], load_json_lines(self.file_path))
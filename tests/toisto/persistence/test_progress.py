@@ -1,33 +1,64 @@
 """Unit tests for the persistence module."""
 
+import sqlite3
 from argparse import ArgumentParser
 from configparser import ConfigParser
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from threading import Event
+from unittest.mock import MagicMock, Mock, call, patch
 
 from toisto.metadata import NAME
-from toisto.model.language import FI, Language
+from toisto.model.language import FI, NL, Language
+from toisto.model.language.label import Label
+from toisto.model.quiz.evaluation import Evaluation
 from toisto.model.quiz.progress import Progress
 from toisto.model.quiz.quiz import Quizzes
 from toisto.model.quiz.retention import Retention
-from toisto.persistence.progress import load_progress, save_progress, update_progress_dict
-from toisto.persistence.progress_format import ProgressDict
-
-from ...base import ToistoTestCase
+from toisto.persistence.progress import (
+    JOURNAL_POSITIONS,
+    JournalPosition,
+    ProgressWriter,
+    archive_progress,
+    create_answer_log,
+    load_answers,
+    load_progress,
+    load_sorted_keys,
+    remove_progress,
+    save_progress,
+    update_progress_dict,
+)
+from toisto.persistence.progress_format import ProgressDict, RetentionDict
+from toisto.persistence.progress_snapshot import ProgressSnapshot
+
+from ...base import FI_NL, ToistoTestCase
+
+
+def sizes(path: Path, journal_size: int, progress_file_size: int) -> int:
+    """Return the size of the journal or the progress file, depending on the path."""
+    return journal_size if path.suffix == ".journal" else progress_file_size
 
 
 class ProgressTestCase(ToistoTestCase):
     """Base class for unit tests that test loading and saving progress."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    def setUp(self) -> None:
+        """Extend to set up test fixtures."""
+        super().setUp()
         self.config = ConfigParser()
         self.config.add_section("identity")
         self.config["identity"]["uuid"] = "uuid"
         self.config.add_section("progress")
         self.config["progress"]["folder"] = "/home/user"
+        self.config["progress"]["backend"] = "json"
+        self.config["progress"]["answer_log"] = "no"
+        patcher = patch("toisto.persistence.progress.locked", MagicMock())
+        self.locked = patcher.start()
+        self.addCleanup(patcher.stop)
 
 
+@patch("toisto.persistence.progress.load_cache", Mock(return_value=None))
+@patch("toisto.persistence.progress.dump_cache", Mock())
 class LoadProgressTest(ProgressTestCase):
     """Unit tests for loading progress."""
 
@@ -66,6 +97,20 @@ Be sure to attach the invalid progress file to the issue.""",
             load_progress(Language("nl"), Quizzes(), ArgumentParser(), self.config).as_dict(),
         )
 
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[Path("/home/user/.toisto-uuid-progress-en.json")]))
+    @patch("pathlib.Path.open")
+    def test_replay_journal(self, path_open: Mock) -> None:
+        """Test that the changes in the journal are replayed, ignoring a last change that was not written completely."""
+        path_open.return_value.__enter__.return_value.read.side_effect = [
+            '{"quiz:read": {"count": 1}, "other:read": {"count": 1}}',
+            '{"quiz:read": {"count": 2}}\n{"quiz:read": {"count": 3}}\n{"quiz:read": {"cou',
+        ]
+        self.assertEqual(
+            {"quiz:read": {"count": 3}, "other:read": {"count": 1}},
+            load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config).as_dict(),
+        )
+
     @patch("pathlib.Path.exists", Mock(return_value=True))
     @patch("pathlib.Path.glob", Mock(return_value=[Path("/home/user/.toisto-uuid-progress-en.json")]))
     @patch("pathlib.Path.open")
@@ -81,32 +126,693 @@ Be sure to attach the invalid progress file to the issue.""",
 class SaveProgressTest(ProgressTestCase):
     """Unit tests for saving progress."""
 
+    def setUp(self):
+        """Extend to set up a quiz and progress on the quiz."""
+        super().setUp()
+        self.quiz = self.create_quiz(FI_NL, self.create_concept("quiz"), Label(FI, "kysymys"), [Label(NL, "vraag")])
+        self.progress = Progress(FI, Quizzes([self.quiz]), {})
+        self.progress.mark_evaluation(self.quiz, Evaluation.INCORRECT)
+
+    @patch("pathlib.Path.open")
+    def test_save_unchanged_progress(self, path_open: Mock) -> None:
+        """Test that nothing is written if the progress did not change."""
+        save_progress(Progress(FI, Quizzes(), {"quiz:read": {}}), self.config)
+        path_open.assert_not_called()
+
+    @patch("os.fsync", Mock())
+    @patch("pathlib.Path.stat", Mock(side_effect=lambda: Mock(st_size=100)))
+    @patch("toisto.persistence.progress.file_size", Mock(side_effect=lambda path: sizes(path, 100, 1000)))
     @patch("pathlib.Path.open")
     @patch("json.dump")
-    def test_save_empty_progress(self, dump: Mock, path_open: Mock) -> None:
-        """Test that the progress can be saved."""
-        path_open.return_value.__enter__.return_value = json_file = MagicMock()
-        save_progress(Progress(Language("fi"), Quizzes(), {}), self.config)
-        dump.assert_called_once_with({}, json_file)
-
+    def test_save_changes_to_journal(self, dump: Mock, path_open: Mock) -> None:
+        """Test that the changes are appended to the journal."""
+        path_open.return_value.__enter__.return_value = journal = MagicMock()
+        journal.seek.return_value = 0
+        save_progress(self.progress, self.config)
+        path_open.assert_called_once_with("ab+")
+        journal.write.assert_called_once_with(f'{{"{self.quiz.key}": {{"count": 1}}}}\n'.encode())
+        dump.assert_not_called()
+
+    @patch("os.fsync", Mock())
+    @patch("pathlib.Path.stat", Mock(return_value=Mock(st_size=100)))
+    @patch("toisto.persistence.progress.load_json_lines", Mock(return_value=[]))
+    @patch("pathlib.Path.open")
+    def test_save_changes_once(self, path_open: Mock) -> None:
+        """Test that changes that were saved are not saved again."""
+        save_progress(self.progress, self.config)
+        save_progress(self.progress, self.config)
+        path_open.assert_called_once()
+
+    @patch("os.fsync", Mock())
+    @patch("pathlib.Path.replace", Mock())
+    @patch("pathlib.Path.stat", Mock(side_effect=FileNotFoundError))
+    @patch("toisto.persistence.progress.file_size", Mock(side_effect=lambda path: sizes(path, 1000, 0)))
+    @patch("pathlib.Path.unlink")
     @patch("pathlib.Path.open")
     @patch("json.dump")
-    def test_save_incorrect_only_progress(self, dump: Mock, path_open: Mock) -> None:
-        """Test that the progress can be saved."""
+    def test_compact_journal(self, dump: Mock, path_open: Mock, unlink: Mock) -> None:
+        """Test that the journal is compacted into the progress file when the journal is larger."""
         path_open.return_value.__enter__.return_value = json_file = MagicMock()
-        save_progress(Progress(Language("fi"), Quizzes(), {"quiz:read": {}}), self.config)
-        dump.assert_called_once_with({"quiz:read": {}}, json_file)
+        save_progress(self.progress, self.config)
+        dump.assert_called_once_with({self.quiz.key: {"count": 1}}, json_file)
+        self.assertEqual(2, unlink.call_count)  # The journal and the progress file without UUID
+
+
+@patch("pathlib.Path.unlink", Mock())
+@patch("toisto.persistence.progress.file_size", Mock(return_value=0))
+@patch("toisto.persistence.progress.file_stamp", Mock(return_value=(1, 2, 3)))
+@patch("toisto.persistence.progress.append_json_line")
+@patch("toisto.persistence.progress.load_json_lines")
+class MergeProgressOfOtherSessionsTest(ProgressTestCase):
+    """Unit tests for merging the progress saved by other sessions on the same device when saving progress."""
+
+    def setUp(self):
+        """Extend to set up progress loaded at a journal position and changed since."""
+        super().setUp()
+        self.quiz = self.create_quiz(FI_NL, self.create_concept("quiz"), Label(FI, "kysymys"), [Label(NL, "vraag")])
+        self.progress = Progress(FI, Quizzes([self.quiz]), {self.quiz.key: {"count": 1}})
+        JOURNAL_POSITIONS[self.progress] = JournalPosition((1, 2, 3), 10)
+        self.progress.mark_evaluation(self.quiz, Evaluation.INCORRECT)
+        self.journal_filepath = Path("/home/user/.toisto-uuid-progress-fi.journal")
+
+    def assert_saved(self, count: int, append_json_line: Mock) -> None:
+        """Assert that the retention of the quiz was saved with the count."""
+        append_json_line.assert_called_once_with(self.journal_filepath, {self.quiz.key: {"count": count}})
+
+    def test_lock_while_saving(self, load_json_lines: Mock, append_json_line: Mock) -> None:
+        """Test that the progress file is locked while saving."""
+        load_json_lines.return_value = []
+        save_progress(self.progress, self.config)
+        self.locked.assert_called_once_with(Path("/home/user/.toisto-uuid-progress-fi.lock"))
+        self.assert_saved(2, append_json_line)
+
+    def test_merge_journal(self, load_json_lines: Mock, append_json_line: Mock) -> None:
+        """Test that the changes appended to the journal by other sessions are merged."""
+        load_json_lines.return_value = [{self.quiz.key: {"count": 2}}, {self.quiz.key: {"count": 3}}]
+        save_progress(self.progress, self.config)
+        load_json_lines.assert_called_once_with(self.journal_filepath, 10)
+        self.assert_saved(4, append_json_line)
+
+    def test_remember_journal_position(self, load_json_lines: Mock, _append_json_line: Mock) -> None:
+        """Test that the journal position is remembered, so changes by other sessions are only merged once."""
+        load_json_lines.return_value = []
+        save_progress(self.progress, self.config)
+        self.assertEqual(JournalPosition((1, 2, 3), 0), JOURNAL_POSITIONS[self.progress])
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("toisto.persistence.progress.load_json", Mock(return_value={"fi:nl:kysymys:vraag:read": {"count": 5}}))
+    def test_merge_compacted_progress_file(self, load_json_lines: Mock, append_json_line: Mock) -> None:
+        """Test that the complete progress file is merged if another session compacted the journal."""
+        JOURNAL_POSITIONS[self.progress] = JournalPosition((4, 5, 6), 10)
+        load_json_lines.return_value = []
+        save_progress(self.progress, self.config)
+        load_json_lines.assert_called_once_with(self.journal_filepath, 0)
+        self.assert_saved(6, append_json_line)
 
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("toisto.persistence.progress.load_progress_snapshot")
+    def test_merge_compacted_snapshot(self, load_snapshot: Mock, load_json_lines: Mock, append_json_line: Mock) -> None:
+        """Test that the complete snapshot is merged if another session compacted the journal."""
+        self.config["progress"]["backend"] = "binary"
+        JOURNAL_POSITIONS[self.progress] = JournalPosition((4, 5, 6), 10)
+        load_snapshot.return_value = ProgressSnapshot.from_progress_dict({self.quiz.key: {"count": 5}})
+        load_json_lines.return_value = []
+        save_progress(self.progress, self.config)
+        self.assert_saved(6, append_json_line)
+
+    @patch("pathlib.Path.exists", Mock(return_value=False))
+    def test_progress_file_removed(self, load_json_lines: Mock, append_json_line: Mock) -> None:
+        """Test that nothing is merged if the progress file was removed."""
+        JOURNAL_POSITIONS[self.progress] = JournalPosition((4, 5, 6), 10)
+        load_json_lines.return_value = []
+        save_progress(self.progress, self.config)
+        self.assert_saved(2, append_json_line)
+
+    def test_no_journal_position(self, load_json_lines: Mock, append_json_line: Mock) -> None:
+        """Test that nothing is merged if the progress was not loaded from the progress file."""
+        del JOURNAL_POSITIONS[self.progress]
+        save_progress(self.progress, self.config)
+        load_json_lines.assert_not_called()
+        self.assert_saved(2, append_json_line)
+
+    @patch("toisto.persistence.progress.ProgressDatabase")
+    def test_merge_database(self, database: Mock, _load_json_lines: Mock, append_json_line: Mock) -> None:
+        """Test that the progress in the database is merged when using the SQLite backend."""
+        self.config["progress"]["backend"] = "sqlite"
+        database.return_value.load_keys.return_value = {self.quiz.key: {"count": 3}}
+        save_progress(self.progress, self.config)
+        database.return_value.load_keys.assert_called_once_with([self.quiz.key])
+        database.return_value.save.assert_called_once_with({self.quiz.key: {"count": 4}})
+        append_json_line.assert_not_called()
+
+    @patch("pathlib.Path.exists", Mock(return_value=False))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    def test_remember_journal_position_when_loading(self, _load_json_lines: Mock, _append_json_line: Mock) -> None:
+        """Test that the journal position is remembered when loading the progress."""
+        progress = load_progress(FI, Quizzes(), ArgumentParser(), self.config)
+        self.assertEqual(JournalPosition((1, 2, 3), 0), JOURNAL_POSITIONS[progress])
+        self.locked.assert_called_once_with(Path("/home/user/.toisto-uuid-progress-fi.lock"))
+
+
+@patch("toisto.persistence.progress.load_cache", Mock(return_value=None))
+@patch("toisto.persistence.progress.dump_cache", Mock())
+@patch("toisto.persistence.progress.ProgressDatabase")
+class SQLiteProgressTest(ProgressTestCase):
+    """Unit tests for loading and saving progress with the SQLite backend."""
+
+    def setUp(self):
+        """Extend to configure the SQLite backend."""
+        super().setUp()
+        self.config["progress"]["backend"] = "sqlite"
+        self.database_filepath = Path("/home/user/.toisto-uuid-progress-en.db")
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    def test_load_progress(self, database: Mock) -> None:
+        """Test that the progress is loaded from the database."""
+        database.return_value.load.return_value = {"quiz:read": {"count": 1}}
+        progress = load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config)
+        self.assertEqual({"quiz:read": {"count": 1}}, progress.as_dict())
+        database.assert_called_once_with(self.database_filepath)
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    def test_load_progress_of_keys(self, database: Mock) -> None:
+        """Test that only the progress of the quizzes with the keys is loaded from the database, if keys are passed."""
+        database.return_value.load_keys.return_value = {"quiz:read": {"count": 1}}
+        progress = load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config, {"quiz:read"})
+        self.assertEqual({"quiz:read": {"count": 1}}, progress.as_dict())
+        database.return_value.load_keys.assert_called_once_with(["quiz:read"])
+        database.return_value.load.assert_not_called()
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("sys.stderr.write")
+    def test_load_invalid_progress(self, stderr_write: Mock, database: Mock) -> None:
+        """Test that the program exits if the database cannot be read."""
+        database.side_effect = sqlite3.DatabaseError("file is not a database")
+        self.assertRaises(SystemExit, load_progress, Language("en"), Quizzes(), ArgumentParser(), self.config)
+        self.assertIn(
+            f"cannot parse the progress information in {self.database_filepath}: file is not a database.",
+            stderr_write.call_args_list[1][0][0],
+        )
+
+    @patch("os.fsync", Mock())
+    @patch("pathlib.Path.exists", autospec=True, side_effect=lambda path: path.suffix == ".json")
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("pathlib.Path.replace", Mock())
+    @patch("pathlib.Path.unlink", autospec=True)
     @patch("pathlib.Path.open")
     @patch("json.dump")
-    def test_save_progress(self, dump: Mock, path_open: Mock) -> None:
-        """Test that the progress can be saved."""
-        path_open.return_value.__enter__.return_value = json_file = MagicMock()
-        save_progress(
-            Progress(Language("fi"), Quizzes(), {"quiz:read": {"skip_until": "3000-01-01T00:00:00+00:00"}}),
-            self.config,
+    def test_import_progress_file(
+        self, dump: Mock, path_open: Mock, unlink: Mock, _exists: Mock, database: Mock
+    ) -> None:
+        """Test that the progress file is imported if there's no database yet."""
+        path_open.return_value.__enter__.return_value.read.return_value = '{"quiz:read": {"count": 2}}'
+        load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config)
+        database.return_value.save.assert_called_once_with({"quiz:read": {"count": 2}})
+        dump.assert_called_once_with({"quiz:read": {"count": 2}}, path_open.return_value.__enter__.return_value)
+        self.assertEqual(
+            [
+                call(self.database_filepath.with_suffix(".json")),
+                call(self.database_filepath.with_suffix(".journal"), missing_ok=True),
+            ],
+            unlink.call_args_list,
         )
-        dump.assert_called_once_with({"quiz:read": {"skip_until": "3000-01-01T00:00:00+00:00"}}, json_file)
+
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("pathlib.Path.unlink", Mock())
+    @patch("toisto.persistence.progress.load_json_lines", Mock(return_value=[]))
+    @patch("toisto.persistence.progress.load_progress_snapshot")
+    @patch("toisto.persistence.progress.load_json")
+    @patch("toisto.persistence.progress.dump_json")
+    def test_import_progress_snapshot(
+        self, dump_json: Mock, load_json: Mock, load_snapshot: Mock, database: Mock
+    ) -> None:
+        """Test that the snapshot is imported via a progress file if there's no database yet."""
+        existing_suffixes = {".bin"}
+        dump_json.side_effect = lambda filepath, _contents: existing_suffixes.add(filepath.suffix)
+        load_json.side_effect = lambda _filepath, **_kwargs: dump_json.call_args.args[1]
+        load_snapshot.return_value = ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 1}})
+        with patch("pathlib.Path.exists", autospec=True, side_effect=lambda path: path.suffix in existing_suffixes):
+            load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config)
+        database.return_value.save.assert_called_once_with({"quiz:read": {"count": 1}})
+        self.locked.assert_called_once_with(self.database_filepath.with_suffix(".lock"))
+
+    @patch("pathlib.Path.exists", autospec=True, side_effect=lambda path: path.suffix == ".db")
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("pathlib.Path.unlink", autospec=True)
+    @patch("toisto.persistence.progress.load_json", Mock(return_value={}))
+    @patch("toisto.persistence.progress.load_json_lines", Mock(return_value=[]))
+    @patch("toisto.persistence.progress.dump_json")
+    def test_export_progress_database(self, dump_json: Mock, unlink: Mock, _exists: Mock, database: Mock) -> None:
+        """Test that the database is exported to a progress file when switching back to the JSON backend."""
+        self.config["progress"]["backend"] = "json"
+        database.return_value.load.return_value = {"quiz:read": {"count": 1}}
+        load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config)
+        database.assert_called_once_with(self.database_filepath, read_only=True)
+        dump_json.assert_called_once_with(self.database_filepath.with_suffix(".json"), {"quiz:read": {"count": 1}})
+        unlink.assert_called_once_with(self.database_filepath)
+
+    @patch("pathlib.Path.exists", autospec=True, side_effect=lambda path: path.suffix == ".db")
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("pathlib.Path.unlink", Mock())
+    @patch("toisto.persistence.progress.dump_json")
+    def test_export_progress_database_to_snapshot(self, dump_json: Mock, _exists: Mock, database: Mock) -> None:
+        """Test that the database is exported to a progress file to import when switching to the binary backend."""
+        self.config["progress"]["backend"] = "binary"
+        database.return_value.load.return_value = {"quiz:read": {"count": 1}}
+        load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config)
+        dump_json.assert_called_once_with(self.database_filepath.with_suffix(".json"), {"quiz:read": {"count": 1}})
+
+    @patch("pathlib.Path.exists", autospec=True, side_effect=lambda path: path.suffix == ".db")
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("sys.stderr.write", Mock())
+    def test_export_invalid_progress_database(self, _exists: Mock, database: Mock) -> None:
+        """Test that the program exits if the database cannot be exported."""
+        self.config["progress"]["backend"] = "json"
+        database.side_effect = sqlite3.DatabaseError("file is not a database")
+        self.assertRaises(SystemExit, load_progress, Language("en"), Quizzes(), ArgumentParser(), self.config)
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[Path("/home/user/.toisto-other-progress-en.db")]))
+    def test_load_pauses_of_other_devices(self, database: Mock) -> None:
+        """Test that the pauses are loaded from the databases of other devices."""
+        database.return_value.load.return_value = {}
+        database.return_value.load_pauses.return_value = {"quiz:read": {"skip_until": "3000-01-01T00:00:00+00:00"}}
+        progress = load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config)
+        self.assertEqual({"quiz:read": {"skip_until": "3000-01-01T00:00:00+00:00"}}, progress.as_dict())
+        database.assert_called_with(Path("/home/user/.toisto-other-progress-en.db"), read_only=True)
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[Path("/home/user/.toisto-other-progress-en.db")]))
+    @patch("sys.stderr.write", Mock())
+    def test_load_invalid_pauses_of_other_devices(self, database: Mock) -> None:
+        """Test that the program exits if the database of another device cannot be read."""
+        database.return_value.load.return_value = {}
+        database.return_value.load_pauses.side_effect = sqlite3.DatabaseError
+        self.assertRaises(SystemExit, load_progress, Language("en"), Quizzes(), ArgumentParser(), self.config)
+
+    def test_save_changes(self, database: Mock) -> None:
+        """Test that the changes are saved in the database."""
+        quiz = self.create_quiz(FI_NL, self.create_concept("quiz"), Label(FI, "kysymys"), [Label(NL, "vraag")])
+        progress = Progress(FI, Quizzes([quiz]), {})
+        progress.mark_evaluation(quiz, Evaluation.INCORRECT)
+        save_progress(progress, self.config)
+        save_progress(progress, self.config)
+        database.return_value.save.assert_called_once_with({quiz.key: {"count": 1}})
+
+    def test_sorted_keys(self, database: Mock) -> None:
+        """Test that the sorted keys are loaded from the database."""
+        database.return_value.sorted_keys.return_value = ["quiz:read"]
+        progress = Progress(Language("en"), Quizzes(), {})
+        self.assertEqual(["quiz:read"], load_sorted_keys(progress, self.config, "attempts"))
+        database.return_value.sorted_keys.assert_called_once_with("attempts")
+
+    def test_sorted_keys_with_json_backend(self, database: Mock) -> None:
+        """Test that the keys are sorted without the database when the JSON backend is used."""
+        self.config["progress"]["backend"] = "json"
+        progress = Progress(Language("en"), Quizzes(), {"once:read": {"count": 1}, "twice:read": {"count": 2}})
+        self.assertEqual(["twice:read", "once:read"], load_sorted_keys(progress, self.config, "attempts"))
+        database.assert_not_called()
+
+
+@patch("toisto.persistence.progress.load_cache", Mock(return_value=None))
+@patch("toisto.persistence.progress.dump_cache", Mock())
+@patch("toisto.persistence.progress.load_json_lines", Mock(return_value=[]))
+@patch("toisto.persistence.progress.dump_progress_snapshot")
+@patch("toisto.persistence.progress.load_progress_snapshot")
+class BinaryProgressTest(ProgressTestCase):
+    """Unit tests for loading and saving progress with the binary backend."""
+
+    def setUp(self):
+        """Extend to configure the binary backend."""
+        super().setUp()
+        self.config["progress"]["backend"] = "binary"
+        self.snapshot_filepath = Path("/home/user/.toisto-uuid-progress-en.bin")
+        self.pause = RetentionDict(skip_until="3000-01-01T00:00:00+00:00")
+
+    def load_progress(self) -> ProgressDict:
+        """Load the progress and return it as dict."""
+        return load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config).as_dict()
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    def test_load_progress(self, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that the progress is loaded from the snapshot."""
+        load_snapshot.return_value = ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 1}})
+        self.assertEqual({"quiz:read": {"count": 1}}, self.load_progress())
+        load_snapshot.assert_called_once_with(self.snapshot_filepath)
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("toisto.persistence.progress.load_progress_snapshot_rows")
+    def test_load_progress_of_keys(self, load_snapshot_rows: Mock, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that only the rows of the quizzes with the keys are loaded from the snapshot, if keys are passed."""
+        load_snapshot_rows.return_value = ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 1}})
+        journal = [{"quiz:read": {"count": 2}, "other:read": {"count": 3}}]
+        with patch("toisto.persistence.progress.load_json_lines", Mock(return_value=journal)):
+            progress = load_progress(Language("en"), Quizzes(), ArgumentParser(), self.config, {"quiz:read"})
+        self.assertEqual({"quiz:read": {"count": 2}}, progress.as_dict())
+        load_snapshot_rows.assert_called_once_with(self.snapshot_filepath, {"quiz:read"})
+        load_snapshot.assert_not_called()
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    def test_replay_journal(self, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that the changes in the journal replace the progress in the snapshot."""
+        load_snapshot.return_value = ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 1}})
+        journal = [{"quiz:read": {"count": 2}}, {"quiz:read": {"count": 3}}]
+        with patch("toisto.persistence.progress.load_json_lines", Mock(return_value=journal)):
+            self.assertEqual({"quiz:read": {"count": 3}}, self.load_progress())
+
+    @patch("pathlib.Path.exists", Mock(return_value=False))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    def test_load_non_existing_progress(self, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that the progress is empty if there's no snapshot yet."""
+        self.assertEqual({}, self.load_progress())
+        load_snapshot.assert_not_called()
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("sys.stderr.write")
+    def test_load_invalid_progress(self, stderr_write: Mock, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that the program exits if the snapshot cannot be read."""
+        load_snapshot.side_effect = ValueError("not a progress snapshot")
+        self.assertRaises(SystemExit, self.load_progress)
+        self.assertIn(
+            f"cannot parse the progress information in {self.snapshot_filepath}: not a progress snapshot.",
+            stderr_write.call_args_list[1][0][0],
+        )
+
+    @patch("os.fsync", Mock())
+    @patch("pathlib.Path.exists", autospec=True, side_effect=lambda path: path.suffix == ".json")
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("pathlib.Path.replace", Mock())
+    @patch("pathlib.Path.unlink", autospec=True)
+    @patch("pathlib.Path.open")
+    @patch("json.dump", Mock())
+    def test_import_progress_file(
+        self, path_open: Mock, unlink: Mock, _exists: Mock, _load_snapshot: Mock, dump_snapshot: Mock
+    ) -> None:
+        """Test that the progress file is imported if there's no snapshot yet."""
+        path_open.return_value.__enter__.return_value.read.return_value = '{"quiz:read": {"count": 2}}'
+        self.load_progress()
+        filepath, snapshot = dump_snapshot.call_args.args
+        self.assertEqual((self.snapshot_filepath, {"quiz:read": {"count": 2}}), (filepath, snapshot.as_dict()))
+        self.assertEqual(
+            [
+                call(self.snapshot_filepath.with_suffix(".json")),
+                call(self.snapshot_filepath.with_suffix(".journal"), missing_ok=True),
+            ],
+            unlink.call_args_list,
+        )
+
+    @patch("pathlib.Path.exists", autospec=True, side_effect=lambda path: path.suffix == ".bin")
+    @patch("pathlib.Path.glob", Mock(return_value=[]))
+    @patch("pathlib.Path.unlink", autospec=True)
+    @patch("toisto.persistence.progress.dump_json")
+    def test_export_progress_snapshot(
+        self, dump_json: Mock, unlink: Mock, _exists: Mock, load_snapshot: Mock, _dump_snapshot: Mock
+    ) -> None:
+        """Test that the snapshot is exported to a progress file when switching back to the JSON backend."""
+        self.config["progress"]["backend"] = "json"
+        load_snapshot.return_value = ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 1}})
+        self.load_progress()
+        dump_json.assert_called_once_with(self.snapshot_filepath.with_suffix(".json"), {"quiz:read": {"count": 1}})
+        self.assertEqual(
+            [call(self.snapshot_filepath), call(self.snapshot_filepath.with_suffix(".journal"), missing_ok=True)],
+            unlink.call_args_list,
+        )
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[Path("/home/user/.toisto-other-progress-en.json")]))
+    def test_merge_pauses_of_other_devices(self, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that the pauses of other devices are merged with the retentions in the snapshot."""
+        quiz_progress: ProgressDict = {"quiz:read": {"count": 2, "skip_until": "2000-01-01T00:00:00+00:00"}}
+        load_snapshot.return_value = ProgressSnapshot.from_progress_dict(quiz_progress | {"other:read": {}})
+        other_progress = {"quiz:read": self.pause, "new:read": self.pause}
+        with patch("toisto.persistence.progress.load_progress_file", Mock(return_value=other_progress)):
+            progress_dict = self.load_progress()
+        self.assertEqual(
+            {"quiz:read": {"count": 2, **self.pause}, "other:read": {}, "new:read": self.pause}, progress_dict
+        )
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[Path("/home/user/.toisto-other-progress-en.json")]))
+    def test_no_pauses_of_other_devices(self, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that the snapshot is not searched if other devices have not paused quizzes."""
+        load_snapshot.return_value = ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 2}})
+        with patch("toisto.persistence.progress.load_progress_file", Mock(return_value={"quiz:read": {}})):
+            self.assertEqual({"quiz:read": {"count": 2}}, self.load_progress())
+
+    @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.glob", Mock(return_value=[Path("/home/user/.toisto-other-progress-en.bin")]))
+    def test_load_pauses_of_other_devices(self, load_snapshot: Mock, _dump_snapshot: Mock) -> None:
+        """Test that the pauses are loaded from the snapshots of other devices."""
+        load_snapshot.side_effect = [
+            ProgressSnapshot.from_progress_dict({}),
+            ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 2, **self.pause}, "other:read": {}}),
+        ]
+        self.assertEqual(
+            {"quiz:read": {"skip_until": datetime.fromisoformat(self.pause["skip_until"]).astimezone().isoformat()}},
+            self.load_progress(),
+        )
+
+    def test_save_changes(self, _load_snapshot: Mock, dump_snapshot: Mock) -> None:
+        """Test that the changes are appended to the journal."""
+        quiz = self.create_quiz(FI_NL, self.create_concept("quiz"), Label(FI, "kysymys"), [Label(NL, "vraag")])
+        progress = Progress(FI, Quizzes([quiz]), {})
+        progress.mark_evaluation(quiz, Evaluation.INCORRECT)
+        with (
+            patch("toisto.persistence.progress.append_json_line") as append_json_line,
+            patch("toisto.persistence.progress.file_size", Mock(side_effect=lambda path: sizes(path, 100, 1000))),
+            patch("pathlib.Path.unlink", Mock()),
+        ):
+            save_progress(progress, self.config)
+        append_json_line.assert_called_once_with(
+            Path("/home/user/.toisto-uuid-progress-fi.journal"), {quiz.key: {"count": 1}}
+        )
+        dump_snapshot.assert_not_called()
+
+    def test_compact_journal(self, _load_snapshot: Mock, dump_snapshot: Mock) -> None:
+        """Test that the journal is compacted into the snapshot when the journal is larger."""
+        quiz = self.create_quiz(FI_NL, self.create_concept("quiz"), Label(FI, "kysymys"), [Label(NL, "vraag")])
+        progress = Progress(FI, Quizzes([quiz]), {})
+        progress.mark_evaluation(quiz, Evaluation.INCORRECT)
+        with (
+            patch("toisto.persistence.progress.append_json_line", Mock()),
+            patch("toisto.persistence.progress.file_size", Mock(side_effect=lambda path: sizes(path, 1000, 100))),
+            patch("pathlib.Path.unlink") as unlink,
+        ):
+            save_progress(progress, self.config)
+        filepath, snapshot = dump_snapshot.call_args.args
+        self.assertEqual(Path("/home/user/.toisto-uuid-progress-fi.bin"), filepath)
+        self.assertEqual({quiz.key: {"count": 1}}, snapshot.as_dict())
+        self.assertEqual(2, unlink.call_count)  # The journal and the progress file without UUID
+
+
+@patch(
+    "toisto.persistence.progress.cache_key",
+    Mock(side_effect=lambda paths=(): f"key of {paths[0].name}" if paths else "key"),
+)
+@patch("toisto.persistence.progress.dump_cache")
+@patch("toisto.persistence.progress.load_cache")
+@patch("toisto.persistence.progress.load_progress_file")
+@patch("pathlib.Path.glob")
+class LoadOtherPausesTest(ProgressTestCase):
+    """Unit tests for loading the pauses of other devices, using the cache."""
+
+    def setUp(self):
+        """Extend to set up the progress files of other devices."""
+        super().setUp()
+        self.other = Path("/home/user/.toisto-other-progress-fi.json")
+        self.another = Path("/home/user/.toisto-another-progress-fi.json")
+        self.pauses: ProgressDict = {"quiz:read": {"skip_until": "3000-01-01T00:00:00+00:00"}}
+        self.entry = {"key": f"key of {self.other.name}", "pauses": self.pauses}
+
+    def load_progress(self) -> ProgressDict:
+        """Load the progress and return it as dict."""
+        with patch("pathlib.Path.exists", Mock(return_value=False)):
+            return load_progress(FI, Quizzes(), ArgumentParser(), self.config).as_dict()
+
+    def test_no_other_devices(self, glob: Mock, load_progress_file: Mock, load_cache: Mock, dump_cache: Mock) -> None:
+        """Test that the cache is not used if there are no other devices."""
+        glob.return_value = []
+        load_progress_file.return_value = {}
+        self.assertEqual({}, self.load_progress())
+        load_cache.assert_not_called()
+        dump_cache.assert_not_called()
+
+    def test_cache_pauses(self, glob: Mock, load_progress_file: Mock, load_cache: Mock, dump_cache: Mock) -> None:
+        """Test that the pauses of other devices are cached."""
+        glob.return_value = [self.other]
+        load_progress_file.side_effect = [{}, {"quiz:read": {"count": 3, **self.pauses["quiz:read"]}, "other:read": {}}]
+        load_cache.return_value = None
+        self.assertEqual(self.pauses, self.load_progress())
+        dump_cache.assert_called_once_with("progress-pauses-fi", "key", {str(self.other): self.entry})
+
+    def test_use_cached_pauses(self, glob: Mock, load_progress_file: Mock, load_cache: Mock, dump_cache: Mock) -> None:
+        """Test that the cached pauses are used if the progress file of the other device did not change."""
+        glob.return_value = [self.other]
+        load_progress_file.return_value = {}
+        load_cache.return_value = {str(self.other): self.entry}
+        self.assertEqual(self.pauses, self.load_progress())
+        load_progress_file.assert_called_once()  # For the progress of this device only
+        dump_cache.assert_not_called()
+
+    def test_reload_changed_files(
+        self, glob: Mock, load_progress_file: Mock, load_cache: Mock, dump_cache: Mock
+    ) -> None:
+        """Test that the pauses are loaded again if the progress file of the other device changed."""
+        glob.return_value = [self.other, self.another]
+        load_progress_file.side_effect = [{}, {}]
+        load_cache.return_value = {str(self.other): self.entry, str(self.another): {"key": "old key", "pauses": {}}}
+        self.assertEqual(self.pauses, self.load_progress())
+        dump_cache.assert_called_once_with(
+            "progress-pauses-fi",
+            "key",
+            {str(self.other): self.entry, str(self.another): {"key": f"key of {self.another.name}", "pauses": {}}},
+        )
+
+
+@patch("pathlib.Path.unlink")
+class RemoveProgressTest(ProgressTestCase):
+    """Unit tests for removing progress."""
+
+    def setUp(self):
+        """Extend to set up progress to remove."""
+        super().setUp()
+        self.progress = Progress(FI, Quizzes(), {"quiz:read": {"count": 1}, "orphan:read": {"count": 2}})
+        self.progress_filepath = Path("/home/user/.toisto-uuid-progress-fi.json")
+
+    @patch("toisto.persistence.progress.dump_json")
+    def test_remove_from_progress_file(self, dump_json: Mock, unlink: Mock) -> None:
+        """Test that the complete progress is saved in the progress file and the journal is removed."""
+        remove_progress(self.progress, ["orphan:read"], self.config)
+        dump_json.assert_called_once_with(self.progress_filepath, {"quiz:read": {"count": 1}})
+        unlink.assert_called_once_with(missing_ok=True)
+
+    @patch("toisto.persistence.progress.file_stamp", Mock(return_value=(1, 2, 3)))
+    @patch("toisto.persistence.progress.load_json_lines")
+    @patch("toisto.persistence.progress.dump_json")
+    def test_merge_changes_of_other_sessions(self, dump_json: Mock, load_json_lines: Mock, _unlink: Mock) -> None:
+        """Test that the changes saved by other sessions are merged before the journal is removed."""
+        quiz = self.create_quiz(FI_NL, self.create_concept("quiz"), Label(FI, "kysymys"), [Label(NL, "vraag")])
+        progress = Progress(FI, Quizzes([quiz]), {quiz.key: {"count": 1}, "orphan:read": {"count": 2}})
+        JOURNAL_POSITIONS[progress] = JournalPosition((1, 2, 3), 10)
+        load_json_lines.return_value = [{quiz.key: {"count": 3}}]
+        remove_progress(progress, ["orphan:read"], self.config)
+        load_json_lines.assert_called_once_with(self.progress_filepath.with_suffix(".journal"), 10)
+        dump_json.assert_called_once_with(self.progress_filepath, {quiz.key: {"count": 3}})
+        self.assertEqual(JournalPosition((1, 2, 3), 0), JOURNAL_POSITIONS[progress])
+
+    @patch("toisto.persistence.progress.dump_progress_snapshot")
+    def test_remove_from_snapshot(self, dump_snapshot: Mock, unlink: Mock) -> None:
+        """Test that the complete progress is saved in the snapshot and the journal is removed."""
+        self.config["progress"]["backend"] = "binary"
+        remove_progress(self.progress, ["orphan:read"], self.config)
+        filepath, snapshot = dump_snapshot.call_args.args
+        self.assertEqual(self.progress_filepath.with_suffix(".bin"), filepath)
+        self.assertEqual({"quiz:read": {"count": 1}}, snapshot.as_dict())
+        unlink.assert_called_once_with(missing_ok=True)
+
+    @patch("toisto.persistence.progress.ProgressDatabase")
+    def test_remove_from_database(self, database: Mock, unlink: Mock) -> None:
+        """Test that the progress is deleted from the database."""
+        self.config["progress"]["backend"] = "sqlite"
+        remove_progress(self.progress, ["orphan:read"], self.config)
+        database.return_value.delete.assert_called_once_with(["orphan:read"])
+        self.locked.assert_called_once_with(self.progress_filepath.with_suffix(".lock"))
+        self.assertEqual({"quiz:read": {"count": 1}}, self.progress.as_dict())
+        unlink.assert_not_called()
+
+    @patch("toisto.persistence.progress.load_json", Mock(return_value={"old:read": {}, "orphan:read": {}}))
+    @patch("toisto.persistence.progress.dump_json")
+    def test_archive(self, dump_json: Mock, _unlink: Mock) -> None:
+        """Test that progress is added to the archive."""
+        archive_filepath = archive_progress({"orphan:read": {"count": 2}}, FI, self.config)
+        self.assertEqual(self.progress_filepath.with_suffix(".archive"), archive_filepath)
+        dump_json.assert_called_once_with(archive_filepath, {"old:read": {}, "orphan:read": {"count": 2}})
+
+
+@patch("toisto.persistence.progress.save_progress")
+class ProgressWriterTest(ProgressTestCase):
+    """Unit tests for the progress writer."""
+
+    def setUp(self):
+        """Extend to set up the progress."""
+        super().setUp()
+        self.progress = Progress(FI, Quizzes(), {})
+
+    def test_close(self, save_progress: Mock) -> None:
+        """Test that closing the writer saves the progress."""
+        ProgressWriter(self.progress, self.config).close()
+        save_progress.assert_called_once_with(self.progress, self.config)
+
+    def test_coalesce_saves(self, save_progress: Mock) -> None:
+        """Test that saves requested while saving are coalesced."""
+        saved_twice = Event()
+
+        def save(*_args: object) -> None:
+            """Request two saves during the first save and signal the second save."""
+            if save_progress.call_count == 1:
+                progress_writer.save()
+                progress_writer.save()
+            else:
+                saved_twice.set()
+
+        save_progress.side_effect = save
+        progress_writer = ProgressWriter(self.progress, self.config)
+        progress_writer.save()
+        saved_twice.wait()
+        progress_writer.close()
+        self.assertEqual(3, save_progress.call_count)  # The first save, the coalesced saves, and the save when closing
+
+    def test_raise_error_when_closing(self, save_progress: Mock) -> None:
+        """Test that an error that occurred while saving is raised when closing the writer."""
+        save_progress.side_effect = OSError("disk full")
+        progress_writer = ProgressWriter(self.progress, self.config)
+        self.assertRaisesRegex(OSError, "disk full", progress_writer.close)
+
+    @patch("toisto.persistence.progress.Thread")
+    def test_raise_error_when_saving(self, thread: Mock, save_progress: Mock) -> None:
+        """Test that an error that occurred while saving is raised when requesting the next save, and only once."""
+        save_progress.side_effect = OSError("disk full")
+        progress_writer = ProgressWriter(self.progress, self.config)
+        progress_writer.close()  # The thread is patched, so closing does not wait for the writer
+        thread.call_args.kwargs["target"]()  # Write in this thread instead
+        self.assertRaisesRegex(OSError, "disk full", progress_writer.save)
+        progress_writer.save()
+
+    def test_flush_answer_log(self, save_progress: Mock) -> None:
+        """Test that the answer log is flushed after the progress is saved."""
+        answer_log = Mock()
+        answer_log.flush.side_effect = save_progress.assert_called_once
+        ProgressWriter(self.progress, self.config, answer_log).close()
+        answer_log.flush.assert_called_once_with()
+
+
+class AnswerLogTest(ProgressTestCase):
+    """Unit tests for the answer log in the user's home folder."""
+
+    def test_answer_log_disabled(self) -> None:
+        """Test that there is no answer log if the user did not enable it."""
+        self.assertIsNone(create_answer_log(FI, self.config))
+
+    @patch("toisto.persistence.progress.AnswerLog")
+    def test_answer_log_enabled(self, answer_log: Mock) -> None:
+        """Test that the answer log is next to the progress file if the user enabled it."""
+        self.config["progress"]["answer_log"] = "yes"
+        self.assertEqual(answer_log.return_value, create_answer_log(FI, self.config))
+        answer_log.assert_called_once_with(Path("/home/user/.toisto-uuid-progress-fi.answers"))
+
+    @patch("toisto.persistence.progress.iter_answers")
+    def test_load_answers(self, iter_answers: Mock) -> None:
+        """Test that the answers are read from the answer log next to the progress file."""
+        iter_answers.return_value = iter([{"quiz": "quiz:read"}])
+        self.assertEqual([{"quiz": "quiz:read"}], list(load_answers(FI, self.config)))
+        iter_answers.assert_called_once_with(Path("/home/user/.toisto-uuid-progress-fi.answers"))
 
 
 class UpdateProgressTest(ToistoTestCase):
@@ -200,6 +906,12 @@ class UpdateProgressTest(ToistoTestCase):
         update_progress_dict(self.friday, self.friday2)
         self.assertEqual(expected, self.friday)
 
+    def test_update_without_skip_until(self):
+        """Test that updating a progress dict with retentions without skip_until leaves the progress dict unchanged."""
+        expected = self.grey.copy()
+        update_progress_dict(self.grey, {self.friday_key: {"count": 2}})
+        self.assertEqual(expected, self.grey)
+
     def test_update_with_earlier_skip_until(self):
         """Test updating a retention with an earlier skip_until."""
         expected = self.friday2.copy()
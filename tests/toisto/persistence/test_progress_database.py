@@ -0,0 +1,88 @@
+"""Unit tests for the progress database."""
+
+import sqlite3
+import unittest
+from pathlib import Path
+
+from toisto.persistence.progress_database import ProgressDatabase
+from toisto.persistence.progress_format import ProgressDict
+
+
+class ProgressDatabaseTest(unittest.TestCase):
+    """Unit tests for the progress database."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.database = ProgressDatabase(Path(":memory:"))
+        self.progress_dict: ProgressDict = {
+            "grey:nl:fi:grijs:write": {
+                "count": 5,
+                "start": "2023-03-06T22:29:25+01:00",
+                "end": "2024-01-07T11:57:10+01:00",
+                "skip_until": "2028-03-19T07:15:58+01:00",
+            },
+            "friday:fi:nl:perjantai:read": {"count": 7, "start": "2023-03-06T22:29:47", "end": "2023-03-08T13:53:57"},
+            "quiz:read": {},
+        }
+
+    def tearDown(self) -> None:
+        """Close the database."""
+        self.database.close()
+
+    def test_empty(self):
+        """Test that the database has no progress initially."""
+        self.assertEqual({}, self.database.load())
+
+    def test_save_and_load(self):
+        """Test that the progress can be saved and loaded without changes."""
+        self.database.save(self.progress_dict)
+        self.assertEqual(self.progress_dict, self.database.load())
+
+    def test_save_replaces_progress(self):
+        """Test that saving progress replaces the progress of quizzes saved before."""
+        self.database.save(self.progress_dict)
+        self.database.save({"quiz:read": {"count": 1}})
+        self.assertEqual({"count": 1}, self.database.load()["quiz:read"])
+
+    def test_delete(self):
+        """Test that the progress of quizzes can be deleted."""
+        self.database.save(self.progress_dict)
+        self.database.delete(["quiz:read", "grey:nl:fi:grijs:write", "unknown:read"])
+        self.assertEqual(["friday:fi:nl:perjantai:read"], list(self.database.load()))
+
+    def test_load_keys(self):
+        """Test that the progress of quizzes can be loaded by key."""
+        self.database.save(self.progress_dict)
+        self.assertEqual(
+            {"quiz:read": {}, "friday:fi:nl:perjantai:read": self.progress_dict["friday:fi:nl:perjantai:read"]},
+            self.database.load_keys(["quiz:read", "friday:fi:nl:perjantai:read", "unknown:read"]),
+        )
+
+    def test_load_pauses(self):
+        """Test that the pauses can be loaded."""
+        self.database.save(self.progress_dict)
+        self.assertEqual(
+            {"grey:nl:fi:grijs:write": {"skip_until": "2028-03-19T07:15:58+01:00"}}, self.database.load_pauses()
+        )
+
+    def test_sort_by_attempts(self):
+        """Test that the keys can be sorted by the number of attempts."""
+        self.database.save(self.progress_dict)
+        self.assertEqual(
+            ["friday:fi:nl:perjantai:read", "grey:nl:fi:grijs:write", "quiz:read"],
+            self.database.sorted_keys("attempts"),
+        )
+
+    def test_sort_by_retention(self):
+        """Test that the keys can be sorted by the length of the retention."""
+        self.database.save(self.progress_dict)
+        self.assertEqual(
+            ["grey:nl:fi:grijs:write", "friday:fi:nl:perjantai:read", "quiz:read"],
+            self.database.sorted_keys("retention"),
+        )
+
+    def test_read_only(self):
+        """Test that opening a database read only does not create the tables."""
+        database = ProgressDatabase(Path(":memory:"), read_only=True)
+        self.assertRaises(sqlite3.OperationalError, database.load_pauses)
+        database.close()
@@ -0,0 +1,139 @@
+"""Unit tests for the progress snapshots."""
+
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+from toisto.persistence.progress_format import ProgressDict
+from toisto.persistence.progress_snapshot import (
+    HEADER,
+    MAGIC,
+    ProgressSnapshot,
+    dump_progress_snapshot,
+    load_progress_snapshot,
+    load_progress_snapshot_rows,
+)
+
+
+def local(iso_datetime: str) -> str:
+    """Return the ISO formatted datetime in the local timezone."""
+    return datetime.fromisoformat(iso_datetime).astimezone().isoformat(timespec="seconds")
+
+
+class ProgressSnapshotTest(unittest.TestCase):
+    """Unit tests for the progress snapshot."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.progress_dict: ProgressDict = {
+            "grey:nl:fi:grijs:write": {
+                "count": 5,
+                "start": local("2023-03-06T22:29:25+01:00"),
+                "end": local("2024-01-07T11:57:10+01:00"),
+                "skip_until": local("2028-03-19T07:15:58+01:00"),
+            },
+            "friday:fi:nl:perjantäi:read": {"count": 7, "start": local("2023-03-06T22:29:47+01:00")},
+            "quiz:read": {},
+        }
+
+    def test_from_and_to_progress_dict(self):
+        """Test that a snapshot can be created from a progress dict and converted back."""
+        self.assertEqual(self.progress_dict, ProgressSnapshot.from_progress_dict(self.progress_dict).as_dict())
+
+    def test_naive_datetimes_are_local(self):
+        """Test that naive datetimes in the progress dict are in the local timezone."""
+        snapshot = ProgressSnapshot.from_progress_dict({"quiz:read": {"end": "2023-03-08T13:53:57"}})
+        self.assertEqual({"quiz:read": {"end": local("2023-03-08T13:53:57")}}, snapshot.as_dict())
+
+    def test_sorted_keys_by_attempts(self):
+        """Test that the keys can be sorted by count."""
+        self.assertEqual(
+            ["friday:fi:nl:perjantäi:read", "grey:nl:fi:grijs:write", "quiz:read"],
+            ProgressSnapshot.from_progress_dict(self.progress_dict).sorted_keys("attempts"),
+        )
+
+    def test_sorted_keys_by_retention(self):
+        """Test that the keys can be sorted by retention length, with retentions without end having length zero."""
+        self.progress_dict["quiz:read"] = {"start": local("2023-03-06T22:29:25+01:00"), "end": local("2023-03-07")}
+        self.assertEqual(
+            ["grey:nl:fi:grijs:write", "quiz:read", "friday:fi:nl:perjantäi:read"],
+            ProgressSnapshot.from_progress_dict(self.progress_dict).sorted_keys("retention"),
+        )
+
+    def test_pauses(self):
+        """Test that the pauses are the datetimes until which quizzes are silenced."""
+        self.assertEqual(
+            {"grey:nl:fi:grijs:write": {"skip_until": local("2028-03-19T07:15:58+01:00")}},
+            ProgressSnapshot.from_progress_dict(self.progress_dict).pauses(),
+        )
+
+
+@patch("os.fsync", Mock())
+@patch("pathlib.Path.replace", Mock())
+class DumpAndLoadProgressSnapshotTest(unittest.TestCase):
+    """Unit tests for dumping and loading progress snapshots."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.snapshot_filepath = Path("/home/user/.toisto-uuid-progress-fi.bin")
+
+    def dump(self, snapshot: ProgressSnapshot) -> bytes:
+        """Dump the snapshot and return the bytes written."""
+        with patch("pathlib.Path.open", MagicMock()) as path_open:
+            dump_progress_snapshot(self.snapshot_filepath, snapshot)
+        write = path_open.return_value.__enter__.return_value.write
+        return b"".join(call.args[0] for call in write.call_args_list)
+
+    def load(self, contents: bytes) -> ProgressSnapshot:
+        """Load the snapshot from the bytes."""
+        with patch("pathlib.Path.read_bytes", Mock(return_value=contents)):
+            return load_progress_snapshot(self.snapshot_filepath)
+
+    def test_dump_and_load(self):
+        """Test that a dumped snapshot can be loaded."""
+        progress_dict: ProgressDict = {"grey:write": {"count": 5, "skip_until": local("2028-03-19T07:15:58+01:00")}}
+        progress_dict["friday:read"] = {}
+        self.assertEqual(
+            progress_dict, self.load(self.dump(ProgressSnapshot.from_progress_dict(progress_dict))).as_dict()
+        )
+
+    def test_columns_are_aligned(self):
+        """Test that the columns start at a multiple of eight bytes, after the header and the keys."""
+        contents = self.dump(ProgressSnapshot.from_progress_dict({"quiz:read": {"count": 3}}))
+        self.assertEqual(0, len(contents) % 8)
+        self.assertEqual(HEADER.size + len(b"quiz:read") + 3 + 4 * 8, len(contents))
+
+    def test_load_rows(self):
+        """Test that the rows of the quizzes with the keys can be loaded from the memory-mapped snapshot."""
+        progress_dict: ProgressDict = {
+            "grey:write": {"count": 5, "skip_until": local("2028-03-19T07:15:58+01:00")},
+            "friday:read": {"count": 2},
+            "quiz:read": {"start": local("2023-03-06T22:29:25+01:00")},
+        }
+        contents = self.dump(ProgressSnapshot.from_progress_dict(progress_dict))
+        with patch("pathlib.Path.open", MagicMock()), patch("mmap.mmap") as mmap:
+            mmap.return_value.__enter__.return_value = contents
+            snapshot = load_progress_snapshot_rows(self.snapshot_filepath, {"grey:write", "quiz:read", "orphan:read"})
+        del progress_dict["friday:read"]
+        self.assertEqual(progress_dict, snapshot.as_dict())
+
+    def test_dump_and_load_empty_snapshot(self):
+        """Test that an empty snapshot can be dumped and loaded."""
+        snapshot = ProgressSnapshot.from_progress_dict({})
+        self.assertEqual(snapshot, self.load(self.dump(snapshot)))
+
+    def test_write_to_temporary_file_first(self):
+        """Test that the snapshot is written to a temporary file that then replaces the snapshot file."""
+        with patch("pathlib.Path.replace") as replace:
+            self.dump(ProgressSnapshot.from_progress_dict({}))
+        replace.assert_called_once_with(self.snapshot_filepath)
+
+    def test_load_invalid_snapshot(self):
+        """Test that loading a file that is not a snapshot fails."""
+        self.assertRaisesRegex(ValueError, "not a progress snapshot", self.load, bytes(HEADER.size))
+
+    def test_load_unknown_format_version(self):
+        """Test that loading a snapshot with an unknown format version fails."""
+        contents = HEADER.pack(MAGIC, 99, 0, 0)
+        self.assertRaisesRegex(ValueError, "unknown progress snapshot format version 99", self.load, contents)
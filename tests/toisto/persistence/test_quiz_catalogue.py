@@ -0,0 +1,99 @@
+"""Unit tests for loading the quiz catalogue."""
+
+from unittest.mock import Mock, patch
+
+from toisto.model.language import FI, NL
+from toisto.model.quiz.quiz import Quizzes
+from toisto.persistence.quiz_catalogue import load_quiz_keys, load_quiz_keys_and_source, load_quiz_source
+
+from ...base import FI_NL, ToistoTestCase
+
+
+class LoadQuizzesTest(ToistoTestCase):
+    """Unit tests for loading quizzes."""
+
+    def setUp(self) -> None:
+        """Extend to create a concept."""
+        super().setUp()
+        self.concept = self.create_concept(
+            "english", labels=[{"label": "englanti", "language": FI}, {"label": "Engels", "language": NL}]
+        )
+
+    @patch("toisto.persistence.quiz_catalogue.load_cache", Mock(return_value=None))
+    @patch("toisto.persistence.quiz_catalogue.dump_cache")
+    def test_create_and_cache_quizzes(self, dump_cache: Mock) -> None:
+        """Test that the quizzes are created and cached if there is no cache yet."""
+        keys, quiz_source = load_quiz_keys_and_source(FI_NL, (), {self.concept})
+        quizzes = self.translation_quizzes(FI_NL, self.concept)
+        self.assertEqual({quiz.key for quiz in quizzes}, keys)
+        self.assertEqual(quizzes, quiz_source.all_quizzes())
+        self.assertEqual(["english"], list(dump_cache.call_args[0][2]))
+
+    @patch("toisto.persistence.quiz_catalogue.dump_cache")
+    @patch("toisto.persistence.quiz_catalogue.create_quizzes")
+    @patch("toisto.persistence.quiz_catalogue.load_cache")
+    def test_load_cached_quizzes(self, load_cache: Mock, create_quizzes: Mock, dump_cache: Mock) -> None:
+        """Test that the keys are loaded from the cache and the quizzes are rebuilt from the cache when needed."""
+        quiz_reference = ["fi:nl:englanti:Engels:read", 0, "read", ["english", 0], [["english", 1]]]
+        load_cache.return_value = {"english": [quiz_reference]}
+        keys, quiz_source = load_quiz_keys_and_source(FI_NL, (), {self.concept})
+        self.assertEqual({"fi:nl:englanti:Engels:read"}, keys)
+        self.assertEqual(Quizzes(), quiz_source.quizzes)
+        (quiz,) = quiz_source.all_quizzes()
+        self.assertEqual("fi:nl:englanti:Engels:read", quiz.key)
+        create_quizzes.assert_not_called()
+        dump_cache.assert_not_called()
+
+    @patch("toisto.persistence.quiz_catalogue.QuizCatalogue.all_quizzes")
+    @patch("toisto.persistence.quiz_catalogue.load_cache")
+    def test_load_cached_quiz_keys(self, load_cache: Mock, all_quizzes: Mock) -> None:
+        """Test that the quiz keys are loaded from the cache without rebuilding the quizzes."""
+        quiz_reference = ["fi:nl:englanti:Engels:read", 0, "read", ["english", 0], [["english", 1]]]
+        load_cache.return_value = {"english": [quiz_reference]}
+        self.assertEqual({"fi:nl:englanti:Engels:read"}, load_quiz_keys(FI_NL, (), {self.concept}))
+        all_quizzes.assert_not_called()
+
+
+class LoadQuizSourceTest(ToistoTestCase):
+    """Unit tests for loading the quiz source."""
+
+    def setUp(self) -> None:
+        """Extend to create a concept."""
+        super().setUp()
+        self.concept = self.create_concept(
+            "english", labels=[{"label": "englanti", "language": FI}, {"label": "Engels", "language": NL}]
+        )
+
+    @patch("toisto.persistence.quiz_catalogue.load_cache", Mock(return_value=None))
+    @patch("toisto.persistence.quiz_catalogue.dump_cache")
+    def test_generate_quizzes_when_needed(self, dump_cache: Mock) -> None:
+        """Test that the quizzes are generated when needed if there is no cache."""
+        other_concept = self.create_concept(
+            "german", labels=[{"label": "saksa", "language": FI}, {"label": "Duits", "language": NL}]
+        )
+        quiz_source = load_quiz_source(FI_NL, (), {self.concept, other_concept})
+        self.assertEqual(Quizzes(), quiz_source.quizzes)
+        self.assertEqual(self.translation_quizzes(FI_NL, self.concept), quiz_source.by_concept(self.concept))
+        dump_cache.assert_not_called()
+
+    @patch("toisto.persistence.quiz_catalogue.load_cache", Mock(return_value=None))
+    @patch("toisto.persistence.quiz_catalogue.dump_cache")
+    def test_cache_quizzes_when_complete(self, dump_cache: Mock) -> None:
+        """Test that the quiz catalogue is cached once the quizzes of all concepts have been generated."""
+        quiz_source = load_quiz_source(FI_NL, (), {self.concept})
+        quiz_source.generate_all()
+        quiz_source.generate_all()
+        dump_cache.assert_called_once()
+        self.assertEqual(["english"], list(dump_cache.call_args[0][2]))
+
+    @patch("toisto.persistence.quiz_catalogue.create_quizzes")
+    @patch("toisto.persistence.quiz_catalogue.load_cache")
+    def test_rebuild_cached_quizzes_when_needed(self, load_cache: Mock, create_quizzes: Mock) -> None:
+        """Test that the quizzes are rebuilt from the cache when needed."""
+        quiz_reference = ["fi:nl:englanti:Engels:read", 0, "read", ["english", 0], [["english", 1]]]
+        load_cache.return_value = {"english": [quiz_reference]}
+        quiz_source = load_quiz_source(FI_NL, (), {self.concept})
+        self.assertEqual(Quizzes(), quiz_source.quizzes)
+        (quiz,) = quiz_source.by_concept(self.concept)
+        self.assertEqual("fi:nl:englanti:Engels:read", quiz.key)
+        create_quizzes.assert_not_called()
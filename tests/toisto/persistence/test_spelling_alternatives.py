@@ -0,0 +1,38 @@
+"""Unit tests for loading spelling alternatives."""
+
+from unittest.mock import Mock, patch
+
+from toisto.model.language import FI, NL
+from toisto.model.language.label import Label
+from toisto.persistence.spelling_alternatives import load_generated_spelling_alternatives, load_spelling_alternatives
+
+from ...base import FI_NL, ToistoTestCase
+
+
+class LoadGeneratedSpellingAlternativesTest(ToistoTestCase):
+    """Unit tests for loading the generated spelling alternatives."""
+
+    def setUp(self) -> None:
+        """Extend to create labels."""
+        super().setUp()
+        load_spelling_alternatives(FI_NL)
+        Label(FI, "minä olen")
+        Label(NL, "het huis")
+
+    @patch("toisto.persistence.spelling_alternatives.load_cache", Mock(return_value=None))
+    @patch("toisto.persistence.spelling_alternatives.dump_cache")
+    def test_generate_and_cache_spelling_alternatives(self, dump_cache: Mock) -> None:
+        """Test that the spelling alternatives are generated and cached if there is no cache yet."""
+        load_generated_spelling_alternatives(FI_NL)
+        expected = {FI: {"minä olen": ["olen"]}, NL: {"het huis": ["huis"]}}
+        self.assertEqual(expected, Label.GENERATED_ALTERNATIVES)
+        self.assertEqual(expected, dump_cache.call_args[0][2])
+
+    @patch("toisto.persistence.spelling_alternatives.dump_cache")
+    @patch("toisto.persistence.spelling_alternatives.load_cache")
+    def test_load_cached_spelling_alternatives(self, load_cache: Mock, dump_cache: Mock) -> None:
+        """Test that the cached spelling alternatives are used instead of generating them."""
+        load_cache.return_value = {FI: {"minä olen": ["minä oon"]}, NL: {}}
+        load_generated_spelling_alternatives(FI_NL)
+        self.assertEqual(["minä oon"], Label.generate_spelling_alternatives(FI, "minä olen"))
+        dump_cache.assert_not_called()
@@ -31,7 +31,12 @@ class AppTest(ToistoTestCase):
     @patch("toisto.ui.speech.Popen", Mock())
     @patch("builtins.input", Mock(side_effect=EOFError))
     @patch("pathlib.Path.exists", Mock(return_value=True))
+    @patch("pathlib.Path.mkdir", Mock())
+    @patch("pathlib.Path.replace", Mock())
     @patch("pathlib.Path.open")
+    @patch("os.fsync", Mock())
+    @patch("toisto.persistence.progress.load_json_lines", Mock(return_value=[]))
+    @patch("toisto.persistence.progress.locked", MagicMock())
     @patch("toisto.app.read_config")
     @patch("toisto.metadata.BUILT_IN_CONCEPT_JSON_FILES", [pathlib.Path("test1.json"), pathlib.Path("test2.json")])
     def run_main(self, read_config: Mock, path_open: Mock) -> Mock:
@@ -151,6 +156,32 @@ class AppTest(ToistoTestCase):
         patched_print = self.run_main()
         self.assertTrue(patched_print.call_args_list[4][0][0].title.startswith("Progress"))
 
+    @patch.object(sys, "argv", ["toisto", "progress", "--target", "fi", "--source", "nl", "--orphans", "show"])
+    @patch("requests.get")
+    def test_orphans(self, requests_get: Mock) -> None:
+        """Test that the progress command can show orphaned progress."""
+        requests_get.return_value = self.latest_version
+        patched_print = self.run_main()
+        self.assertEqual("No orphaned progress Finnish.", patched_print.call_args_list[4][0][0])
+
+    @patch.object(sys, "argv", ["toisto", "progress", "--target", "fi", "--source", "nl", "--export", "answers"])
+    @patch("toisto.app.export_answers")
+    @patch("requests.get")
+    def test_export_answers(self, requests_get: Mock, export_answers: Mock) -> None:
+        """Test that the progress command can export the answers."""
+        requests_get.return_value = self.latest_version
+        self.run_main()
+        export_answers.assert_called_once()
+
+    @patch.object(sys, "argv", ["toisto", "progress", "--target", "fi", "--source", "nl", "--export", "progress"])
+    @patch("toisto.app.export_progress")
+    @patch("requests.get")
+    def test_export_progress(self, requests_get: Mock, export_progress: Mock) -> None:
+        """Test that the progress command can export the progress."""
+        requests_get.return_value = self.latest_version
+        self.run_main()
+        export_progress.assert_called_once()
+
     @patch.object(sys, "argv", ["toisto", "practice", "--target", "fi", "--source", "nl"])
     @patch("requests.get")
     def test_language_configuration_tip(self, requests_get: Mock) -> None:
@@ -2,7 +2,7 @@
 
 import unittest
 
-from toisto.match import match
+from toisto.match import contains_whole_words, match
 
 
 class MatchTest(unittest.TestCase):
@@ -57,3 +57,18 @@ class MatchTest(unittest.TestCase):
     def test_match_hyphen(self):
         """Test that a hyphen cannot be left out."""
         self.assertFalse(match("chocolade-ijs", "chocoladeijs"))
+
+
+class ContainsWholeWordsTest(unittest.TestCase):
+    """Unit tests for the contains whole words function."""
+
+    def test_whole_word(self):
+        """Test that a text contains a word if the word occurs as whole word, ignoring case."""
+        self.assertTrue(contains_whole_words("Rakastan eläimiä.", "eläimiä"))
+        self.assertTrue(contains_whole_words("Rakastan eläimiä.", "RAKASTAN"))
+        self.assertFalse(contains_whole_words("Menen eläintarhaan.", "eläin"))
+
+    def test_multiple_words(self):
+        """Test that a text contains multiple words if they occur as whole words."""
+        self.assertTrue(contains_whole_words("Ik heb het koud.", "het koud"))
+        self.assertFalse(contains_whole_words("Ik heb het koud.", "heb koud"))
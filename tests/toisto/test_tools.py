@@ -2,7 +2,7 @@
 
 import unittest
 
-from toisto.tools import first, first_upper, unique
+from toisto.tools import Identities, first, first_upper, unique
 
 
 class FirstTest(unittest.TestCase):
@@ -61,3 +61,23 @@ class UniqueTest(unittest.TestCase):
     def test_mix_of_elements(self):
         """Test a sequence with a mix of equal and unequal elements."""
         self.assertEqual([1, 2, 4, 3], list(unique([1, 2, 2, 4, 2, 3, 1])))
+
+
+class IdentitiesTest(unittest.TestCase):
+    """Unit tests for the identities class."""
+
+    def setUp(self) -> None:
+        """Override to set up test fixtures."""
+        self.identities = Identities[str]()
+
+    def test_dense_identities(self):
+        """Test that new keys get consecutive identities."""
+        self.assertEqual([0, 1, 2], [self.identities.identity(key) for key in ("a", "b", "c")])
+
+    def test_same_key_same_identity(self):
+        """Test that a key gets the same identity each time."""
+        self.assertEqual(self.identities.identity("a"), self.identities.identity("a"))
+
+    def test_key(self):
+        """Test that the key can be looked up by its identity."""
+        self.assertEqual("b", self.identities.key(self.identities.identity("b")))
@@ -18,8 +18,8 @@ from toisto.persistence.folder import home
 from toisto.ui.cli import create_argument_parser, parse_arguments, practiceable_concepts
 
 CONFIGURE_USAGE = """Usage: toisto configure [-h] [-t {language}] [-s {language}] [-e {path}] [-p {path}] \
-[-u {frequency}] [-r {yes,no}]
-                        [-m {mp3player}]"""
+[-b {json,sqlite,binary}]
+                        [-a {yes,no}] [-u {frequency}] [-r {yes,no}] [-m {mp3player}]"""
 PRACTICE_USAGE = """Usage: toisto practice [-h] -t {language} -s {language} [-e {path}] [-q {quiz type}] \
 [-u {frequency}] [-r {yes,no}]
                        [{concept} ...]"""
@@ -39,6 +39,19 @@ SOURCE_OPTION = """-s, --source {language}
 EXTRA_OPTION = "-e, --extra {path}    file or folder with extra concepts to read, can be repeated; default: %s"
 PROGRESS_FOLDER = f"""-p, --progress-folder {{path}}
                         folder where to save progress; default: {home()!s}"""
+PROGRESS_BACKEND = """-b, --progress-backend {json,sqlite,binary}
+                        how to save progress, in JSON files, in an SQLite database, or in binary files; default: json"""
+ANSWER_LOG_OPTION = """-a, --answer-log {yes,no}
+                        log each answer, so answers can be exported with `toisto progress --export`; default: no"""
+ORPHANS_OPTION = """-o, --orphans {show,remove,archive}
+                        instead of showing progress, show, remove, or archive the progress on quizzes that are no
+                        longer generated, for example because a concept was removed; can't be combined with concepts
+                        or quiz types"""
+EXPORT_OPTIONS = """-x, --export {answers,progress}
+                        instead of showing progress, write the logged answers or the progress of all quizzes to
+                        standard output; can't be combined with orphans
+  -f, --format {csv,jsonl}
+                        format of the export, CSV or JSON lines; default: csv"""
 PROGRESS_OPTION = """-u, --progress-update {frequency}
                         show a progress update after each {frequency} quizzes; default: %s (0 means never)"""
 RETENTION_OPTION = """-r, --show-quiz-retention {yes,no}
@@ -135,6 +148,8 @@ class ConfigureCommandTest(ParserTestCase):
             "command": "configure",
             "mp3player": "afplay",
             "progress_folder": home(),
+            "progress_backend": "json",
+            "answer_log": "no",
             "show_quiz_retention": "no",
         }
 
@@ -271,6 +286,8 @@ Options:
   {SOURCE_OPTION % ""}
   {EXTRA_OPTION % "none"}
   {PROGRESS_FOLDER}
+  {PROGRESS_BACKEND}
+  {ANSWER_LOG_OPTION}
   {PROGRESS_OPTION % "0"}
   {RETENTION_OPTION}
   {MP3PLAYER_OPTION}
@@ -299,6 +316,8 @@ Options:
   {SOURCE_OPTION % ""}
   {EXTRA_OPTION % "extra1.json, extra2.json"}
   {PROGRESS_FOLDER}
+  {PROGRESS_BACKEND}
+  {ANSWER_LOG_OPTION}
   {PROGRESS_OPTION % "0"}
   {RETENTION_OPTION}
   {MP3PLAYER_OPTION}
@@ -462,6 +481,26 @@ Options:
             sys_stderr_write.call_args_list[1][0][0],
         )
 
+    @patch("sys.argv", ["toisto", "progress", "--target", "fi", "--source", "nl", "--orphans", "show", "-q", "read"])
+    @patch("sys.stderr.write")
+    def test_orphans_with_quiz_types(self, sys_stderr_write: Mock) -> None:
+        """Test that an error message is displayed if orphans are combined with quiz types."""
+        self.assertRaises(SystemExit, parse_arguments, self.argument_parser())
+        self.assertIn(
+            "toisto: error: argument -o/--orphans: not allowed with concepts or quiz types\n",
+            sys_stderr_write.call_args_list[1][0][0],
+        )
+
+    @patch("sys.argv", ["toisto", "progress", "-t", "fi", "-s", "nl", "--orphans", "show", "--export", "answers"])
+    @patch("sys.stderr.write")
+    def test_orphans_with_export(self, sys_stderr_write: Mock) -> None:
+        """Test that an error message is displayed if orphans are combined with export."""
+        self.assertRaises(SystemExit, parse_arguments, self.argument_parser())
+        self.assertIn(
+            "toisto: error: argument -x/--export: not allowed with argument -o/--orphans\n",
+            sys_stderr_write.call_args_list[1][0][0],
+        )
+
     @patch("sys.argv", ["toisto", "practice", "--target", "fi", "--source", "nl", "foo"])
     @patch("sys.stderr.write")
     def test_invalid_concept(self, sys_stderr_write: Mock) -> None:
@@ -522,7 +561,9 @@ class ProgressCommandTest(ParserTestCase):
         self.assertRaises(SystemExit, parse_arguments, self.argument_parser())
         self.assert_output(
             f"""Usage: toisto progress [-h] -t {{language}} -s {{language}} [-e {{path}}] [-q {{quiz type}}] \
-[-S {{option}}] [{{concept}} ...]
+[-S {{option}}]
+                       [-o {{show,remove,archive}}] [-x {{answers,progress}}] [-f {{csv,jsonl}}]
+                       [{{concept}} ...]
 
 Show progress.
 
@@ -536,6 +577,8 @@ Options:
   {QUIZ_TYPE_OPTION}
   -S, --sort {{option}}   how to sort progress information; default: by retention; available options: attempts,
                         retention
+  {ORPHANS_OPTION}
+  {EXPORT_OPTIONS}
 """,
             sys_stdout_write,
         )
@@ -552,7 +595,9 @@ Options:
         self.assertRaises(SystemExit, parse_arguments, self.argument_parser(config_parser))
         self.assert_output(
             f"""Usage: toisto progress [-h] [-t {{language}}] [-s {{language}}] [-e {{path}}] [-q {{quiz type}}] \
-[-S {{option}}] [{{concept}} ...]
+[-S {{option}}]
+                       [-o {{show,remove,archive}}] [-x {{answers,progress}}] [-f {{csv,jsonl}}]
+                       [{{concept}} ...]
 
 Show progress.
 
@@ -566,6 +611,8 @@ Options:
   {QUIZ_TYPE_OPTION}
   -S, --sort {{option}}   how to sort progress information; default: by retention; available options: attempts,
                         retention
+  {ORPHANS_OPTION}
+  {EXPORT_OPTIONS}
 """,
             sys_stdout_write,
         )
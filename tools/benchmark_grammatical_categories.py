@@ -0,0 +1,135 @@
+"""Benchmark comparing the grammatical categories of labels of heavily inflected Finnish nouns and verbs.
+
+Creates synthetic Finnish verb concepts with 24 forms each (tense, polarity, number, and person) and noun concepts with
+four forms each (number and case), with Dutch translations, and measures creating the labels, comparing the grammatical
+categories of all pairs of labels of a concept, and generating the quizzes. Comparing the grammatical categories is
+measured twice: with the bitmasks the labels use, and with sets of grammatical categories as before the bitmasks.
+
+Usage, with the package installed: python tools/benchmark_grammatical_categories.py [number of concepts]
+"""
+
+import sys
+from collections.abc import Callable
+from itertools import permutations
+from time import perf_counter
+from typing import cast
+
+from toisto.model.language import FI, NL, LanguagePair
+from toisto.model.language.concept import Concept, ConceptId
+from toisto.model.language.concept_factory import create_concept
+from toisto.model.language.grammatical_category import (
+    DEFAULT_CATEGORIES,
+    SEMANTIC_NON_DEFAULT_CATEGORIES,
+    GrammaticalCategory,
+)
+from toisto.model.language.label import Label
+from toisto.model.language.label_factory import JSONGrammar, LabelJSON
+from toisto.model.quiz.quiz_factory import create_quizzes
+
+FI_NL = LanguagePair(FI, NL)
+NR_CONCEPTS = 200
+TENSES: tuple[GrammaticalCategory, ...] = ("present tense", "past tense")
+POLARITIES: tuple[GrammaticalCategory, ...] = ("affirmative", "negative")
+NUMBERS: tuple[GrammaticalCategory, ...] = ("singular", "plural")
+PERSONS: tuple[GrammaticalCategory, ...] = ("first person", "second person", "third person")
+CASES: tuple[GrammaticalCategory, ...] = ("nominative", "partitive")
+
+
+def verb_forms(stem: str) -> JSONGrammar:
+    """Return the forms of a synthetic verb, by tense, polarity, number, and person."""
+    return {
+        tense: {
+            polarity: {
+                number: {person: f"{stem} {tense} {polarity} {number} {person}" for person in PERSONS}
+                for number in NUMBERS
+            }
+            for polarity in POLARITIES
+        }
+        for tense in TENSES
+    }
+
+
+def noun_forms(stem: str) -> JSONGrammar:
+    """Return the forms of a synthetic noun, by number and case."""
+    return {number: {case: f"{stem} {number} {case}" for case in CASES} for number in NUMBERS}
+
+
+def create_concepts(nr_concepts: int) -> list[Concept]:
+    """Create the synthetic verb and noun concepts."""
+    concepts = []
+    for index in range(nr_concepts):
+        forms = verb_forms if index % 2 else noun_forms
+        labels = [
+            {"label": forms(f"fi{index}"), "language": FI},
+            {"label": forms(f"nl{index}"), "language": NL},
+        ]
+        concepts.append(create_concept(ConceptId(f"concept{index}"), {}, cast("list[LabelJSON]", labels)))
+    return concepts
+
+
+def compare_labels(concepts: list[Concept]) -> None:
+    """Compare the grammatical categories of all pairs of labels of each concept, using bitmasks."""
+    for concept in concepts:
+        for label1, label2 in permutations(concept.labels(FI) + concept.labels(NL), r=2):
+            label1.has_same_grammatical_form(label2)
+            label1.has_compatible_grammatical_categories(label2)
+            label1.grammatical_differences(label2)
+
+
+def compare_labels_with_sets(concepts: list[Concept]) -> None:
+    """Compare the grammatical categories of all pairs of labels of each concept, using sets."""
+    for concept in concepts:
+        for label1, label2 in permutations(concept.labels(FI) + concept.labels(NL), r=2):
+            has_same_grammatical_form(label1, label2)
+            has_compatible_grammatical_categories(label1, label2)
+            grammatical_differences(label1, label2)
+
+
+def has_same_grammatical_form(label: Label, other: Label) -> bool:
+    """Return whether the labels have the same grammatical form, comparing sets of grammatical categories."""
+    categories = label.grammatical_form.grammatical_categories - DEFAULT_CATEGORIES
+    other_categories = other.grammatical_form.grammatical_categories - DEFAULT_CATEGORIES
+    return (
+        categories == other_categories
+        or (not categories and other.is_grammatical_base)
+        or (not other_categories and label.is_grammatical_base)
+    )
+
+
+def has_compatible_grammatical_categories(label: Label, other: Label) -> bool:
+    """Return whether the grammatical categories of the labels are compatible, comparing sets."""
+    categories = label.grammatical_form.grammatical_categories
+    other_categories = other.grammatical_form.grammatical_categories
+    if (categories ^ other_categories) & SEMANTIC_NON_DEFAULT_CATEGORIES:
+        return False
+    return categories <= other_categories or categories >= other_categories
+
+
+def grammatical_differences(label: Label, *labels: Label) -> frozenset[GrammaticalCategory]:
+    """Return the grammatical differences between the label and the other labels, as set difference."""
+    differences: set[GrammaticalCategory] = set()
+    for other in labels:
+        differences |= label.grammatical_form.grammatical_categories - other.grammatical_form.grammatical_categories
+    return frozenset(differences)
+
+
+def measure(description: str, function: Callable[[], object]) -> None:
+    """Measure and report the duration of the function."""
+    start = perf_counter()
+    function()
+    duration = perf_counter() - start
+    sys.stdout.write(f"{description:<45} {duration:8.3f}s\n")
+
+
+def main(nr_concepts: int) -> None:
+    """Run the benchmark."""
+    sys.stdout.write(f"{nr_concepts} concepts, half verbs with 24 forms and half nouns with 4 forms per language\n")
+    measure("Creating the labels", lambda: create_concepts(nr_concepts))
+    concepts = create_concepts(nr_concepts)
+    measure("Comparing the grammatical categories", lambda: compare_labels(concepts))
+    measure("Comparing the grammatical categories as sets", lambda: compare_labels_with_sets(concepts))
+    measure("Generating the quizzes", lambda: create_quizzes(FI_NL, (), *concepts))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else NR_CONCEPTS)
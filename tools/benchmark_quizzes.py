@@ -0,0 +1,91 @@
+"""Benchmark building sets of quizzes and indexing them by concept and label.
+
+Compares the one-pass construction and indexing of the Quizzes class with the incremental approach of creating a new
+set of quizzes per added quiz or group of quizzes. The difference grows with the number of quizzes per concept.
+
+Usage, with the package installed: python tools/benchmark_quizzes.py [quizzes per concept]
+"""
+
+import sys
+from collections.abc import Callable, Iterable
+from time import perf_counter
+from typing import cast
+
+from toisto.model.language import FI, NL, LanguagePair
+from toisto.model.language.concept import Concept, ConceptId
+from toisto.model.language.concept_factory import create_concept
+from toisto.model.language.label import Label, Labels
+from toisto.model.quiz.quiz import Quiz, Quizzes
+from toisto.model.quiz.quiz_type import READ
+
+FI_NL = LanguagePair(FI, NL)
+NR_QUIZZES = 100_000
+QUIZZES_PER_CONCEPT = 100
+QUIZZES_PER_QUIZ_TYPE = 10
+
+
+def synthetic_quizzes(nr_quizzes: int, quizzes_per_concept: int) -> list[list[Quiz]]:
+    """Create synthetic quizzes, grouped per concept."""
+    quizzes_per_concept_list = []
+    for concept_index in range(nr_quizzes // quizzes_per_concept):
+        concept = create_concept(cast("ConceptId", f"concept{concept_index}"), {}, [])
+        answer = Labels([Label(NL, f"antwoord{concept_index}")])
+        quizzes_per_concept_list.append(
+            [
+                Quiz(FI_NL, concept, Label(FI, f"kysymys{concept_index}-{index}"), answer, READ, READ.action)
+                for index in range(quizzes_per_concept)
+            ]
+        )
+    return quizzes_per_concept_list
+
+
+def incremental_union(groups: Iterable[list[Quiz]]) -> Quizzes:
+    """Create the quizzes per concept by adding them in chunks, one chunk per quiz type, and then union the sets."""
+    concept_quizzes = []
+    for group in groups:
+        quizzes = Quizzes()
+        for index in range(0, len(group), QUIZZES_PER_QUIZ_TYPE):
+            quizzes = quizzes | Quizzes(group[index : index + QUIZZES_PER_QUIZ_TYPE])
+        concept_quizzes.append(quizzes)
+    return Quizzes(Quizzes().union(*concept_quizzes))
+
+
+def incremental_index(quizzes: Quizzes) -> tuple[dict[Concept, Quizzes], dict[Label, Quizzes]]:
+    """Index the quizzes by concept and by label by adding the quizzes one at a time to a set per key."""
+    by_concept: dict[Concept, Quizzes] = {}
+    by_label: dict[Label, Quizzes] = {}
+    for quiz in quizzes:
+        by_concept[quiz.concept] = by_concept.get(quiz.concept, Quizzes()) | Quizzes({quiz})
+        for label in {quiz.question, *quiz.answers}:
+            by_label[label] = by_label.get(label, Quizzes()) | Quizzes({quiz})
+    return by_concept, by_label
+
+
+def one_pass_index(quizzes: Quizzes) -> None:
+    """Index the quizzes by concept and by label using the one-pass indexes of the Quizzes class."""
+    first_quiz = next(iter(quizzes))
+    quizzes.by_concept(first_quiz.concept)
+    quizzes.by_label(first_quiz.question)
+
+
+def measure(description: str, function: Callable[[], object]) -> None:
+    """Measure and report the duration of the function."""
+    start = perf_counter()
+    function()
+    duration = perf_counter() - start
+    sys.stdout.write(f"{description:<40} {duration:8.3f}s\n")
+
+
+def main(quizzes_per_concept: int) -> None:
+    """Run the benchmark."""
+    groups = synthetic_quizzes(NR_QUIZZES, quizzes_per_concept)
+    Quizzes.from_iterables(*groups)  # Warm up the cached quiz keys so both approaches hash the quizzes equally fast
+    sys.stdout.write(f"{NR_QUIZZES} quizzes, {quizzes_per_concept} per concept\n")
+    measure("Construction, incremental union", lambda: incremental_union(groups))
+    measure("Construction, one pass", lambda: Quizzes.from_iterables(*groups))
+    measure("Indexing, incremental union", lambda: incremental_index(Quizzes.from_iterables(*groups)))
+    measure("Indexing, one pass", lambda: one_pass_index(Quizzes.from_iterables(*groups)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else QUIZZES_PER_CONCEPT)
@@ -0,0 +1,153 @@
+"""Simulate practicing with Toisto for a long period, using a virtual clock and a synthetic learner.
+
+The learner practices the built-in concepts a number of quizzes per day and answers each quiz correctly with a fixed
+probability. Time only passes in the simulation: each answer takes a fixed number of seconds and each day starts at
+the same hour. The random generator is seeded, so simulations with the same arguments have the same outcome.
+
+Once per reporting period, the simulation reports the latency percentiles of picking the next quiz, the number of
+quizzes in progress that are due or silenced, the distribution of the retention lengths, and optionally the memory
+in use.
+
+Usage, with the package installed: python tools/simulate_scheduler.py [options], see --help for the options
+"""
+
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from datetime import UTC, datetime, timedelta
+from random import Random
+from statistics import quantiles
+from time import perf_counter
+
+from toisto.metadata import BUILT_IN_CONCEPT_JSON_FILES
+from toisto.model.language import Language, LanguagePair
+from toisto.model.quiz import retention
+from toisto.model.quiz.evaluation import Evaluation
+from toisto.model.quiz.progress import Progress
+from toisto.model.quiz.quiz import Quizzes
+from toisto.model.quiz.quiz_factory import QuizFactory, create_quizzes
+from toisto.model.quiz.quiz_source import LazyQuizSource, QuizSource
+from toisto.model.quiz.retention import Retention
+from toisto.persistence.concept_loader import ConceptLoader
+from toisto.persistence.spelling_alternatives import load_generated_spelling_alternatives, load_spelling_alternatives
+
+START = datetime(2026, 1, 1, 8, tzinfo=UTC)  # The first simulated practice session starts at 8 AM
+RETENTION_BUCKETS = (  # Upper bounds of the retention length buckets, and their labels
+    (timedelta(), "none"),
+    (timedelta(days=1), "<1d"),
+    (timedelta(weeks=1), "<1w"),
+    (timedelta(days=30), "<1m"),
+    (timedelta(days=365), "<1y"),
+    (timedelta.max, ">=1y"),
+)
+
+
+class VirtualClock:
+    """Clock that only advances when told to."""
+
+    def __init__(self, start: datetime) -> None:
+        self.current = start
+
+    def now(self) -> datetime:
+        """Return the current datetime of the clock."""
+        return self.current
+
+    def advance(self, delta: timedelta) -> None:
+        """Advance the clock."""
+        self.current += delta
+
+
+class Learner:
+    """Synthetic learner that answers quizzes correctly with a fixed probability."""
+
+    def __init__(self, probability_correct: float, seed: int) -> None:
+        self.probability_correct = probability_correct
+        self.random = Random(seed)  # noqa: S311
+
+    def answer(self) -> Evaluation:
+        """Return the evaluation of the learner's answer."""
+        return Evaluation.CORRECT if self.random.random() < self.probability_correct else Evaluation.INCORRECT
+
+
+def parse_arguments() -> Namespace:
+    """Parse the command line arguments."""
+    parser = ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--target", default="fi", help="target language; default: %(default)s")
+    parser.add_argument("--source", default="en", help="source language; default: %(default)s")
+    parser.add_argument("--days", type=int, default=365, help="number of days to simulate; default: %(default)s")
+    parser.add_argument("--quizzes-per-day", type=int, default=50, help="default: %(default)s")
+    parser.add_argument("--seconds-per-quiz", type=int, default=20, help="default: %(default)s")
+    parser.add_argument("--correct", type=float, default=0.8, help="chance of a correct answer; default: %(default)s")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random generator; default: %(default)s")
+    parser.add_argument("--report-every", type=int, default=30, help="days per reporting period; default: %(default)s")
+    parser.add_argument("--eager", action="store_true", help="create all quizzes up front instead of when needed")
+    parser.add_argument("--memory", action="store_true", help="trace the memory in use; slows the simulation down")
+    return parser.parse_args()
+
+
+def create_progress(language_pair: LanguagePair, *, eager: bool) -> Progress:
+    """Create the progress of a new learner of the built-in concepts."""
+    concepts = ConceptLoader(ArgumentParser()).load_concepts(*BUILT_IN_CONCEPT_JSON_FILES)
+    load_spelling_alternatives(language_pair)
+    load_generated_spelling_alternatives(language_pair, *BUILT_IN_CONCEPT_JSON_FILES)
+    quizzes: Quizzes | QuizSource = (
+        create_quizzes(language_pair, (), *concepts)
+        if eager
+        else LazyQuizSource(language_pair, concepts, QuizFactory(language_pair, ()).concept_quizzes)
+    )
+    return Progress(language_pair.target, quizzes, {})
+
+
+def report_header(*, memory: bool) -> None:
+    """Report the column headers."""
+    columns = ["day", "answers", "p50 ms", "p90 ms", "p99 ms", "max ms", "progress", "due", "silenced"]
+    columns.extend(label for _, label in RETENTION_BUCKETS)
+    if memory:
+        columns.extend(["MB", "peak MB"])
+    sys.stdout.write(" ".join(f"{column:>8}" for column in columns) + "\n")
+
+
+def report(day: int, latencies: list[float], progress: Progress, *, memory: bool) -> None:
+    """Report the scheduler latency, the due and silenced quizzes, and the retention distribution."""
+    percentiles = quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    milliseconds = [1000 * latency for latency in (percentiles[49], percentiles[89], percentiles[98], max(latencies))]
+    retentions = [Retention.from_dict(retention_dict) for retention_dict in progress.as_dict().values()]
+    silenced = sum(quiz_retention.is_silenced() for quiz_retention in retentions)
+    buckets = dict.fromkeys([label for _, label in RETENTION_BUCKETS], 0)
+    for quiz_retention in retentions:
+        buckets[next(label for bound, label in RETENTION_BUCKETS if quiz_retention.length <= bound)] += 1
+    values = [f"{day:8d}", f"{len(latencies):8d}", *(f"{value:8.2f}" for value in milliseconds)]
+    values.extend(f"{value:8d}" for value in (len(retentions), len(retentions) - silenced, silenced))
+    values.extend(f"{value:8d}" for value in buckets.values())
+    if memory:
+        values.extend(f"{value / 1_000_000:8.1f}" for value in tracemalloc.get_traced_memory())
+    sys.stdout.write(" ".join(values) + "\n")
+
+
+def simulate(args: Namespace) -> None:
+    """Run the simulation."""
+    clock = VirtualClock(START)
+    retention.clock = clock.now
+    if args.memory:
+        tracemalloc.start()
+    progress = create_progress(LanguagePair(Language(args.target), Language(args.source)), eager=args.eager)
+    learner = Learner(args.correct, args.seed)
+    report_header(memory=args.memory)
+    latencies: list[float] = []
+    for day in range(1, args.days + 1):
+        for _ in range(args.quizzes_per_day):
+            start = perf_counter()
+            quiz = progress.next_quiz()
+            latencies.append(perf_counter() - start)
+            if quiz is None:
+                break
+            progress.mark_evaluation(quiz, learner.answer())
+            clock.advance(timedelta(seconds=args.seconds_per_quiz))
+        clock.current = START + timedelta(days=day)
+        if day % args.report_every == 0 or day == args.days:
+            report(day, latencies, progress, memory=args.memory)
+            latencies.clear()
+
+
+if __name__ == "__main__":
+    simulate(parse_arguments())